@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmark Suite
+
+Times each stage of a collection run separately at several corpus sizes and
+compares the results against a committed baseline:
+
+- fetch: fetch_and_parse_feeds over RSS fixtures served by an in-process
+  transport adapter (no network), starting from an empty feed cache. The
+  fixtures are rendered from the synthetic corpus rather than recorded
+  responses, so every size is reproducible from --seed alone
+- normalize: normalize_entries (Entry records with parsed dates and plain text)
+- filter: filter_entries
+- deduplicate: deduplicate_entries
+- score: calculate_score for every entry
+- rank: sort by score and take the top max_results
+- render: generate_markdown_output into a temporary directory
+- ungm_parse: parse_ungm_notice_entry over large UNGM notice pages, either
+  synthetic (one per 100 entries) or saved pages passed with --ungm-pages
+
+Each stage reports the best wall time of --repeat runs, throughput
+(input entries per second) and peak traced memory from a separate
+tracemalloc run. Corpora come from synthetic_corpus.generate_entries.
+
+Usage:
+    python scripts/benchmark_pipeline.py                      # compare with benchmarks/baseline.json
+    python scripts/benchmark_pipeline.py --sizes 1000 10000 --check
+    python scripts/benchmark_pipeline.py --update-baseline
+    python scripts/benchmark_pipeline.py --stages filter score --update-baseline   # refresh two stages
+    python scripts/benchmark_pipeline.py --stages ungm_parse --ungm-pages saved_notices/
+"""
+
+import argparse
+import copy
+import glob
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from collect_rfps import (
+    calculate_score,
+    configure_http_client,
+    deduplicate_entries,
+    fetch_and_parse_feeds,
+    filter_entries,
+    generate_markdown_output,
+    load_config,
+    normalize_entries,
+    parse_ungm_notice_entry,
+    UNGM_NOTICE_ROOT,
+)
+from mock_feed_server import render_ungm_notice
+from synthetic_corpus import generate_entries, render_rss_document, split_into_feeds
+
+
+BASELINE_PATH = "benchmarks/baseline.json"
+DEFAULT_SIZES = [1000, 5000, 20000]
+ENTRIES_PER_FEED = 500
+STAGES = ["fetch", "normalize", "filter", "deduplicate", "score", "rank", "render", "ungm_parse"]
+ENTRIES_PER_UNGM_PAGE = 100
+UNGM_PAGE_BYTES = 250_000
+
+
+class FixtureAdapter(BaseAdapter):
+    """Transport adapter answering requests from in-memory response bodies."""
+
+    def __init__(self, fixtures: Dict[str, bytes]):
+        super().__init__()
+        self.fixtures = fixtures
+
+    def send(self, request, **kwargs) -> requests.Response:
+        body = self.fixtures.get(request.url)
+        response = requests.Response()
+        response.status_code = 200 if body is not None else 404
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/rss+xml"})
+        response._content = body or b""
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.encoding = "utf-8"
+        return response
+
+    def close(self):
+        pass
+
+
+def build_fixtures(entries: List[Dict[str, Any]]) -> Dict[str, bytes]:
+    """Render a corpus as RSS documents keyed by fixture feed URL."""
+    feed_count = max(1, -(-len(entries) // ENTRIES_PER_FEED))
+    return {
+        f"https://fixtures.invalid/feeds/{index}.rss": render_rss_document(feed_entries, f"Fixture {index}").encode("utf-8")
+        for index, feed_entries in enumerate(split_into_feeds(entries, feed_count))
+    }
+
+
+def build_ungm_pages(count: int, page_bytes: int = UNGM_PAGE_BYTES) -> List[str]:
+    """
+    Render large UNGM notice pages shaped like the live site.
+
+    The notice fields sit after a navigation block, and most of the page is a
+    trailing documents table, as on real notice pages.
+    """
+    navigation = "".join(
+        f'<div class="nav-item"><a href="/Public/Page/{index}">Menu &amp; item {index}</a></div>'
+        for index in range(page_bytes // 10 // 70)
+    )
+    documents = "".join(
+        f'<tr><td><span class="document">Annex {index}.pdf</span></td>'
+        f'<td><a href="/Public/Document/{index}">Download</a></td></tr>'
+        for index in range(page_bytes * 9 // 10 // 100)
+    )
+    published = datetime.now(timezone.utc)
+    pages = []
+    for notice_id in range(1, count + 1):
+        notice = render_ungm_notice(notice_id, published, payload_bytes=200)
+        notice = notice.replace("<body>", f"<body>{navigation}", 1)
+        pages.append(notice.replace("</body>", f"<table>{documents}</table></body>", 1))
+    return pages
+
+
+def load_ungm_pages(directory: str) -> List[str]:
+    """Load saved UNGM notice pages (*.html) from a directory."""
+    pages = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.html"))):
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            pages.append(f.read())
+    return pages
+
+
+def build_stages(
+    entries: List[Dict[str, Any]],
+    fixtures: Dict[str, bytes],
+    config: Dict[str, Any],
+    output_dir: str,
+    ungm_pages: Optional[List[str]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Build each stage as a (prepare, run) pair.
+
+    prepare() returns fresh input outside the timed region, since filtering
+    and scoring annotate entries in place; run(input) is timed.
+    """
+    fetch_config = dict(config, fetch_concurrency=4, feed_prioritization=False, adaptive_polling=False)
+    normalized = normalize_entries(entries)
+    filtered = filter_entries(copy.deepcopy(normalized), config, diagnostics={})
+    deduplicated = deduplicate_entries(filtered)
+    scored = copy.deepcopy(deduplicated)
+    for entry in scored:
+        entry['score'] = calculate_score(entry, config)
+    max_results = config.get('max_results', 20)
+    top_entries = sorted(scored, key=lambda x: x['score'], reverse=True)[:max_results]
+    metrics = {'fetched': len(entries), 'filtered': len(filtered), 'deduplicated': len(deduplicated), 'selected': len(top_entries)}
+    output_path = os.path.join(output_dir, "index.md")
+    if ungm_pages is None:
+        ungm_pages = build_ungm_pages(max(1, len(entries) // ENTRIES_PER_UNGM_PAGE))
+
+    def run_fetch(_):
+        client = configure_http_client(config)
+        adapter = FixtureAdapter(fixtures)
+        client.session.mount("https://", adapter)
+        client.session.mount("http://", adapter)
+        return fetch_and_parse_feeds(list(fixtures), fetch_config, feed_cache={}, diagnostics={})
+
+    def run_score(batch):
+        for entry in batch:
+            entry['score'] = calculate_score(entry, config)
+
+    def run_rank(batch):
+        return sorted(batch, key=lambda x: x['score'], reverse=True)[:max_results]
+
+    def run_render(_):
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        generate_markdown_output(top_entries, metrics, output_path=output_path)
+
+    def run_ungm_parse(_):
+        return [
+            parse_ungm_notice_entry(f"{UNGM_NOTICE_ROOT}/{index}", page, UNGM_NOTICE_ROOT)
+            for index, page in enumerate(ungm_pages)
+        ]
+
+    return {
+        "fetch": {"input": len(entries), "prepare": lambda: None, "run": run_fetch},
+        "normalize": {"input": len(entries), "prepare": lambda: entries, "run": normalize_entries},
+        "filter": {
+            "input": len(entries),
+            "prepare": lambda: copy.deepcopy(normalized),
+            "run": lambda batch: filter_entries(batch, config, diagnostics={}),
+        },
+        "deduplicate": {"input": len(filtered), "prepare": lambda: list(filtered), "run": deduplicate_entries},
+        "score": {"input": len(deduplicated), "prepare": lambda: copy.deepcopy(deduplicated), "run": run_score},
+        "rank": {"input": len(scored), "prepare": lambda: list(scored), "run": run_rank},
+        "render": {"input": len(top_entries), "prepare": lambda: None, "run": run_render},
+        "ungm_parse": {"input": len(ungm_pages), "prepare": lambda: None, "run": run_ungm_parse},
+    }
+
+
+def measure_stage(prepare: Callable[[], Any], run: Callable[[Any], Any], repeat: int) -> Dict[str, float]:
+    """Return the best wall time of `repeat` runs and the peak traced memory of one more."""
+    timings = []
+    for _ in range(max(1, repeat)):
+        batch = prepare()
+        started = time.perf_counter()
+        run(batch)
+        timings.append(time.perf_counter() - started)
+
+    batch = prepare()
+    tracemalloc.start()
+    try:
+        run(batch)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": min(timings), "peak_kib": peak / 1024}
+
+
+def run_benchmarks(
+    sizes: List[int],
+    config: Dict[str, Any],
+    repeat: int = 3,
+    seed: int = 0,
+    stages: Optional[List[str]] = None,
+    ungm_pages: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Run the stage benchmarks for each corpus size.
+
+    Saved ungm_pages, when given, replace the synthetic notice pages at
+    every size.
+
+    Returns:
+        Dictionary with 'environment' and per-size, per-stage results
+    """
+    stages = stages or STAGES
+    results: Dict[str, Any] = {
+        "environment": {"python": platform.python_version(), "machine": platform.machine()},
+        "sizes": {},
+    }
+    stdout = sys.stdout
+    with tempfile.TemporaryDirectory() as output_dir:
+        for size in sizes:
+            entries = generate_entries(size, config, seed=seed, duplicate_rate=0.1)
+            fixtures = build_fixtures(entries)
+            size_results = {}
+            for name, stage in build_stages(entries, fixtures, config, output_dir, ungm_pages).items():
+                if name not in stages:
+                    continue
+                # Silence the collector's progress output while timing.
+                sys.stdout = open(os.devnull, "w")
+                try:
+                    measured = measure_stage(stage["prepare"], stage["run"], repeat)
+                finally:
+                    sys.stdout.close()
+                    sys.stdout = stdout
+                measured["entries"] = stage["input"]
+                measured["entries_per_second"] = stage["input"] / measured["seconds"] if measured["seconds"] else 0.0
+                size_results[name] = measured
+            results["sizes"][str(size)] = size_results
+    return results
+
+
+def compare_with_baseline(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float,
+) -> List[str]:
+    """
+    Compare stage timings with a baseline.
+
+    Returns:
+        Regression messages for stages slower than baseline by more than tolerance
+    """
+    regressions = []
+    for size, size_results in results.get("sizes", {}).items():
+        for stage, measured in size_results.items():
+            reference = baseline.get("sizes", {}).get(size, {}).get(stage)
+            if not reference or not reference.get("seconds"):
+                continue
+            ratio = measured["seconds"] / reference["seconds"]
+            if ratio > 1 + tolerance:
+                regressions.append(
+                    f"{stage} @ {size}: {measured['seconds'] * 1000:.1f} ms vs baseline "
+                    f"{reference['seconds'] * 1000:.1f} ms ({ratio:.2f}x)"
+                )
+    return regressions
+
+
+def format_results(results: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> str:
+    """Format results as a plain-text table, with baseline ratios when available."""
+    lines = [f"{'size':>8} {'stage':<12} {'ms':>10} {'entries/s':>12} {'peak KiB':>10} {'vs base':>8}"]
+    for size, size_results in results["sizes"].items():
+        for stage, measured in size_results.items():
+            reference = ((baseline or {}).get("sizes", {}).get(size, {}).get(stage) or {}).get("seconds")
+            ratio = f"{measured['seconds'] / reference:.2f}x" if reference else "-"
+            lines.append(
+                f"{size:>8} {stage:<12} {measured['seconds'] * 1000:>10.2f} "
+                f"{measured['entries_per_second']:>12.0f} {measured['peak_kib']:>10.0f} {ratio:>8}"
+            )
+    return "\n".join(lines)
+
+
+def load_baseline(path: str = BASELINE_PATH) -> Dict[str, Any]:
+    """Load the committed baseline, or an empty one if it does not exist."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def merge_baseline(baseline: Dict[str, Any], results: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Overlay measured stages on a baseline.
+
+    Stages and sizes that were not run keep their stored timings, so a
+    change to one stage can refresh just that stage (--stages ... --update-baseline).
+    """
+    merged = copy.deepcopy(baseline) if baseline else {}
+    merged["environment"] = results["environment"]
+    sizes = merged.setdefault("sizes", {})
+    for size, size_results in results["sizes"].items():
+        sizes.setdefault(size, {}).update(size_results)
+    return merged
+
+
+def save_baseline(results: Dict[str, Any], path: str = BASELINE_PATH):
+    """Write results as the new baseline."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark the collector pipeline stage by stage.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=STAGES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--config", default="config.yml")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown before a stage counts as regressed")
+    parser.add_argument("--check", action="store_true", help="Exit non-zero when a stage regressed")
+    parser.add_argument("--update-baseline", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--json", help="Also write the results to this file")
+    parser.add_argument("--ungm-pages", help="Directory of saved UNGM notice pages (*.html) for the ungm_parse stage")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmarks, print the table and compare with the baseline."""
+    args = parse_args(argv)
+    config = load_config(args.config)
+    ungm_pages = load_ungm_pages(args.ungm_pages) if args.ungm_pages else None
+    results = run_benchmarks(
+        args.sizes,
+        config,
+        repeat=args.repeat,
+        seed=args.seed,
+        stages=args.stages,
+        ungm_pages=ungm_pages,
+    )
+    baseline = load_baseline(args.baseline)
+    print(format_results(results, baseline))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.update_baseline:
+        save_baseline(merge_baseline(baseline, results), args.baseline)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    regressions = compare_with_baseline(results, baseline, args.tolerance)
+    for message in regressions:
+        print(f"REGRESSION: {message}")
+    if not baseline:
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one")
+    return 1 if regressions and args.check else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,21 +15,39 @@ Pipeline flow:
 7. Output to docs/index.md
 """
 
+import argparse
+import asyncio
+import base64
+import copy
 import feedparser
+import functools
+import gzip
 import hashlib
 import html
 import json
 import os
 import re
+import signal
 import sys
+import threading
+import time
+import xml.etree.ElementTree as ElementTree
 import yaml
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Set
+from collections import ChainMap
+from collections.abc import Mapping, MutableMapping
+from typing import Dict, Iterator, List, Optional, Any, Set, Tuple, Union
 from urllib.parse import urlparse
 import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
 from email.utils import parsedate_to_datetime
 
+# Make the repository's src package importable when run as a script
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from src.scoring.term_scanner import TermHits, TermScanner  # noqa: E402
+
 
 FEATURES = [
     "🔍 **Automated Collection**: Fetches RFPs from multiple RSS feeds",
@@ -87,6 +105,40 @@ COUNTRY_TO_REGION_GROUP = {
 
 
 UNGM_NOTICE_ROOT = "https://www.ungm.org/Public/Notice"
+# UNGM search dates use English month abbreviations whatever the locale
+UNGM_SEARCH_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+FEED_CACHE_PATH = "data/feed_cache.json"
+
+
+LAST_MODIFIED_CACHE_PATH = "data/last_modified_cache.json"
+
+
+UNGM_NOTICE_CACHE_PATH = "data/ungm_notice_cache.json"
+FEED_HEALTH_PATH = "data/feed_health.json"
+
+
+DEFAULT_HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0",
+}
+
+
+HTTP_ARCHIVE_VERSION = 1
+
+
+_frozen_now: Optional[datetime] = None
+
+
+def utc_now() -> datetime:
+    """Return the current UTC time, or the frozen clock set for a replay."""
+    return _frozen_now or datetime.now(timezone.utc)
+
+
+def freeze_clock(moment: Optional[datetime]):
+    """Pin utc_now() to `moment` (None restores the real clock)."""
+    global _frozen_now
+    _frozen_now = moment
 
 
 def extract_region_labels(regions: Any) -> List[str]:
@@ -164,32 +216,65 @@ def get_configured_region_groups(regions: List[Any]) -> Set[str]:
     return configured_groups
 
 
-def get_matched_region_groups(text: str, configured_regions: List[Any]) -> Set[str]:
-    """Find semantic region-group matches from text for configured regions."""
-    if not text or not configured_regions:
-        return set()
+class ConfigTermScanner(TermScanner):
+    """
+    TermScanner over a config's keywords, region/country terms and region labels.
 
-    configured_groups = get_configured_region_groups(configured_regions)
-    if not configured_groups:
-        return set()
+    Targets are ('keyword', lowercased keyword) as substrings,
+    ('region', group code) for the word-bounded terms and countries of every
+    configured group, and ('label', configured label) as substrings for the
+    filter's label fallback.
+    """
 
-    text_lower = text.lower()
-    matched_groups = set()
+    def __init__(self, keywords: Tuple[str, ...], region_labels: Tuple[str, ...]):
+        self.keywords = [str(keyword).lower() for keyword in keywords]
+        self.region_groups = get_configured_region_groups(list(region_labels))
+        targets: Dict[str, List[Tuple[str, str, bool]]] = {}
+
+        def add_target(pattern: str, kind: str, name: str, word_bounded: bool):
+            target = (kind, name, word_bounded)
+            if pattern and target not in targets.setdefault(pattern, []):
+                targets[pattern].append(target)
+
+        for keyword in self.keywords:
+            add_target(keyword, 'keyword', keyword, False)
+        for group in sorted(self.region_groups):
+            for term in REGION_GROUP_TERMS.get(group, []):
+                add_target(term.lower(), 'region', group, True)
+        for country, group in COUNTRY_TO_REGION_GROUP.items():
+            if group in self.region_groups:
+                add_target(country.lower(), 'region', group, True)
+        for label in region_labels:
+            add_target(label.lower(), 'label', label, False)
+        super().__init__(targets)
+
+    def keyword_score(self, hits: TermHits) -> float:
+        """Share of configured keywords found (an empty keyword always matches)."""
+        if not self.keywords:
+            return 0.0
+        matches = sum(1 for keyword in self.keywords if not keyword or ('keyword', keyword) in hits.positions)
+        return matches / len(self.keywords)
 
-    for group in configured_groups:
-        terms = REGION_GROUP_TERMS.get(group, [])
-        for term in terms:
-            if re.search(rf"\b{re.escape(term.lower())}\b", text_lower):
-                matched_groups.add(group)
-                break
 
-    for country, group in COUNTRY_TO_REGION_GROUP.items():
-        if group not in configured_groups:
-            continue
-        if re.search(rf"\b{re.escape(country)}\b", text_lower):
-            matched_groups.add(group)
+@functools.lru_cache(maxsize=32)
+def build_term_scanner(keywords: Tuple[str, ...], region_labels: Tuple[str, ...]) -> ConfigTermScanner:
+    """Compile and cache the term scanner for keywords and region labels."""
+    return ConfigTermScanner(keywords, region_labels)
+
+
+def get_term_scanner(config: Dict[str, Any]) -> ConfigTermScanner:
+    """Return the term scanner for a config's keywords and regions, built once per config."""
+    return build_term_scanner(
+        tuple(config.get('keywords') or []),
+        tuple(extract_region_labels(config.get('regions', []))),
+    )
+
 
-    return matched_groups
+def get_matched_region_groups(text: str, configured_regions: List[Any]) -> Set[str]:
+    """Find semantic region-group matches from text for configured regions."""
+    if not text or not configured_regions:
+        return set()
+    return get_term_scanner({'regions': configured_regions}).scan(text).names('region')
 
 
 def load_config(config_path: str = "config.yml") -> Dict[str, Any]:
@@ -270,19 +355,292 @@ def load_feeds(feeds_path: str = "feeds.txt") -> List[str]:
     return feeds
 
 
-def validate_link(url: str, timeout: int = 5) -> bool:
+class DeadlineExceeded(requests.Timeout):
+    """Raised instead of sending a request once the run deadline has passed."""
+
+
+class HttpClient:
+    """Shared keep-alive HTTP session used by every collector network call.
+
+    One requests.Session is mounted with a pooled adapter, so repeated
+    requests to the same host (UNGM notice pages in particular) reuse an
+    open TCP/TLS connection instead of handshaking every time. While a
+    deadline is set (a time.monotonic() value), request timeouts are
+    clamped to the time remaining, so in-flight work unwinds at the
+    deadline and nothing new is sent after it. With an HTTP archive the
+    adapter records every response ('record') or serves them from the
+    archive instead of the network ('replay').
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 20,
+        pool_maxsize: int = 10,
+        timeout: float = 20,
+        probe_timeout: float = 5,
+        headers: Optional[Dict[str, str]] = None,
+        archive: Optional[Dict[str, Any]] = None,
+        archive_mode: Optional[str] = None,
+    ):
+        self.timeout = timeout
+        self.probe_timeout = probe_timeout
+        self.deadline: Optional[float] = None
+        if archive_mode == 'record':
+            self.adapter = RecordingAdapter(archive, pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        else:
+            self.adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        transport = ReplayAdapter(archive) if archive_mode == 'replay' else self.adapter
+        self.session = requests.Session()
+        self.session.mount('http://', transport)
+        self.session.mount('https://', transport)
+        self.session.headers.update(DEFAULT_HTTP_HEADERS)
+        self.session.headers.update(headers or {})
+
+    def request(self, method: str, url: str, timeout: Optional[float] = None, **kwargs) -> requests.Response:
+        """Send a request, applying the probe timeout to HEAD and the default timeout otherwise."""
+        if timeout is None:
+            timeout = self.probe_timeout if method.upper() == 'HEAD' else self.timeout
+        if self.deadline is not None:
+            remaining = self.deadline - time.monotonic()
+            if remaining <= 0:
+                raise DeadlineExceeded(f"Run deadline passed before {method} {url}")
+            timeout = min(timeout, remaining)
+        return self.session.request(method, url, timeout=timeout, **kwargs)
+
+    def set_deadline(self, deadline: Optional[float]):
+        """Clamp request timeouts to a time.monotonic() deadline (None clears it)."""
+        self.deadline = deadline
+
+    def head(self, url: str, **kwargs) -> requests.Response:
+        return self.request('HEAD', url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    def connection_stats(self) -> Dict[str, int]:
+        """Return request counts split into new and reused connections."""
+        requests_sent = 0
+        new_connections = 0
+        pools = self.adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            requests_sent += pool.num_requests
+            new_connections += pool.num_connections
+        return {
+            'requests': requests_sent,
+            'new_connections': new_connections,
+            'reused_connections': max(requests_sent - new_connections, 0),
+        }
+
+    def close(self):
+        self.session.close()
+
+
+def get_http_archive_key(request: requests.PreparedRequest) -> str:
+    """Key a request by method, URL and a digest of its body (UNGM search pages differ only by body)."""
+    body = request.body or b''
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    digest = hashlib.sha256(body).hexdigest()[:16] if body else '-'
+    return f"{request.method} {request.url} {digest}"
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Pooled adapter that appends every response, or transport error, to an HTTP archive."""
+
+    def __init__(self, archive: Dict[str, Any], **kwargs):
+        super().__init__(**kwargs)
+        self.archive = archive
+        self.lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        key = get_http_archive_key(request)
+        try:
+            response = super().send(request, **kwargs)
+            # Read streamed bodies now so they can be archived; iter_content
+            # then serves the buffered content.
+            content = response.content if request.method != 'HEAD' else b''
+        except requests.RequestException as exc:
+            self.record(key, {'error': type(exc).__name__, 'message': str(exc)})
+            raise
+        self.record(key, {
+            'status': response.status_code,
+            'url': response.url,
+            'headers': dict(response.headers),
+            'body': base64.b64encode(content).decode('ascii'),
+        })
+        return response
+
+    def record(self, key: str, record: Dict[str, Any]):
+        with self.lock:
+            self.archive['responses'].setdefault(key, []).append(record)
+
+
+class ReplayAdapter(BaseAdapter):
+    """Transport adapter serving recorded responses instead of the network.
+
+    Responses recorded for the same request are served in recording order,
+    repeating the last one. Requests missing from the archive fail with a
+    ConnectionError, as they would offline.
+    """
+
+    def __init__(self, archive: Dict[str, Any]):
+        super().__init__()
+        self.archive = archive
+        self.positions: Dict[str, int] = {}
+        self.lock = threading.Lock()
+
+    def send(self, request, **kwargs) -> requests.Response:
+        key = get_http_archive_key(request)
+        with self.lock:
+            records = self.archive['responses'].get(key)
+            if not records:
+                raise requests.ConnectionError(f"No archived response for {key}", request=request)
+            position = self.positions.get(key, 0)
+            self.positions[key] = position + 1
+            record = records[min(position, len(records) - 1)]
+
+        if 'error' in record:
+            error_type = getattr(requests.exceptions, record['error'], requests.ConnectionError)
+            if not (isinstance(error_type, type) and issubclass(error_type, requests.RequestException)):
+                error_type = requests.ConnectionError
+            raise error_type(record.get('message', ''), request=request)
+
+        response = requests.Response()
+        response.status_code = record['status']
+        response.headers = requests.structures.CaseInsensitiveDict(record.get('headers') or {})
+        response._content = base64.b64decode(record.get('body') or '')
+        response._content_consumed = True
+        response.url = record.get('url') or request.url
+        response.request = request
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
+    def close(self):
+        pass
+
+
+def new_http_archive() -> Dict[str, Any]:
+    """Return an empty HTTP archive stamped with the recording time."""
+    return {'version': HTTP_ARCHIVE_VERSION, 'recorded_at': utc_now().isoformat(), 'responses': {}}
+
+
+def load_http_archive(archive_path: str) -> Dict[str, Any]:
+    """
+    Load a gzip-compressed HTTP archive written by --record.
+
+    Args:
+        archive_path: Path to the archive
+
+    Returns:
+        Archive dictionary with 'recorded_at' and 'responses'
+    """
+    with gzip.open(archive_path, 'rt', encoding='utf-8') as f:
+        archive = json.load(f)
+    if archive.get('version') != HTTP_ARCHIVE_VERSION:
+        raise ValueError(f"Unsupported HTTP archive version in {archive_path}: {archive.get('version')}")
+    return archive
+
+
+def save_http_archive(archive: Dict[str, Any], archive_path: str):
+    """
+    Save an HTTP archive as gzip-compressed JSON.
+
+    Args:
+        archive: Archive dictionary
+        archive_path: Path to the archive
+    """
+    directory = os.path.dirname(archive_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with gzip.open(archive_path, 'wt', encoding='utf-8') as f:
+        json.dump(archive, f)
+
+
+_http_archive: Optional[Dict[str, Any]] = None
+_http_archive_mode: Optional[str] = None
+
+
+def configure_http_archive(archive: Optional[Dict[str, Any]], mode: Optional[str]):
+    """
+    Record to or replay from `archive` in every HTTP client built afterwards.
+
+    utc_now() is frozen at the archive's recording time in both modes, so a
+    replay sees the same age windows, recency scores and rendered
+    timestamps as the recorded run. Passing None clears the archive and
+    restores the real clock.
+
+    Args:
+        archive: Archive dictionary, or None
+        mode: 'record', 'replay' or None
+    """
+    global _http_archive, _http_archive_mode
+    _http_archive, _http_archive_mode = (archive, mode) if archive is not None else (None, None)
+    if archive is not None:
+        freeze_clock(datetime.fromisoformat(archive['recorded_at']))
+    else:
+        freeze_clock(None)
+
+
+_http_client: Optional[HttpClient] = None
+_http_client_lock = threading.Lock()
+
+
+def configure_http_client(config: Optional[Dict[str, Any]] = None) -> HttpClient:
+    """
+    Build the shared HTTP client from configuration and make it current.
+
+    Args:
+        config: Optional configuration dictionary
+
+    Returns:
+        The newly configured HttpClient
+    """
+    global _http_client
+    config = config or {}
+    client = HttpClient(
+        pool_connections=int(config.get('http_pool_connections', 20) or 20),
+        pool_maxsize=int(config.get('http_pool_maxsize', 10) or 10),
+        timeout=float(config.get('http_timeout', 20) or 20),
+        probe_timeout=float(config.get('http_probe_timeout', 5) or 5),
+        headers=config.get('http_headers') or {},
+        archive=_http_archive,
+        archive_mode=_http_archive_mode,
+    )
+    with _http_client_lock:
+        previous, _http_client = _http_client, client
+    if previous is not None:
+        previous.close()
+    return client
+
+
+def get_http_client() -> HttpClient:
+    """Return the shared HTTP client, creating one with defaults if needed."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = HttpClient(archive=_http_archive, archive_mode=_http_archive_mode)
+        return _http_client
+
+
+def validate_link(url: str, timeout: Optional[float] = None) -> bool:
     """
     Validate that a URL is accessible.
     
     Args:
         url: URL to validate
-        timeout: Request timeout in seconds
+        timeout: Request timeout in seconds (defaults to the client's probe timeout)
         
     Returns:
         True if URL is accessible, False otherwise
     """
     try:
-        response = requests.head(url, timeout=timeout, allow_redirects=True)
+        response = get_http_client().head(url, timeout=timeout, allow_redirects=True)
         return response.status_code < 400
     except (requests.RequestException, ValueError, Exception):
         return False
@@ -352,19 +710,19 @@ def extract_budget(text: str) -> Optional[float]:
     return None
 
 
-def get_last_modified_from_url(url: str, timeout: int = 5) -> Optional[datetime]:
+def get_last_modified_from_url(url: str, timeout: Optional[float] = None) -> Optional[datetime]:
     """
     Get Last-Modified header from URL.
     
     Args:
         url: URL to check
-        timeout: Request timeout in seconds
+        timeout: Request timeout in seconds (defaults to the client's probe timeout)
         
     Returns:
         Last-Modified datetime in UTC, or None if not available
     """
     try:
-        response = requests.head(url, timeout=timeout, allow_redirects=True)
+        response = get_http_client().head(url, timeout=timeout, allow_redirects=True)
         last_modified = response.headers.get('Last-Modified')
         if last_modified:
             dt = parsedate_to_datetime(last_modified)
@@ -374,20 +732,193 @@ def get_last_modified_from_url(url: str, timeout: int = 5) -> Optional[datetime]
     return None
 
 
-def normalize_published_date(entry: Dict[str, Any], feed_url: str) -> Optional[datetime]:
+def load_last_modified_cache(cache_path: str = LAST_MODIFIED_CACHE_PATH) -> Dict[str, Any]:
     """
-    Extract and normalize published date from feed entry.
-    
-    Falls back to Last-Modified header if entry has no published date.
-    
+    Load the persistent URL to Last-Modified cache.
+
+    Args:
+        cache_path: Path to Last-Modified cache file
+
+    Returns:
+        Mapping of entry URL to {'last_modified', 'checked_at'} records
+    """
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'r') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                return data
+        except (OSError, ValueError) as exc:
+            print(f"Ignoring unreadable Last-Modified cache {cache_path}: {exc}", file=sys.stderr)
+    return {}
+
+
+def save_last_modified_cache(
+    last_modified_cache: Dict[str, Any],
+    cache_path: str = LAST_MODIFIED_CACHE_PATH,
+    ttl_days: float = 7,
+):
+    """
+    Save the Last-Modified cache, dropping records older than the TTL.
+
+    Args:
+        last_modified_cache: Mapping of entry URL to cached probe results
+        cache_path: Path to Last-Modified cache file
+        ttl_days: Records checked longer ago than this are discarded
+    """
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+
+    now = utc_now()
+    ttl = timedelta(days=ttl_days)
+    fresh = {
+        url: record for url, record in last_modified_cache.items()
+        if is_last_modified_record_fresh(record, now, ttl)
+    }
+
+    with open(cache_path, 'w') as f:
+        json.dump(fresh, f, indent=2, sort_keys=True)
+
+
+def is_last_modified_record_fresh(record: Any, now: datetime, ttl: timedelta) -> bool:
+    """Check whether a cached Last-Modified probe is still within its TTL."""
+    try:
+        checked_at = datetime.fromisoformat(record['checked_at'])
+    except (KeyError, TypeError, ValueError):
+        return False
+    return now - checked_at <= ttl
+
+
+def get_last_modified_cache_ttl(config: Optional[Dict[str, Any]]) -> float:
+    """Read the Last-Modified cache TTL (days) from configuration."""
+    try:
+        return float((config or {}).get('last_modified_cache_ttl_days', 7))
+    except (ValueError, TypeError):
+        return 7.0
+
+
+def lookup_cached_last_modified(
+    urls: List[str],
+    last_modified_cache: Optional[Dict[str, Any]],
+    ttl_days: float,
+) -> Tuple[Dict[str, Optional[datetime]], List[str]]:
+    """
+    Split URLs into cached Last-Modified results and URLs that still need a probe.
+
+    Returns:
+        Tuple of (results dict for cached URLs, list of URLs to probe)
+    """
+    now = utc_now()
+    ttl = timedelta(days=ttl_days)
+    results: Dict[str, Optional[datetime]] = {}
+    pending: List[str] = []
+
+    for url in dict.fromkeys(urls):
+        record = (last_modified_cache or {}).get(url)
+        if record and is_last_modified_record_fresh(record, now, ttl):
+            value = record.get('last_modified')
+            results[url] = datetime.fromisoformat(value) if value else None
+        else:
+            pending.append(url)
+
+    return results, pending
+
+
+def record_last_modified(
+    last_modified_cache: Optional[Dict[str, Any]],
+    url: str,
+    last_modified: Optional[datetime],
+):
+    """Remember a probe result, including misses, so known links are not re-probed."""
+    if last_modified_cache is None:
+        return
+    last_modified_cache[url] = {
+        'last_modified': last_modified.isoformat() if last_modified else None,
+        'checked_at': utc_now().isoformat(),
+    }
+
+
+_probe_host_semaphores: Dict[Tuple[str, int], threading.Semaphore] = {}
+_probe_host_lock = threading.Lock()
+
+
+def get_probe_host_semaphore(url: str, per_host_limit: int) -> threading.Semaphore:
+    """
+    Return the process-wide semaphore limiting concurrent probes to a host.
+
+    Semaphores are keyed by host and limit, so a changed
+    `per_host_concurrency` (e.g. a daemon config reload) takes effect on
+    the next probe instead of keeping the first limit seen.
+    """
+    key = (urlparse(url).netloc.lower(), max(1, per_host_limit))
+    with _probe_host_lock:
+        if key not in _probe_host_semaphores:
+            _probe_host_semaphores[key] = threading.Semaphore(key[1])
+        return _probe_host_semaphores[key]
+
+
+def probe_last_modified_dates(
+    urls: List[str],
+    config: Optional[Dict[str, Any]] = None,
+    last_modified_cache: Optional[Dict[str, Any]] = None,
+    feed_stats: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Optional[datetime]]:
+    """
+    Resolve Last-Modified dates for a batch of undated entry links.
+
+    Cached results within `last_modified_cache_ttl_days` are reused. The
+    remaining links are probed concurrently (`last_modified_concurrency`
+    workers) with at most `per_host_concurrency` probes per host.
+
+    Args:
+        urls: Entry links to resolve
+        config: Optional configuration dictionary
+        last_modified_cache: Optional persistent probe cache, updated in place
+        feed_stats: Optional dictionary that receives probe counters
+
+    Returns:
+        Mapping of URL to Last-Modified datetime (None when unavailable)
+    """
+    config = config or {}
+    stats = feed_stats if feed_stats is not None else {}
+    results, pending = lookup_cached_last_modified(
+        urls,
+        last_modified_cache,
+        get_last_modified_cache_ttl(config),
+    )
+    stats['last_modified_cache_hits'] = stats.get('last_modified_cache_hits', 0) + len(results)
+    stats['last_modified_probes'] = stats.get('last_modified_probes', 0) + len(pending)
+    if not pending:
+        return results
+
+    per_host_limit = int(config.get('per_host_concurrency', 4) or 4)
+    workers = min(len(pending), max(1, int(config.get('last_modified_concurrency', 8) or 8)))
+
+    def probe(url: str) -> Optional[datetime]:
+        with get_probe_host_semaphore(url, per_host_limit):
+            return get_last_modified_from_url(url)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        probed = list(executor.map(probe, pending))
+
+    for url, last_modified in zip(pending, probed):
+        results[url] = last_modified
+        record_last_modified(last_modified_cache, url, last_modified)
+
+    return results
+
+
+def get_entry_published_date(entry: Dict[str, Any]) -> Optional[datetime]:
+    """
+    Extract the published date carried by a feed entry itself.
+
+    Unlike normalize_published_date, this never touches the network.
+
     Args:
         entry: Feed entry dictionary
-        feed_url: URL of the feed source
-        
+
     Returns:
-        Published datetime in UTC, or None if not available
+        Published datetime in UTC, or None if the entry has no usable date
     """
-    # Try to get published date from entry
     if hasattr(entry, 'published_parsed') and entry.published_parsed:
         try:
             dt = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
@@ -401,6 +932,66 @@ def normalize_published_date(entry: Dict[str, Any], feed_url: str) -> Optional[d
             return dt
         except (ValueError, TypeError):
             pass
+
+    return None
+
+
+def get_age_cutoff(config: Optional[Dict[str, Any]]) -> Optional[datetime]:
+    """
+    Return the age-window cutoff for `max_age_days`, if configured.
+
+    filter_entries drops entries whose age in whole days exceeds
+    max_age_days, which is exactly the entries published at or before
+    this cutoff, so early drops never remove anything it would keep.
+    """
+    max_age_days = (config or {}).get('max_age_days')
+    if not max_age_days:
+        return None
+    return utc_now() - timedelta(days=int(max_age_days) + 1)
+
+
+def is_outside_age_window(published: Optional[datetime], cutoff: Optional[datetime]) -> bool:
+    """Check whether a known published date falls outside the age window."""
+    return bool(published and cutoff and published <= cutoff)
+
+
+def drop_entries_outside_age_window(
+    entries: List[Dict[str, Any]],
+    cutoff: Optional[datetime],
+    stats: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    """Drop built entries already outside the age window, counting them in stats['dropped_age']."""
+    if cutoff is None:
+        return entries
+    kept = []
+    for entry in entries:
+        try:
+            published = datetime.fromisoformat(entry['published'])
+        except (KeyError, TypeError, ValueError):
+            published = None
+        if is_outside_age_window(published, cutoff):
+            stats['dropped_age'] = stats.get('dropped_age', 0) + 1
+            continue
+        kept.append(entry)
+    return kept
+
+
+def normalize_published_date(entry: Dict[str, Any], feed_url: str) -> Optional[datetime]:
+    """
+    Extract and normalize published date from feed entry.
+    
+    Falls back to Last-Modified header if entry has no published date.
+    
+    Args:
+        entry: Feed entry dictionary
+        feed_url: URL of the feed source
+        
+    Returns:
+        Published datetime in UTC, or None if not available
+    """
+    published = get_entry_published_date(entry)
+    if published:
+        return published
     
     # Fallback to Last-Modified from entry link
     if hasattr(entry, 'link'):
@@ -422,9 +1013,17 @@ def is_ungm_notice_source(feed_url: str) -> bool:
     return parsed.path.lower().startswith("/public/notice")
 
 
-def build_ungm_search_options(page_index: int, page_size: int) -> Dict[str, Any]:
-    """Build UNGM search payload compatible with the site's AJAX endpoint."""
-    return {
+def build_ungm_search_options(
+    page_index: int,
+    page_size: int,
+    filters: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Build UNGM search payload compatible with the site's AJAX endpoint.
+
+    `filters` (see build_ungm_search_filters) overrides the empty filter
+    fields so the server only returns matching notices.
+    """
+    options = {
         "PageIndex": page_index,
         "PageSize": page_size,
         "Title": "",
@@ -447,6 +1046,67 @@ def build_ungm_search_options(page_index: int, page_size: int) -> Dict[str, Any]
         "NoticeSearchTotalLabelId": "lblNoticeSearchTotal",
         "TypeOfCompetitions": [],
     }
+    options.update(filters or {})
+    return options
+
+
+def build_ungm_search_filters(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Derive UNGM search filters from configuration for server-side push-down.
+
+    Only hard filters are pushed down, so the server never drops a notice
+    the pipeline would have kept:
+    - PublishedFrom from `max_age_days` (always a hard filter)
+    - Countries from `ungm_search_countries` for the configured region
+      groups, only when `strict_region_filter` is enabled
+    - Title and UNSPSCs only when set explicitly (`ungm_search_title`,
+      `ungm_search_unspscs`); keywords are a scoring signal, not a filter
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        Payload fields to merge into the search options (empty if disabled)
+    """
+    if not config.get('ungm_search_pushdown', True):
+        return {}
+
+    filters: Dict[str, Any] = {}
+
+    cutoff = get_age_cutoff(config)
+    if cutoff:
+        filters['PublishedFrom'] = f"{cutoff.day:02d}-{UNGM_SEARCH_MONTHS[cutoff.month - 1]}-{cutoff.year}"
+
+    country_map = config.get('ungm_search_countries') or {}
+    if config.get('strict_region_filter') and country_map:
+        countries: List[Any] = []
+        for group in sorted(get_configured_region_groups(config.get('regions', []))):
+            countries.extend(country_map.get(group, []))
+        if countries:
+            filters['Countries'] = list(dict.fromkeys(countries))
+
+    if config.get('ungm_search_title'):
+        filters['Title'] = str(config['ungm_search_title'])
+
+    if config.get('ungm_search_unspscs'):
+        filters['UNSPSCs'] = list(config['ungm_search_unspscs'])
+
+    return filters
+
+
+def parse_ungm_search_total(search_html: str) -> Optional[int]:
+    """Extract the total result count from the UNGM search total label, if present."""
+    if not search_html:
+        return None
+
+    match = re.search(
+        r'id=["\']lblNoticeSearchTotal["\'][^>]*>\s*([\d,]+)',
+        search_html,
+        re.IGNORECASE,
+    )
+    if not match:
+        return None
+    return int(match.group(1).replace(',', ''))
 
 
 def parse_ungm_search_result_links(search_html: str) -> List[str]:
@@ -462,36 +1122,106 @@ def parse_ungm_search_result_links(search_html: str) -> List[str]:
     return [f"{UNGM_NOTICE_ROOT}/{notice_id}" for notice_id in unique_ids]
 
 
+UNGM_SEARCH_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "*/*",
+    "Origin": "https://www.ungm.org",
+    "Referer": UNGM_NOTICE_ROOT,
+}
+
+
+def fetch_ungm_search_page(
+    page_index: int,
+    page_size: int = 15,
+    timeout: Optional[float] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    search_stats: Optional[Dict[str, Any]] = None,
+) -> Optional[List[str]]:
+    """Fetch a single UNGM search results page.
+
+    Returns the notice links on the page, or None if the request failed.
+    The reported result total, when present, is stored in `search_stats`.
+    """
+    payload = build_ungm_search_options(page_index=page_index, page_size=page_size, filters=filters)
+    try:
+        response = get_http_client().post(
+            f"{UNGM_NOTICE_ROOT}/Search",
+            json=payload,
+            headers=UNGM_SEARCH_HEADERS,
+            timeout=timeout,
+        )
+        response.raise_for_status()
+    except requests.RequestException as exc:
+        print(f"UNGM fallback search request failed: {exc}", file=sys.stderr)
+        return None
+
+    if search_stats is not None:
+        total = parse_ungm_search_total(response.text)
+        if total is not None:
+            search_stats['total'] = total
+
+    return parse_ungm_search_result_links(response.text)
+
+
+def record_ungm_pushdown_savings(
+    config: Dict[str, Any],
+    filters: Dict[str, Any],
+    filtered_total: Optional[int],
+    feed_stats: Optional[Dict[str, Any]] = None,
+) -> int:
+    """
+    Estimate how many notice downloads the search push-down avoided.
+
+    Results are sorted newest first, so without filters the crawl budget
+    (pages x page size, capped by ungm_max_fallback_notices) would have been
+    filled with the filtered notices followed by excluded ones. One
+    single-result unfiltered search supplies the unfiltered total, so the
+    estimate is opt-in (`ungm_pushdown_metrics`) to spare UNGM the extra
+    request on every run.
+
+    Args:
+        config: Configuration dictionary
+        filters: Filters sent with the search
+        filtered_total: Total reported by the filtered search
+        feed_stats: Optional dictionary that receives 'ungm_pushdown_avoided'
+
+    Returns:
+        Estimated number of avoided notice downloads
+    """
+    if not config.get('ungm_pushdown_metrics', False) or not filters or filtered_total is None:
+        return 0
+
+    probe_stats: Dict[str, Any] = {}
+    fetch_ungm_search_page(0, page_size=1, search_stats=probe_stats)
+    unfiltered_total = probe_stats.get('total')
+    if unfiltered_total is None:
+        return 0
+
+    settings = get_ungm_search_settings(config)
+    budget = min(settings["search_pages"] * settings["search_page_size"], settings["max_notices"])
+    avoided = max(min(unfiltered_total, budget) - min(filtered_total, budget), 0)
+    if feed_stats is not None:
+        feed_stats['ungm_pushdown_avoided'] = feed_stats.get('ungm_pushdown_avoided', 0) + avoided
+    return avoided
+
+
 def fetch_ungm_notice_links(
     max_pages: int = 1,
     page_size: int = 15,
-    timeout: int = 20,
+    timeout: Optional[float] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    search_stats: Optional[Dict[str, Any]] = None,
 ) -> List[str]:
     """Fetch notice links from UNGM search endpoint."""
-    headers = {
-        "User-Agent": "Mozilla/5.0",
-        "Content-Type": "application/json",
-        "Accept": "*/*",
-        "Origin": "https://www.ungm.org",
-        "Referer": UNGM_NOTICE_ROOT,
-    }
-
     all_links: List[str] = []
     for page_index in range(max(max_pages, 1)):
-        payload = build_ungm_search_options(page_index=page_index, page_size=page_size)
-        try:
-            response = requests.post(
-                f"{UNGM_NOTICE_ROOT}/Search",
-                json=payload,
-                headers=headers,
-                timeout=timeout,
-            )
-            response.raise_for_status()
-        except requests.RequestException as exc:
-            print(f"UNGM fallback search request failed: {exc}", file=sys.stderr)
-            break
-
-        links = parse_ungm_search_result_links(response.text)
+        links = fetch_ungm_search_page(
+            page_index,
+            page_size=page_size,
+            timeout=timeout,
+            filters=filters,
+            search_stats=search_stats if page_index == 0 else None,
+        )
         if not links:
             break
 
@@ -502,13 +1232,43 @@ def fetch_ungm_notice_links(
     return list(dict.fromkeys(all_links))
 
 
-def clean_html_text(value: str) -> str:
-    """Convert HTML fragments to compact plaintext."""
+# Tags and character references in one alternation, so a single scan both
+# drops markup and unescapes entities. The reference grammar is the one
+# html.unescape uses, which keeps results identical to unescaping afterwards.
+HTML_MARKUP_PATTERN = re.compile(r'<[^>]+>|&(?:#[0-9]+;?|#[xX][0-9a-fA-F]+;?|[^\t\n\f <&#;]{1,32};?)')
+
+
+def replace_html_markup(match: Any) -> str:
+    """Replacement for HTML_MARKUP_PATTERN: tags become a space, references their text."""
+    token = match.group()
+    return ' ' if token[0] == '<' else html.unescape(token)
+
+
+def html_to_text(value: Optional[str]) -> str:
+    """
+    Convert an HTML fragment to compact plain text.
+
+    Tags are dropped and character references unescaped in one regex scan,
+    then whitespace is collapsed to single spaces. Text without markup
+    skips the scan. The result equals stripping tags, unescaping and
+    collapsing whitespace in three separate passes.
+
+    Args:
+        value: HTML or plain text
+
+    Returns:
+        Plain text without leading or trailing whitespace
+    """
     if not value:
         return ""
-    text = re.sub(r"<[^>]+>", " ", value)
-    text = html.unescape(text)
-    return re.sub(r"\s+", " ", text).strip()
+    if '<' in value or '&' in value:
+        value = HTML_MARKUP_PATTERN.sub(replace_html_markup, value)
+    return ' '.join(value.split())
+
+
+def clean_html_text(value: str) -> str:
+    """Convert HTML fragments to compact plaintext."""
+    return html_to_text(value)
 
 
 def parse_ungm_notice_date(value: str) -> Optional[datetime]:
@@ -533,6 +1293,114 @@ def parse_ungm_notice_date(value: str) -> Optional[datetime]:
     return None
 
 
+# Tokenizer for the start tags a notice page is navigated by: <title>, label
+# and value spans, the section heading div and bare <div>s (class must be the
+# first attribute, as on UNGM pages). All other markup is skipped inside the
+# C regex engine, and [^>] runs cannot backtrack across tags.
+UNGM_NOTICE_START_PATTERN = re.compile(
+    r'<(?:(?P<title>title)\b'
+    r'|(?P<span>span)\s+class\s*=\s*["\']?(?P<span_class>label|value)\b'
+    r'|(?P<div>div)(?:\s+class\s*=\s*["\']?(?P<div_class>title)\b|\s*(?=>)))'
+    r'[^>]*>',
+    re.IGNORECASE,
+)
+# While capturing, only tags of the captured kind are tokenized, to balance nesting.
+UNGM_NOTICE_BALANCE_PATTERNS = {
+    tag: re.compile(rf'<(/?){tag}\b[^>]*>', re.IGNORECASE) for tag in ('title', 'span', 'div')
+}
+UNGM_PUBLISHED_LABEL = "Published on"
+
+
+def extract_ungm_notice_fields(page_html: str) -> Dict[str, Any]:
+    """
+    Extract title, metadata and description from a UNGM notice page in one scan.
+
+    The page is walked once, tag by tag, and the scan stops as soon as the
+    title, the publication date and the description have been seen.
+    Metadata pairs are a <span class="label"> followed only by whitespace and
+    a <span class="value">. The description is the <div> directly following
+    <div class="title">Description</div>. Nested tags of the captured kind
+    are balanced, so a description with inner <div> blocks is kept whole.
+
+    Args:
+        page_html: Notice detail page HTML
+
+    Returns:
+        Dictionary with 'title' and 'description' (None when absent) and 'metadata'
+    """
+    fields: Dict[str, Any] = {'title': None, 'metadata': {}, 'description': None}
+    metadata = fields['metadata']
+    pending_label: Optional[str] = None
+    expect_description = False
+    position = 0
+
+    while True:
+        match = UNGM_NOTICE_START_PATTERN.search(page_html, position)
+        if not match:
+            break
+        # Anything but whitespace since the previous token (text or other
+        # tags) breaks label/value and Description-heading adjacency.
+        if page_html[position:match.start()].strip():
+            pending_label = None
+            expect_description = False
+        position = match.end()
+
+        if match.group('title'):
+            capture = 'title' if fields['title'] is None else None
+        elif match.group('span'):
+            span_class = match.group('span_class').lower()
+            capture = span_class if span_class == 'label' or pending_label is not None else None
+        elif match.group('div_class'):
+            capture = 'section'
+        else:
+            capture = 'description' if expect_description else None
+        if capture != 'value':
+            pending_label = None
+        expect_description = False
+        if not capture:
+            continue
+
+        tag = (match.group('title') or match.group('span') or match.group('div')).lower()
+        balance_pattern = UNGM_NOTICE_BALANCE_PATTERNS[tag]
+        depth = 1
+        end = None
+        while end is None:
+            inner = balance_pattern.search(page_html, position)
+            if not inner:
+                break
+            position = inner.end()
+            if inner.group(0).rstrip('>').rstrip().endswith('/'):
+                continue
+            depth += -1 if inner.group(1) else 1
+            if not depth:
+                end = inner.start()
+        if end is None:
+            break
+
+        text = html_to_text(page_html[match.end():end])
+        if capture == 'title':
+            fields['title'] = text
+        elif capture == 'label':
+            pending_label = text.rstrip(":")
+        elif capture == 'value':
+            if pending_label:
+                metadata[pending_label] = text
+            pending_label = None
+        elif capture == 'section':
+            expect_description = text == "Description"
+        elif fields['description'] is None:
+            fields['description'] = text
+
+        if (
+            fields['title'] is not None
+            and fields['description'] is not None
+            and UNGM_PUBLISHED_LABEL in metadata
+        ):
+            break
+
+    return fields
+
+
 def parse_ungm_notice_entry(
     notice_url: str,
     page_html: str,
@@ -542,173 +1410,2190 @@ def parse_ungm_notice_entry(
     if not page_html:
         return None
 
-    title_match = re.search(r"<title>(.*?)</title>", page_html, re.IGNORECASE | re.DOTALL)
-    title = clean_html_text(title_match.group(1)) if title_match else ""
-
-    metadata: Dict[str, str] = {}
-    for label, value in re.findall(
-        r'<span class="label">(.*?)</span>\s*<span class="value">(.*?)</span>',
-        page_html,
-        re.IGNORECASE | re.DOTALL,
-    ):
-        label_text = clean_html_text(label).rstrip(":")
-        value_text = clean_html_text(value)
-        if label_text:
-            metadata[label_text] = value_text
-
-    published_text = metadata.get("Published on", "")
-    published = parse_ungm_notice_date(published_text)
+    fields = extract_ungm_notice_fields(page_html)
+    published = parse_ungm_notice_date(fields['metadata'].get(UNGM_PUBLISHED_LABEL, ""))
     if not published:
         return None
 
-    description_match = re.search(
-        r'<div class="title">Description</div>\s*<div>(.*?)</div>\s*</div>\s*<br\s*/?>',
-        page_html,
-        re.IGNORECASE | re.DOTALL,
-    )
-    if not description_match:
-        description_match = re.search(
-            r'<div class="title">Description</div>\s*<div>(.*?)</div>',
-            page_html,
-            re.IGNORECASE | re.DOTALL,
-        )
-    description = clean_html_text(description_match.group(1)) if description_match else ""
-
     return {
-        "title": title or f"UNGM Notice {notice_url.rsplit('/', 1)[-1]}",
+        "title": fields['title'] or f"UNGM Notice {notice_url.rsplit('/', 1)[-1]}",
         "link": notice_url,
-        "description": description,
+        "description": fields['description'] or "",
         "published": published.isoformat(),
         "source": source_url,
         "source_name": "United Nations Global Marketplace",
     }
 
 
+def get_ungm_notice_id(notice_url: str) -> str:
+    """Return the numeric notice ID from a UNGM notice URL."""
+    return notice_url.rstrip('/').rsplit('/', 1)[-1]
+
+
+def load_ungm_notice_cache(cache_path: str = UNGM_NOTICE_CACHE_PATH) -> Dict[str, Any]:
+    """
+    Load the persistent UNGM notice cache.
+
+    Args:
+        cache_path: Path to notice cache file
+
+    Returns:
+        Cache dictionary with a 'notices' mapping keyed by notice ID
+    """
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'r') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                data.setdefault('notices', {})
+                return data
+        except (OSError, ValueError) as exc:
+            print(f"Ignoring unreadable UNGM notice cache {cache_path}: {exc}", file=sys.stderr)
+    return {'notices': {}}
+
+
+def save_ungm_notice_cache(
+    notice_cache: Dict[str, Any],
+    cache_path: str = UNGM_NOTICE_CACHE_PATH,
+    max_age_days: float = 90,
+    max_entries: int = 2000,
+):
+    """
+    Save the UNGM notice cache after evicting stale records.
+
+    Records not requested for `max_age_days` are dropped, then the least
+    recently requested records are evicted beyond `max_entries`.
+
+    Args:
+        notice_cache: Notice cache dictionary
+        cache_path: Path to notice cache file
+        max_age_days: Maximum days since a notice was last requested
+        max_entries: Maximum number of cached notices
+    """
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+
+    cutoff = (utc_now() - timedelta(days=max_age_days)).isoformat()
+    notices = {
+        notice_id: record
+        for notice_id, record in notice_cache.get('notices', {}).items()
+        if record.get('last_seen', '') >= cutoff
+    }
+    if len(notices) > max_entries:
+        newest = sorted(notices, key=lambda notice_id: notices[notice_id].get('last_seen', ''), reverse=True)
+        notices = {notice_id: notices[notice_id] for notice_id in newest[:max_entries]}
+
+    data = dict(notice_cache)
+    data['notices'] = notices
+    with open(cache_path, 'w') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+
+def lookup_ungm_notice_cache(
+    notice_cache: Optional[Dict[str, Any]],
+    notice_url: str,
+    source_url: str,
+    revalidate_days: float,
+) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    """
+    Look up a notice that was fetched recently enough to skip the download.
+
+    Returns:
+        Tuple of (cache hit, cached entry or None)
+    """
+    if notice_cache is None:
+        return False, None
+
+    notice_id = get_ungm_notice_id(notice_url)
+    record = notice_cache.get('notices', {}).get(notice_id)
+    if not record:
+        return False, None
+
+    now = utc_now()
+    try:
+        fetched_at = datetime.fromisoformat(record['fetched_at'])
+    except (KeyError, TypeError, ValueError):
+        return False, None
+    if now - fetched_at > timedelta(days=revalidate_days):
+        return False, None
+
+    # Records are replaced, never changed in place (see new_fetch_scratch)
+    notice_cache['notices'][notice_id] = dict(record, last_seen=now.isoformat())
+    entry = record.get('entry')
+    if entry is None:
+        return True, None
+    entry = dict(entry)
+    entry['source'] = source_url
+    return True, entry
+
+
+def is_cached_ungm_notice_outside_age_window(
+    notice_cache: Optional[Dict[str, Any]],
+    notice_url: str,
+    cutoff: Optional[datetime],
+) -> bool:
+    """Check whether a cached notice is already known to be too old to need (re)fetching."""
+    if notice_cache is None or cutoff is None:
+        return False
+    record = notice_cache.get('notices', {}).get(get_ungm_notice_id(notice_url)) or {}
+    try:
+        published = datetime.fromisoformat((record.get('entry') or {})['published'])
+    except (KeyError, TypeError, ValueError):
+        return False
+    return is_outside_age_window(published, cutoff)
+
+
 def fetch_ungm_notice_entry(
     notice_url: str,
     source_url: str,
-    timeout: int = 20,
+    timeout: Optional[float] = None,
+    notice_cache: Optional[Dict[str, Any]] = None,
 ) -> Optional[Dict[str, Any]]:
-    """Fetch and parse a single UNGM notice detail page."""
-    headers = {"User-Agent": "Mozilla/5.0"}
+    """Fetch and parse a single UNGM notice detail page.
+
+    When a notice cache is given, the page's content hash is compared with
+    the cached one and an unchanged page is not parsed again. The result
+    (including pages that fail to parse) is stored with its fetch time.
+    """
     try:
-        response = requests.get(notice_url, headers=headers, timeout=timeout)
+        response = get_http_client().get(notice_url, timeout=timeout)
         response.raise_for_status()
     except requests.RequestException as exc:
         print(f"UNGM fallback notice request failed ({notice_url}): {exc}", file=sys.stderr)
         return None
 
-    return parse_ungm_notice_entry(notice_url, response.text, source_url)
+    if notice_cache is None:
+        return parse_ungm_notice_entry(notice_url, response.text, source_url)
+
+    content_hash = hashlib.sha256(response.text.encode('utf-8')).hexdigest()
+    notices = notice_cache.setdefault('notices', {})
+    notice_id = get_ungm_notice_id(notice_url)
+    record = notices.get(notice_id) or {}
+
+    if record.get('content_hash') == content_hash:
+        entry = dict(record['entry']) if record.get('entry') else None
+        if entry:
+            entry['source'] = source_url
+    else:
+        entry = parse_ungm_notice_entry(notice_url, response.text, source_url)
+
+    now = utc_now().isoformat()
+    notices[notice_id] = {
+        'entry': entry,
+        'content_hash': content_hash,
+        'fetched_at': now,
+        'last_seen': now,
+    }
+    return entry
+
+
+def build_ungm_notice_url(raw_value: Any) -> Optional[str]:
+    """Normalize a notice id or URL into a full UNGM notice URL."""
+    if raw_value is None:
+        return None
+
+    value = str(raw_value).strip()
+    if not value:
+        return None
+
+    if value.startswith("http"):
+        match = re.search(r"/Public/Notice/(\d+)", value, re.IGNORECASE)
+        if match:
+            return f"{UNGM_NOTICE_ROOT}/{match.group(1)}"
+        return None
+
+    if value.isdigit():
+        return f"{UNGM_NOTICE_ROOT}/{value}"
+
+    return None
+
+
+def get_ungm_search_settings(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Read UNGM search paging, notice limits and cache settings from configuration."""
+    return {
+        "search_pages": int(config.get("ungm_search_pages", 1) or 1),
+        "search_page_size": int(config.get("ungm_search_page_size", 15) or 15),
+        "max_notices": int(config.get("ungm_max_fallback_notices", 30) or 30),
+        "revalidate_days": float(config.get("ungm_notice_revalidate_days", 30) or 0),
+    }
+
+
+def collect_ungm_notice_urls(
+    feed_url: str,
+    config: Dict[str, Any],
+    discovered_urls: List[str],
+) -> List[str]:
+    """Combine direct, pinned and discovered UNGM notice URLs, deduplicated and capped."""
+    notice_urls: List[str] = []
+
+    direct_notice_url = build_ungm_notice_url(feed_url)
+    if direct_notice_url:
+        notice_urls.append(direct_notice_url)
+
+    for raw_value in config.get("ungm_notice_ids", []):
+        notice_url = build_ungm_notice_url(raw_value)
+        if notice_url:
+            notice_urls.append(notice_url)
+
+    notice_urls.extend(discovered_urls)
+
+    max_notices = get_ungm_search_settings(config)["max_notices"]
+    return list(dict.fromkeys(notice_urls))[:max_notices]
+
+
+def fetch_ungm_fallback_entries(
+    feed_url: str,
+    config: Dict[str, Any],
+    notice_cache: Optional[Dict[str, Any]] = None,
+    feed_stats: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """Fetch UNGM notices using HTML/API fallback when RSS parsing is unavailable.
+
+    Notices fetched within `ungm_notice_revalidate_days` are served from the
+    notice cache without a download. With `ungm_crawler_enabled` the
+    incremental crawler (crawl_ungm_notices) is used instead.
+    """
+    if not config.get("ungm_fallback_enabled", True):
+        return []
+
+    if config.get("ungm_crawler_enabled"):
+        return crawl_ungm_notices(feed_url, config, notice_cache, feed_stats)
+
+    settings = get_ungm_search_settings(config)
+    stats = feed_stats if feed_stats is not None else {}
+    filters = build_ungm_search_filters(config)
+    search_stats: Dict[str, Any] = {}
+    discovered_urls = fetch_ungm_notice_links(
+        max_pages=settings["search_pages"],
+        page_size=settings["search_page_size"],
+        filters=filters,
+        search_stats=search_stats,
+    )
+    record_ungm_pushdown_savings(config, filters, search_stats.get('total'), stats)
+    unique_urls = collect_ungm_notice_urls(feed_url, config, discovered_urls)
+    cutoff = get_age_cutoff(config)
+
+    entries: List[Dict[str, Any]] = []
+    for notice_url in unique_urls:
+        if is_cached_ungm_notice_outside_age_window(notice_cache, notice_url, cutoff):
+            stats['dropped_age'] = stats.get('dropped_age', 0) + 1
+            continue
+        cache_hit, entry = lookup_ungm_notice_cache(
+            notice_cache,
+            notice_url,
+            feed_url,
+            settings["revalidate_days"],
+        )
+        if cache_hit:
+            stats['ungm_notice_cache_hits'] = stats.get('ungm_notice_cache_hits', 0) + 1
+        else:
+            stats['ungm_notice_downloads'] = stats.get('ungm_notice_downloads', 0) + 1
+            entry = fetch_ungm_notice_entry(notice_url, source_url=feed_url, notice_cache=notice_cache)
+        if entry:
+            entries.append(entry)
+
+    return entries
+
+
+def get_ungm_crawl_settings(config: Dict[str, Any]) -> Dict[str, int]:
+    """Read UNGM crawler concurrency and prefetch settings from configuration."""
+    return {
+        "concurrency": max(1, int(config.get("ungm_crawl_concurrency", 4) or 4)),
+        "prefetch_pages": max(1, int(config.get("ungm_prefetch_pages", 2) or 2)),
+    }
+
+
+def get_cached_ungm_backlog(
+    notice_cache: Dict[str, Any],
+    source_url: str,
+    max_age_days: Optional[int],
+    exclude_links: Set[str],
+) -> List[Dict[str, Any]]:
+    """Return previously ingested notices that are still inside the age window, newest first."""
+    now = utc_now()
+    backlog = []
+    notices = notice_cache.get('notices', {})
+    for notice_id, record in list(notices.items()):
+        entry = record.get('entry')
+        if not entry or entry.get('link') in exclude_links:
+            continue
+        try:
+            published = datetime.fromisoformat(entry['published'])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if max_age_days is not None and (now - published).days > max_age_days:
+            continue
+        notices[notice_id] = dict(record, last_seen=now.isoformat())
+        backlog.append(dict(entry, source=source_url))
+    backlog.sort(key=lambda entry: entry['published'], reverse=True)
+    return backlog
+
+
+def crawl_ungm_notices(
+    feed_url: str,
+    config: Dict[str, Any],
+    notice_cache: Optional[Dict[str, Any]] = None,
+    feed_stats: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Incrementally crawl the UNGM notice search with a persisted cursor.
+
+    Search pages are prefetched `ungm_prefetch_pages` ahead and new notice
+    detail pages are downloaded while later pages are still loading, all
+    through one pool of `ungm_crawl_concurrency` workers (the politeness
+    limit for the host). Paging stops at the cursor left by the previous
+    run, or at a page whose notices are all cached already. Notices
+    ingested by earlier runs that are still within `max_age_days` are
+    served from the notice cache.
+
+    The cursor only advances when the crawl closed the gap to the previous
+    one (it reached the old cursor or the end of the results). Notices
+    skipped by the `ungm_max_fallback_notices` cap or whose download failed
+    are kept in the cursor's `pending_ids` and retried by the next run.
+
+    Args:
+        feed_url: UNGM source URL
+        config: Configuration dictionary
+        notice_cache: Optional UNGM notice cache holding notices and cursor
+        feed_stats: Optional dictionary that receives crawl counters
+
+    Returns:
+        List of normalized notice entries
+    """
+    settings = get_ungm_search_settings(config)
+    crawl_settings = get_ungm_crawl_settings(config)
+    stats = feed_stats if feed_stats is not None else {}
+    notice_cache = notice_cache if notice_cache is not None else {'notices': {}}
+    cached_ids = {
+        notice_id for notice_id, record in notice_cache.get('notices', {}).items() if record.get('entry')
+    }
+    cursor = notice_cache.get('cursor') or {}
+    cursor_id = str(cursor.get('last_notice_id') or '')
+    pending_ids = [str(notice_id) for notice_id in cursor.get('pending_ids') or []]
+    max_pages = max(settings["search_pages"], 1)
+    page_size = settings["search_page_size"]
+    filters = build_ungm_search_filters(config)
+    search_stats: Dict[str, Any] = {}
+
+    pinned_urls = collect_ungm_notice_urls(feed_url, config, [])
+    new_urls: List[str] = []
+    newest_url: Optional[str] = None
+    skipped_ids: List[str] = []
+    pages_fetched = 0
+    reached_cursor = False
+    exhausted = False
+
+    with ThreadPoolExecutor(max_workers=crawl_settings["concurrency"]) as executor:
+        page_futures = {
+            page_index: executor.submit(
+                fetch_ungm_search_page,
+                page_index,
+                page_size,
+                filters=filters,
+                search_stats=search_stats if page_index == 0 else None,
+            )
+            for page_index in range(min(crawl_settings["prefetch_pages"], max_pages))
+        }
+        next_page = len(page_futures)
+        detail_futures: Dict[str, Any] = {}
+
+        def queue_notice(link: str, notice_id: str) -> None:
+            if notice_id in cached_ids or link in detail_futures or link in pinned_urls:
+                return
+            if len(detail_futures) >= settings["max_notices"]:
+                skipped_ids.append(notice_id)
+                return
+            new_urls.append(link)
+            detail_futures[link] = executor.submit(
+                fetch_ungm_notice_entry,
+                link,
+                source_url=feed_url,
+                notice_cache=notice_cache,
+            )
+
+        for notice_id in pending_ids:
+            pending_url = build_ungm_notice_url(notice_id)
+            if pending_url:
+                queue_notice(pending_url, notice_id)
+
+        for page_index in range(max_pages):
+            links = page_futures.pop(page_index).result()
+            if next_page < max_pages:
+                page_futures[next_page] = executor.submit(
+                    fetch_ungm_search_page,
+                    next_page,
+                    page_size,
+                    filters=filters,
+                )
+                next_page += 1
+            if not links:
+                exhausted = True
+                break
+            pages_fetched += 1
+            newest_url = newest_url or links[0]
+
+            page_ids = [get_ungm_notice_id(link) for link in links]
+            for link, notice_id in zip(links, page_ids):
+                if notice_id == cursor_id:
+                    reached_cursor = True
+                    break
+                queue_notice(link, notice_id)
+
+            if reached_cursor or all(notice_id in cached_ids for notice_id in page_ids):
+                reached_cursor = True
+                break
+            if len(links) < page_size:
+                exhausted = True
+                break
+
+        for future in page_futures.values():
+            future.cancel()
+        new_entries = {link: detail_futures[link].result() for link in new_urls}
+
+    record_ungm_pushdown_savings(config, filters, search_stats.get('total'), stats)
+
+    cutoff = get_age_cutoff(config)
+    entries: List[Dict[str, Any]] = []
+    for notice_url in pinned_urls:
+        if is_cached_ungm_notice_outside_age_window(notice_cache, notice_url, cutoff):
+            stats['dropped_age'] = stats.get('dropped_age', 0) + 1
+            continue
+        cache_hit, entry = lookup_ungm_notice_cache(notice_cache, notice_url, feed_url, settings["revalidate_days"])
+        if cache_hit:
+            stats['ungm_notice_cache_hits'] = stats.get('ungm_notice_cache_hits', 0) + 1
+        else:
+            stats['ungm_notice_downloads'] = stats.get('ungm_notice_downloads', 0) + 1
+            entry = fetch_ungm_notice_entry(notice_url, source_url=feed_url, notice_cache=notice_cache)
+        if entry:
+            entries.append(entry)
+    entries.extend(entry for entry in (new_entries[link] for link in new_urls) if entry)
+
+    seen_links = {entry['link'] for entry in entries}
+    backlog = get_cached_ungm_backlog(notice_cache, feed_url, config.get('max_age_days'), seen_links)
+    entries.extend(backlog)
+
+    # A download that failed outright leaves no record in the notice cache;
+    # pages that downloaded but did not parse are cached and not retried.
+    failed_ids = [
+        get_ungm_notice_id(link) for link in new_urls
+        if new_entries[link] is None and get_ungm_notice_id(link) not in notice_cache.get('notices', {})
+    ]
+    still_pending = list(dict.fromkeys(skipped_ids + failed_ids))
+    if newest_url and (reached_cursor or exhausted):
+        newest_record = notice_cache.get('notices', {}).get(get_ungm_notice_id(newest_url)) or {}
+        notice_cache['cursor'] = {
+            'last_notice_id': get_ungm_notice_id(newest_url),
+            'last_published': (newest_record.get('entry') or {}).get('published'),
+            'updated_at': utc_now().isoformat(),
+            'pending_ids': still_pending,
+        }
+    elif cursor:
+        # Paging stopped short of the old cursor, so the notices between the
+        # last page and the cursor were never seen: keep the cursor where it
+        # was and only carry over the pending notices that are still missing.
+        notice_cache['cursor'] = dict(cursor, pending_ids=[
+            notice_id for notice_id in pending_ids if notice_id in still_pending
+        ])
+
+    stats['ungm_notice_downloads'] = stats.get('ungm_notice_downloads', 0) + len(new_urls)
+    stats['ungm_notice_cache_hits'] = stats.get('ungm_notice_cache_hits', 0) + len(backlog)
+    stats['ungm_search_pages'] = pages_fetched
+    stats['ungm_cursor_reached'] = reached_cursor
+    stats['ungm_notices_pending'] = len(still_pending)
+    return entries
+
+
+def build_feed_entry(entry: Any, published: datetime, feed_url: str, feed: Any) -> Dict[str, Any]:
+    """Build the normalized entry dictionary for a parsed feed item."""
+    return {
+        'title': entry.title,
+        'link': entry.link,
+        'description': entry.get('summary', entry.get('description', '')),
+        'published': published.isoformat(),
+        'source': feed_url,
+        'source_name': feed.feed.get('title', urlparse(feed_url).netloc),
+    }
+
+
+def get_feed_candidates(feed: Any) -> List[Any]:
+    """Return feed items that carry the required title and link fields."""
+    return [
+        entry for entry in feed.entries
+        if hasattr(entry, 'title') and hasattr(entry, 'link')
+    ]
+
+
+def build_dated_entries(
+    candidates: List[Any],
+    published_dates: List[Optional[datetime]],
+    feed_url: str,
+    feed: Any,
+    cutoff: Optional[datetime] = None,
+    stats: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """Build normalized entries, skipping undated items and items outside the age window."""
+    stats = stats if stats is not None else {}
+    entries = []
+    for entry, published in zip(candidates, published_dates):
+        if not published:
+            print(f"Skipping entry without date: {entry.get('title', 'Unknown')}")
+            continue
+        if is_outside_age_window(published, cutoff):
+            stats['dropped_age'] = stats.get('dropped_age', 0) + 1
+            continue
+        entries.append(build_feed_entry(entry, published, feed_url, feed))
+    return entries
+
+
+def get_dated_candidates(
+    feed: Any,
+    cutoff: Optional[datetime],
+    stats: Dict[str, Any],
+) -> Tuple[List[Any], List[Optional[datetime]]]:
+    """
+    Return feed candidates with their own dates, minus those already too old.
+
+    Items whose published date is known to fall outside the age window are
+    counted in stats['dropped_age'] and never probed or built.
+    """
+    candidates = []
+    published_dates = []
+    for entry in get_feed_candidates(feed):
+        published = get_entry_published_date(entry)
+        if is_outside_age_window(published, cutoff):
+            stats['dropped_age'] = stats.get('dropped_age', 0) + 1
+            continue
+        candidates.append(entry)
+        published_dates.append(published)
+    return candidates, published_dates
+
+
+def needs_ungm_fallback(feed_url: str, has_feed_entries: bool, config: Optional[Dict[str, Any]]) -> bool:
+    """Check whether a parsed feed should be supplemented by the UNGM fallback."""
+    if not is_ungm_notice_source(feed_url):
+        return False
+    has_configured_notice_ids = bool((config or {}).get("ungm_notice_ids"))
+    return not has_feed_entries or has_configured_notice_ids
+
+
+def load_feed_cache(cache_path: str = FEED_CACHE_PATH) -> Dict[str, Any]:
+    """
+    Load the conditional GET feed cache.
+
+    Args:
+        cache_path: Path to feed cache file
+
+    Returns:
+        Mapping of feed URL to cached ETag, Last-Modified and entries
+    """
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'r') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                return data
+        except (OSError, ValueError) as exc:
+            print(f"Ignoring unreadable feed cache {cache_path}: {exc}", file=sys.stderr)
+    return {}
+
+
+def save_feed_cache(feed_cache: Dict[str, Any], cache_path: str = FEED_CACHE_PATH):
+    """
+    Save the conditional GET feed cache.
+
+    Args:
+        feed_cache: Mapping of feed URL to cached validators and entries
+        cache_path: Path to feed cache file
+    """
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+
+    with open(cache_path, 'w') as f:
+        json.dump(feed_cache, f, indent=2, sort_keys=True)
+
+
+def request_feed_document(
+    feed_url: str,
+    feed_cache: Optional[Dict[str, Any]] = None,
+    **kwargs: Any,
+) -> requests.Response:
+    """Send a feed GET, with cached validators as If-None-Match/If-Modified-Since.
+
+    Extra keyword arguments (e.g. stream=True) are passed to the HTTP client.
+    """
+    cached = (feed_cache or {}).get(feed_url) or {}
+    headers = {}
+    if cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+    if cached.get('modified'):
+        headers['If-Modified-Since'] = cached['modified']
+    return get_http_client().get(feed_url, headers=headers, **kwargs)
+
+
+def set_feed_response_fields(feed: Any, response: requests.Response) -> Any:
+    """Copy the HTTP status, URL, ETag and Last-Modified onto a parsed feed."""
+    feed['status'] = response.status_code
+    feed['href'] = response.url
+    feed['etag'] = response.headers.get('ETag')
+    feed['modified'] = response.headers.get('Last-Modified')
+    return feed
+
+
+def fetch_feed_document(feed_url: str, feed_cache: Optional[Dict[str, Any]] = None) -> Any:
+    """
+    Download a feed through the shared HTTP client and parse it.
+
+    Cached validators are sent as If-None-Match/If-Modified-Since. The
+    returned feedparser result carries the HTTP status, ETag and
+    Last-Modified of the response, as feedparser.parse(url) would.
+
+    Args:
+        feed_url: RSS feed URL
+        feed_cache: Optional conditional GET cache
+
+    Returns:
+        Parsed feed (empty with status 304 when not modified)
+    """
+    response = request_feed_document(feed_url, feed_cache)
+    if response.status_code == 304:
+        feed = feedparser.FeedParserDict(entries=[], feed=feedparser.FeedParserDict())
+    else:
+        feed = feedparser.parse(response.content, response_headers=dict(response.headers))
+    return set_feed_response_fields(feed, response)
+
+
+def fetch_feed_document_fast(
+    feed_url: str,
+    feed_cache: Optional[Dict[str, Any]] = None,
+    config: Optional[Dict[str, Any]] = None,
+    feed_stats: Optional[Dict[str, Any]] = None,
+) -> Any:
+    """
+    Fast-path counterpart of fetch_feed_document.
+
+    The body is parsed with parse_feed_document_fast and only re-parsed
+    by feedparser when it is malformed (no second download). feed_stats
+    records the 'parser' used and 'parse_seconds'; with
+    `feed_parser_compare` the body is also timed through feedparser and
+    'parse_speedup' records how many times faster the fast path was.
+
+    Args:
+        feed_url: RSS feed URL
+        feed_cache: Optional conditional GET cache
+        config: Optional configuration dictionary
+        feed_stats: Optional dictionary that receives parser stats
+
+    Returns:
+        feedparser-style result with the same status/etag/modified fields
+    """
+    stats = feed_stats if feed_stats is not None else {}
+    response = request_feed_document(feed_url, feed_cache)
+    if response.status_code == 304:
+        feed = feedparser.FeedParserDict(entries=[], feed=feedparser.FeedParserDict())
+        return set_feed_response_fields(feed, response)
+
+    content, headers = response.content, dict(response.headers)
+    started = time.perf_counter()
+    try:
+        feed = parse_feed_document_fast(content)
+    except ElementTree.ParseError as exc:
+        stats['fast_parser_fallback'] = str(exc)
+    else:
+        fast_seconds = time.perf_counter() - started
+        stats['parser'] = 'fast'
+        stats['parse_seconds'] = round(fast_seconds, 4)
+        if (config or {}).get('feed_parser_compare'):
+            started = time.perf_counter()
+            feedparser.parse(content, response_headers=headers)
+            stats['parse_speedup'] = round((time.perf_counter() - started) / max(fast_seconds, 1e-6), 1)
+        return set_feed_response_fields(feed, response)
+
+    started = time.perf_counter()
+    feed = feedparser.parse(content, response_headers=headers)
+    stats['parser'] = 'feedparser'
+    stats['parse_seconds'] = round(time.perf_counter() - started, 4)
+    return set_feed_response_fields(feed, response)
+
+
+STREAM_ITEM_TAGS = {'item', 'entry'}
+FEED_ROOT_TAGS = {'rss', 'feed', 'RDF'}
+STREAM_DATE_TAGS = ('published', 'pubDate', 'date', 'issued', 'updated', 'modified')
+STREAM_CHUNK_SIZE = 64 * 1024
+RENDER_RESERVE_SECONDS = 15
+TRANSIENT_HTTP_STATUSES = {429, 500, 502, 503, 504}
+FEED_HEALTH_SMOOTHING = 0.3
+POLL_SLACK_FRACTION = 0.1
+DAEMON_MIN_SLEEP_SECONDS = 60
+
+
+def get_local_tag(tag: str) -> str:
+    """Strip an XML namespace from an element tag."""
+    return tag.rsplit('}', 1)[-1] if isinstance(tag, str) else ''
+
+
+def parse_feed_date(value: Optional[str]) -> Optional[datetime]:
+    """Parse an RFC 822 (RSS) or ISO 8601 (Atom/Dublin Core) date to UTC."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def get_xhtml_markup(element: Any) -> str:
+    """
+    Serialize the inner markup of an Atom type="xhtml" text construct.
+
+    Like feedparser, the wrapping XHTML <div> is dropped and tags lose
+    their namespace, so summaries read the same whichever parser ran.
+    """
+    container = element
+    children = list(element)
+    if len(children) == 1 and get_local_tag(children[0].tag) == 'div' and not (element.text or '').strip():
+        container = children[0]
+    for node in container.iter():
+        node.tag = get_local_tag(node.tag)
+    parts = [html.escape(container.text or '', quote=False)]
+    parts.extend(ElementTree.tostring(child, encoding='unicode') for child in container)
+    return ''.join(parts).strip()
+
+
+def build_streamed_item(element: Any) -> Any:
+    """Convert an RSS <item> or Atom <entry> element into a feedparser-style entry."""
+    fields: Dict[str, str] = {}
+    link = None
+    for child in element:
+        name = get_local_tag(child.tag)
+        if name == 'link':
+            href = child.get('href')
+            if href and child.get('rel', 'alternate') == 'alternate':
+                link = link or href
+            elif not href and (child.text or '').strip():
+                link = link or child.text.strip()
+            continue
+        if name in fields:
+            continue
+        if child.get('type') == 'xhtml':
+            fields[name] = get_xhtml_markup(child)
+        elif child.text:
+            fields[name] = child.text.strip()
+
+    item = feedparser.FeedParserDict()
+    if fields.get('title') is not None:
+        item['title'] = fields['title']
+    if link:
+        item['link'] = link
+    summary = fields.get('description') or fields.get('summary') or fields.get('content')
+    if summary is not None:
+        item['summary'] = summary
+    for tag in STREAM_DATE_TAGS:
+        published = parse_feed_date(fields.get(tag))
+        if published:
+            item['published_parsed'] = published.timetuple()
+            break
+    return item
+
+
+def iter_streamed_feed_items(
+    chunks: Any,
+    feed_info: Dict[str, Any],
+    cutoff: Optional[datetime] = None,
+    stats: Optional[Dict[str, Any]] = None,
+):
+    """
+    Incrementally parse RSS/Atom bytes and yield entries one at a time.
+
+    Each item element is released once converted, so memory stays flat
+    however large the document is. Items dated at or before `cutoff` are
+    skipped. Once at least two dated items have confirmed newest-first
+    order (and none contradicted it), the first out-of-window item ends the
+    parse early; a stale first item or an oldest-first feed is read to the
+    end. Malformed XML, or a root element other than RSS/Atom/RDF, raises
+    ElementTree.ParseError.
+
+    Args:
+        chunks: Iterable of raw document byte chunks
+        feed_info: Dictionary that receives the feed-level 'title'
+        cutoff: Optional age-window cutoff (see get_age_cutoff)
+        stats: Optional dictionary that receives 'dropped_age' and 'stream_stopped_early'
+
+    Yields:
+        feedparser-style entries (title, link, summary, published_parsed)
+    """
+    stats = stats if stats is not None else {}
+    parser = ElementTree.XMLPullParser(events=('start', 'end'))
+    path: List[Any] = []
+    previous_date: Optional[datetime] = None
+    newest_first = True
+    descending_pairs = 0
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        parser.feed(chunk)
+        for event, element in parser.read_events():
+            if event == 'start':
+                if not path and get_local_tag(element.tag) not in FEED_ROOT_TAGS:
+                    raise ElementTree.ParseError(f"not an RSS/Atom document: <{get_local_tag(element.tag)}>")
+                path.append(element)
+                continue
+            path.pop()
+            name = get_local_tag(element.tag)
+            if name == 'title' and 'title' not in feed_info and path and \
+                    get_local_tag(path[-1].tag) in ('channel', 'feed'):
+                feed_info['title'] = (element.text or '').strip()
+            if name not in STREAM_ITEM_TAGS:
+                continue
+
+            item = build_streamed_item(element)
+            element.clear()
+            if path:
+                path[-1].remove(element)
+
+            published = get_entry_published_date(item)
+            order_confirmed = newest_first and descending_pairs >= 1
+            if published:
+                if previous_date is not None:
+                    if published > previous_date:
+                        newest_first = False
+                    else:
+                        descending_pairs += 1
+                previous_date = published
+            if is_outside_age_window(published, cutoff):
+                stats['dropped_age'] = stats.get('dropped_age', 0) + 1
+                if order_confirmed and newest_first:
+                    stats['stream_stopped_early'] = True
+                    return
+                continue
+            yield item
+    parser.close()
+
+
+def uses_streaming_parser(feed_url: str, config: Optional[Dict[str, Any]]) -> bool:
+    """Check whether a feed is configured for the streaming XML parser."""
+    config = config or {}
+    return config.get('feed_parser') == 'streaming' or feed_url in (config.get('streaming_feeds') or [])
+
+
+def uses_fast_parser(feed_url: str, config: Optional[Dict[str, Any]]) -> bool:
+    """Check whether a downloaded feed is parsed with the fast path before feedparser."""
+    return (config or {}).get('feed_parser') == 'fast' and not uses_streaming_parser(feed_url, config)
+
+
+def parse_feed_document_fast(content: bytes) -> Any:
+    """
+    Parse a well-formed RSS/Atom document with the standard library's XML parser.
+
+    Only the fields the pipeline reads are extracted (feed title; item
+    title, link, summary/description and published/updated date), which
+    avoids feedparser's normalisation and sanitising work.
+
+    Args:
+        content: Raw document bytes
+
+    Returns:
+        feedparser-style result with 'feed' and 'entries'
+
+    Raises:
+        ElementTree.ParseError: The document is malformed or not RSS/Atom
+    """
+    feed_info = feedparser.FeedParserDict()
+    entries = list(iter_streamed_feed_items([content], feed_info))
+    return feedparser.FeedParserDict(entries=entries, feed=feed_info)
+
+
+def iter_chunks_until_deadline(chunks: Any, deadline: Optional[float]) -> Iterator[bytes]:
+    """Yield response body chunks, raising DeadlineExceeded once the run deadline passes."""
+    for chunk in chunks:
+        if deadline is not None and time.monotonic() >= deadline:
+            raise DeadlineExceeded("Run deadline passed while reading the response body")
+        yield chunk
+
+
+def fetch_feed_document_streaming(
+    feed_url: str,
+    feed_cache: Optional[Dict[str, Any]] = None,
+    cutoff: Optional[datetime] = None,
+    feed_stats: Optional[Dict[str, Any]] = None,
+) -> Any:
+    """
+    Streaming counterpart of fetch_feed_document.
+
+    The response body is read in chunks and parsed incrementally; only
+    entries inside the age window are kept, and reading stops as soon as
+    a newest-first feed passes the cutoff.
+
+    Args:
+        feed_url: RSS feed URL
+        feed_cache: Optional conditional GET cache
+        cutoff: Optional age-window cutoff (see get_age_cutoff)
+        feed_stats: Optional dictionary that receives streaming counters
+
+    Returns:
+        feedparser-style result with the same status/etag/modified fields
+    """
+    response = request_feed_document(feed_url, feed_cache, stream=True)
+    feed_info = feedparser.FeedParserDict()
+    try:
+        if response.status_code == 304:
+            entries = []
+        else:
+            response.raise_for_status()
+            chunks = response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+            entries = list(iter_streamed_feed_items(
+                iter_chunks_until_deadline(chunks, get_http_client().deadline),
+                feed_info,
+                cutoff=cutoff,
+                stats=feed_stats,
+            ))
+    finally:
+        response.close()
+
+    feed = feedparser.FeedParserDict(entries=entries, feed=feed_info)
+    return set_feed_response_fields(feed, response)
+
+
+def load_feed_document(
+    feed_url: str,
+    config: Optional[Dict[str, Any]] = None,
+    feed_cache: Optional[Dict[str, Any]] = None,
+    feed_stats: Optional[Dict[str, Any]] = None,
+) -> Any:
+    """Fetch a feed with the configured parser, falling back to feedparser on malformed XML."""
+    if uses_fast_parser(feed_url, config):
+        return fetch_feed_document_fast(feed_url, feed_cache, config, feed_stats)
+    if not uses_streaming_parser(feed_url, config):
+        if feed_stats is not None:
+            feed_stats['parser'] = 'feedparser'
+        return fetch_feed_document(feed_url, feed_cache)
+    try:
+        feed = fetch_feed_document_streaming(feed_url, feed_cache, get_age_cutoff(config), feed_stats)
+    except ElementTree.ParseError as exc:
+        print(f"Streaming parse failed for {feed_url} ({exc}); using feedparser", file=sys.stderr)
+        if feed_stats is not None:
+            feed_stats.pop('dropped_age', None)
+            feed_stats.pop('stream_stopped_early', None)
+            feed_stats['parser'] = 'feedparser'
+        return fetch_feed_document(feed_url, feed_cache)
+    if feed_stats is not None:
+        feed_stats['parser'] = 'streaming'
+    return feed
+
+
+def load_feed_document_with_retries(
+    feed_url: str,
+    config: Optional[Dict[str, Any]] = None,
+    feed_cache: Optional[Dict[str, Any]] = None,
+    feed_stats: Optional[Dict[str, Any]] = None,
+) -> Any:
+    """
+    Fetch a feed, retrying transient failures with exponential backoff.
+
+    Connection errors, timeouts and 429/5xx answers are retried up to
+    `feed_retries` times, waiting `feed_retry_backoff_seconds` doubled on
+    each attempt (never past the run deadline). The final error status
+    response is returned as-is; retries are counted in stats['retries'].
+    """
+    stats = feed_stats if feed_stats is not None else {}
+    retries, backoff = get_feed_retry_settings(config)
+    attempt = 0
+    while True:
+        feed, error = None, None
+        try:
+            feed = load_feed_document(feed_url, config, feed_cache, stats)
+        except Exception as exc:
+            error = exc
+
+        delay = get_feed_retry_delay(feed_url, feed, error, attempt, retries, backoff, stats)
+        if delay is None:
+            if error is not None:
+                raise error
+            return feed
+        attempt += 1
+        time.sleep(delay)
+
+
+def get_cached_feed_entries(
+    feed: Any,
+    feed_url: str,
+    feed_cache: Optional[Dict[str, Any]],
+) -> Optional[List[Dict[str, Any]]]:
+    """Return cached entries when the server answered 304 Not Modified, else None."""
+    if feed_cache is None or getattr(feed, 'status', None) != 304:
+        return None
+    cached = feed_cache.get(feed_url)
+    if not cached:
+        return None
+    return [dict(entry) for entry in cached.get('entries', [])]
+
+
+def get_scheduled_feed_entries(
+    feed_cache: Optional[Dict[str, Any]],
+    feed_url: str,
+    config: Optional[Dict[str, Any]],
+    feed_stats: Dict[str, Any],
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Serve a feed that is not due for polling from the feed cache.
+
+    Returns None when nothing is cached, in which case the feed is polled.
+    """
+    cached = (feed_cache or {}).get(feed_url)
+    if not cached:
+        return None
+    entries = drop_entries_outside_age_window(
+        [dict(entry) for entry in cached.get('entries', [])],
+        get_age_cutoff(config),
+        feed_stats,
+    )
+    feed_stats['not_due'] = True
+    feed_stats['cache'] = 'scheduled'
+    feed_stats['entries'] = len(entries)
+    return entries
+
+
+def update_feed_cache(
+    feed_cache: Optional[Dict[str, Any]],
+    feed_url: str,
+    feed: Any,
+    entries: List[Dict[str, Any]],
+    keep_unvalidated: bool = False,
+):
+    """Store a freshly downloaded feed's validators and parsed entries.
+
+    Feeds without ETag/Last-Modified are only kept when `keep_unvalidated`
+    is set (adaptive polling serves them from the cache between polls).
+    """
+    if feed_cache is None or (getattr(feed, 'status', None) or 0) >= 400:
+        return
+    etag = getattr(feed, 'etag', None)
+    modified = getattr(feed, 'modified', None)
+    if not etag and not modified and not keep_unvalidated:
+        feed_cache.pop(feed_url, None)
+        return
+    feed_cache[feed_url] = {
+        'etag': etag,
+        'modified': modified,
+        'fetched_at': utc_now().isoformat(),
+        'entries': [dict(entry) for entry in entries],
+    }
+
+
+def load_feed_health(health_path: str = FEED_HEALTH_PATH) -> Dict[str, Any]:
+    """
+    Load the persisted feed health registry.
+
+    Args:
+        health_path: Path to feed health file
+
+    Returns:
+        Mapping of feed URL to its health record
+    """
+    if os.path.exists(health_path):
+        try:
+            with open(health_path, 'r') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                return data
+        except (OSError, ValueError) as exc:
+            print(f"Ignoring unreadable feed health registry {health_path}: {exc}", file=sys.stderr)
+    return {}
+
+
+def save_feed_health(feed_health: Dict[str, Any], health_path: str = FEED_HEALTH_PATH):
+    """
+    Save the feed health registry.
+
+    Args:
+        feed_health: Mapping of feed URL to its health record
+        health_path: Path to feed health file
+    """
+    os.makedirs(os.path.dirname(health_path), exist_ok=True)
+
+    with open(health_path, 'w') as f:
+        json.dump(feed_health, f, indent=2, sort_keys=True)
+
+
+def get_circuit_breaker_settings(config: Optional[Dict[str, Any]]) -> Dict[str, float]:
+    """Read the feed circuit breaker threshold and re-probe interval from configuration."""
+    config = config or {}
+    return {
+        "threshold": max(1, int(config.get('feed_circuit_breaker_threshold', 3) or 3)),
+        "reprobe_days": float(config.get('feed_circuit_reprobe_days', 14) or 14),
+    }
+
+
+def is_feed_circuit_open(record: Optional[Dict[str, Any]], now: Optional[datetime] = None) -> bool:
+    """Check whether a feed's circuit breaker is open (skip until its next re-probe)."""
+    next_probe_at = (record or {}).get('next_probe_at')
+    if not next_probe_at:
+        return False
+    try:
+        return (now or utc_now()) < datetime.fromisoformat(next_probe_at)
+    except (TypeError, ValueError):
+        return False
+
+
+def smooth(previous: Optional[float], value: float) -> float:
+    """Exponentially weighted moving average used for feed health figures."""
+    if previous is None:
+        return value
+    return round(previous + FEED_HEALTH_SMOOTHING * (value - previous), 3)
+
+
+def is_feed_failure(stats: Dict[str, Any]) -> bool:
+    """
+    Whether a feed's run failed: fetching raised, or the server answered
+    with an error status and nothing was ingested.
+
+    Skipped, not-due and deadline-cut runs are not failures. Both the
+    failed_feeds diagnostics and the health registry use this definition.
+    """
+    if stats.get('skipped') or stats.get('timed_out') or stats.get('not_due'):
+        return False
+    status = stats.get('status') or 0
+    return 'error' in stats or (status >= 400 and not stats.get('fetched'))
+
+
+def update_feed_health(
+    feed_health: Dict[str, Any],
+    feed_url: str,
+    stats: Dict[str, Any],
+    config: Optional[Dict[str, Any]] = None,
+    now: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """
+    Record one run's outcome for a feed in the health registry.
+
+    A run fails as defined by is_feed_failure. After
+    `feed_circuit_breaker_threshold` consecutive failed runs the circuit
+    opens: the feed is skipped until `next_probe_at`, an interval of
+    `feed_circuit_reprobe_days` that doubles with each further failed
+    re-probe (up to 8x). One successful run closes it. Skipped, not-due
+    and deadline-cut feeds leave the record's counts unchanged.
+    Successful runs also reschedule the feed's next poll (see
+    schedule_next_poll).
+
+    Args:
+        feed_health: Feed health registry, updated in place
+        feed_url: Feed URL
+        stats: Per-feed counters from fetch_feed_entries
+        config: Optional configuration dictionary
+        now: Optional current time (defaults to UTC now)
+
+    Returns:
+        The updated health record
+    """
+    now = now or utc_now()
+    record = feed_health.setdefault(feed_url, {'consecutive_failures': 0, 'total_failures': 0, 'runs': 0})
+
+    if stats.get('skipped'):
+        record['last_status'] = 'skipped'
+        return record
+    if stats.get('timed_out'):
+        record['last_status'] = 'timed_out'
+        return record
+    if stats.get('not_due'):
+        return record
+
+    record['runs'] = record.get('runs', 0) + 1
+    record['last_attempt'] = now.isoformat()
+    if stats.get('latency_seconds') is not None:
+        record['latency_seconds'] = smooth(record.get('latency_seconds'), stats['latency_seconds'])
+
+    if is_feed_failure(stats):
+        status = stats.get('status') or 0
+        record['consecutive_failures'] = record.get('consecutive_failures', 0) + 1
+        record['total_failures'] = record.get('total_failures', 0) + 1
+        record['last_status'] = 'error'
+        record['last_error'] = stats.get('error') or f"HTTP {status}"
+        settings = get_circuit_breaker_settings(config)
+        excess_failures = record['consecutive_failures'] - settings["threshold"]
+        if excess_failures >= 0:
+            interval = timedelta(days=settings["reprobe_days"] * 2 ** min(excess_failures, 3))
+            record['next_probe_at'] = (now + interval).isoformat()
+        return record
+
+    record['consecutive_failures'] = 0
+    record['last_status'] = 'ok'
+    record['last_success'] = now.isoformat()
+    record['last_entries'] = stats.get('fetched', 0)
+    record['avg_entries'] = smooth(record.get('avg_entries'), stats.get('fetched', 0))
+    record.pop('last_error', None)
+    record.pop('next_probe_at', None)
+    schedule_next_poll(record, stats.get('update_interval_hours'), config, now)
+    return record
+
+
+def record_feed_yield(
+    feed_health: Dict[str, Any],
+    feed_stats: Dict[str, Dict[str, Any]],
+    filtered_entries: List[Dict[str, Any]],
+    selected_entries: List[Dict[str, Any]],
+):
+    """
+    Record how many of each feed's entries survived filtering and made the ranking.
+
+    Only feeds fetched successfully this run are updated, so skipped,
+    failed or deadline-cut feeds are not penalised with a zero yield.
+
+    Args:
+        feed_health: Feed health registry, updated in place
+        feed_stats: Per-feed counters from fetch_and_parse_feeds
+        filtered_entries: Entries remaining after filter_entries
+        selected_entries: Entries in the final top-N ranking
+    """
+    filtered_counts: Dict[str, int] = {}
+    for entry in filtered_entries:
+        filtered_counts[entry.get('source')] = filtered_counts.get(entry.get('source'), 0) + 1
+    selected_counts: Dict[str, int] = {}
+    for entry in selected_entries:
+        selected_counts[entry.get('source')] = selected_counts.get(entry.get('source'), 0) + 1
+
+    for feed_url, stats in feed_stats.items():
+        record = feed_health.get(feed_url)
+        if record is None or record.get('last_status') != 'ok' or stats.get('skipped') or stats.get('timed_out'):
+            continue
+        filtered = filtered_counts.get(feed_url, 0)
+        selected = selected_counts.get(feed_url, 0)
+        record['last_filtered'] = filtered
+        record['last_selected'] = selected
+        record['avg_filtered'] = smooth(record.get('avg_filtered'), filtered)
+        record['avg_selected'] = smooth(record.get('avg_selected'), selected)
+        record['zero_yield_runs'] = 0 if selected else record.get('zero_yield_runs', 0) + 1
+
+
+def get_feed_expected_value(record: Optional[Dict[str, Any]], prior: Tuple[float, float]) -> Tuple[float, float]:
+    """Expected (selected, filtered) yield of a feed; feeds without history get the prior."""
+    if not record or record.get('avg_selected') is None:
+        return prior
+    return record['avg_selected'], record.get('avg_filtered') or 0.0
+
+
+def prioritize_feeds(
+    feed_urls: List[str],
+    feed_health: Optional[Dict[str, Any]],
+) -> List[str]:
+    """
+    Order feeds by expected yield, highest first.
+
+    Feeds are ranked by smoothed entries in the final ranking, then by
+    entries surviving filtering. Feeds without yield history are placed at
+    the average of the known feeds so new sources are measured promptly
+    without displacing proven ones. Ties keep feeds.txt order.
+
+    Args:
+        feed_urls: Feed URLs in configured order
+        feed_health: Optional feed health registry
+
+    Returns:
+        Feed URLs in fetch order
+    """
+    if not feed_health:
+        return list(feed_urls)
+    known = [
+        (record['avg_selected'], record.get('avg_filtered') or 0.0)
+        for record in (feed_health.get(feed_url) for feed_url in dict.fromkeys(feed_urls))
+        if record and record.get('avg_selected') is not None
+    ]
+    if known:
+        prior = (sum(value[0] for value in known) / len(known), sum(value[1] for value in known) / len(known))
+    else:
+        prior = (0.0, 0.0)
+    return sorted(
+        feed_urls,
+        key=lambda feed_url: tuple(-value for value in get_feed_expected_value(feed_health.get(feed_url), prior)),
+    )
+
+
+def is_zero_yield_feed(
+    record: Optional[Dict[str, Any]],
+    config: Optional[Dict[str, Any]],
+    now: Optional[datetime] = None,
+) -> bool:
+    """
+    Check whether a chronically zero-yield feed should be skipped this run.
+
+    Enabled by `skip_zero_yield_runs` (runs in a row without a ranked
+    entry). Skipped feeds are still re-probed every
+    `feed_circuit_reprobe_days`, so a source that becomes useful again
+    is picked back up.
+    """
+    threshold = int((config or {}).get('skip_zero_yield_runs', 0) or 0)
+    if threshold <= 0 or not record or record.get('zero_yield_runs', 0) < threshold:
+        return False
+    try:
+        last_attempt = datetime.fromisoformat(record['last_attempt'])
+    except (KeyError, TypeError, ValueError):
+        return False
+    reprobe_interval = timedelta(days=get_circuit_breaker_settings(config)["reprobe_days"])
+    return (now or utc_now()) - last_attempt < reprobe_interval
+
+
+def uses_adaptive_polling(config: Optional[Dict[str, Any]]) -> bool:
+    """Check whether feeds are polled on their own estimated schedule."""
+    return bool((config or {}).get('adaptive_polling', False))
+
+
+def get_polling_bounds(config: Optional[Dict[str, Any]]) -> Tuple[float, float]:
+    """Read the minimum and maximum poll interval (hours) from configuration."""
+    config = config or {}
+    try:
+        min_hours = float(config.get('poll_min_hours', 1) or 1)
+        max_hours = float(config.get('poll_max_hours', 168) or 168)
+    except (ValueError, TypeError):
+        min_hours, max_hours = 1.0, 168.0
+    return min_hours, max(min_hours, max_hours)
+
+
+def estimate_update_interval_hours(entries: List[Dict[str, Any]]) -> Optional[float]:
+    """
+    Estimate how often a feed publishes from its entries' published dates.
+
+    Returns the median gap between consecutive distinct publication times,
+    or None when fewer than two dated entries are available.
+    """
+    timestamps = set()
+    for entry in entries:
+        try:
+            timestamps.add(datetime.fromisoformat(entry['published']).timestamp())
+        except (KeyError, TypeError, ValueError):
+            continue
+    ordered = sorted(timestamps)
+    gaps = sorted(later - earlier for earlier, later in zip(ordered, ordered[1:]))
+    if not gaps:
+        return None
+    return round(gaps[len(gaps) // 2] / 3600, 3)
+
+
+def schedule_next_poll(
+    record: Dict[str, Any],
+    observed_interval_hours: Optional[float],
+    config: Optional[Dict[str, Any]],
+    now: datetime,
+):
+    """
+    Update a health record's update-interval estimate and next poll time.
+
+    Observed intervals are smoothed into `update_interval_hours`; a poll
+    that yields too few dated entries doubles the previous estimate. The
+    next poll is one estimated interval away, clamped to
+    [poll_min_hours, poll_max_hours].
+    """
+    min_hours, max_hours = get_polling_bounds(config)
+    previous = record.get('update_interval_hours')
+    if observed_interval_hours is not None:
+        interval = smooth(previous, observed_interval_hours)
+    else:
+        interval = (previous or min_hours) * 2
+    interval = min(max(interval, min_hours), max_hours)
+    record['update_interval_hours'] = interval
+    record['next_poll_at'] = (now + timedelta(hours=interval)).isoformat()
+
+
+def is_feed_due(
+    record: Optional[Dict[str, Any]],
+    now: Optional[datetime] = None,
+) -> bool:
+    """
+    Check whether a feed's next scheduled poll has arrived.
+
+    A slack of POLL_SLACK_FRACTION of the interval keeps fixed-cadence runs
+    (such as the weekly workflow) from missing a poll by a few minutes.
+    """
+    if not record or not record.get('next_poll_at'):
+        return True
+    try:
+        next_poll_at = datetime.fromisoformat(record['next_poll_at'])
+    except (TypeError, ValueError):
+        return True
+    slack = timedelta(hours=float(record.get('update_interval_hours') or 0) * POLL_SLACK_FRACTION)
+    return (now or utc_now()) >= next_poll_at - slack
+
+
+def get_next_feed_poll_at(feed_health: Dict[str, Any], feed_urls: List[str]) -> Optional[datetime]:
+    """Return the earliest scheduled poll time across feeds, if any feed has one."""
+    poll_times = []
+    for feed_url in feed_urls:
+        try:
+            poll_times.append(datetime.fromisoformat(feed_health[feed_url]['next_poll_at']))
+        except (KeyError, TypeError, ValueError):
+            continue
+    return min(poll_times) if poll_times else None
+
+
+def get_feed_retry_settings(config: Optional[Dict[str, Any]]) -> Tuple[int, float]:
+    """Read the retry count and base backoff (seconds) for transient feed errors."""
+    config = config or {}
+    try:
+        retries = max(0, int(config.get('feed_retries', 2)))
+        backoff = max(0.0, float(config.get('feed_retry_backoff_seconds', 1.0)))
+    except (ValueError, TypeError):
+        retries, backoff = 2, 1.0
+    return retries, backoff
+
+
+def is_transient_feed_error(exc: Exception) -> bool:
+    """Check whether a fetch error is worth retrying (connection, timeout, 429/5xx)."""
+    if isinstance(exc, DeadlineExceeded):
+        return False
+    if isinstance(exc, requests.HTTPError):
+        return getattr(exc.response, 'status_code', None) in TRANSIENT_HTTP_STATUSES
+    return isinstance(exc, (requests.ConnectionError, requests.Timeout))
+
+
+def get_feed_retry_delay(
+    feed_url: str,
+    feed: Any,
+    error: Optional[Exception],
+    attempt: int,
+    retries: int,
+    backoff: float,
+    stats: Dict[str, Any],
+) -> Optional[float]:
+    """
+    Decide whether a feed fetch attempt should be retried.
+
+    Returns the exponential backoff to wait before the next attempt (also
+    counted in stats['retries']), or None when the outcome is final: not
+    transient, retries exhausted, or the wait would pass the run deadline.
+    """
+    if error is not None:
+        transient = is_transient_feed_error(error)
+    else:
+        transient = getattr(feed, 'status', None) in TRANSIENT_HTTP_STATUSES
+    if not transient or attempt >= retries:
+        return None
+    delay = backoff * 2 ** attempt
+    deadline = get_http_client().deadline
+    if deadline is not None and time.monotonic() + delay >= deadline:
+        return None
+    stats['retries'] = stats.get('retries', 0) + 1
+    reason = error if error is not None else f"HTTP {getattr(feed, 'status', '')}"
+    print(f"Retrying feed {feed_url} in {delay:.1f}s (attempt {attempt + 2}): {reason}")
+    return delay
+
+
+def fetch_feed_entries(
+    feed_url: str,
+    config: Optional[Dict[str, Any]] = None,
+    feed_cache: Optional[Dict[str, Any]] = None,
+    feed_stats: Optional[Dict[str, Any]] = None,
+    last_modified_cache: Optional[Dict[str, Any]] = None,
+    ungm_notice_cache: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Fetch and parse entries from a single RSS feed.
+
+    Errors are isolated to the feed: any exception is logged and recorded
+    in the stats as 'error', and the entries parsed before it (if any) are
+    still returned, so other feeds are unaffected. Items already
+    known to be older than `max_age_days` are dropped before any entry is
+    built or probed (counted as 'dropped_age'). Undated items are collected
+    first and their Last-Modified probes run as one batch.
+
+    Args:
+        feed_url: RSS feed URL
+        config: Optional configuration dictionary
+        feed_cache: Optional conditional GET cache, updated in place
+        feed_stats: Optional dictionary that receives per-feed counters
+        last_modified_cache: Optional Last-Modified probe cache, updated in place
+        ungm_notice_cache: Optional UNGM notice cache, updated in place
+
+    Returns:
+        List of parsed entry dictionaries for this feed
+    """
+    stats = feed_stats if feed_stats is not None else {}
+    started_at = time.monotonic()
+    entries: List[Dict[str, Any]] = []
+
+    try:
+        print(f"Fetching feed: {feed_url}")
+        feed = load_feed_document_with_retries(feed_url, config, feed_cache, stats)
+        stats['status'] = getattr(feed, 'status', None)
+
+        cutoff = get_age_cutoff(config)
+
+        entries = get_cached_feed_entries(feed, feed_url, feed_cache)
+        if entries is not None:
+            entries = drop_entries_outside_age_window(entries, cutoff, stats)
+            stats['cache'] = 'hit'
+        else:
+            candidates, published_dates = get_dated_candidates(feed, cutoff, stats)
+            undated_links = [
+                entry.link for entry, published in zip(candidates, published_dates) if not published
+            ]
+            if undated_links:
+                probed = probe_last_modified_dates(undated_links, config, last_modified_cache, stats)
+                published_dates = [
+                    published or probed.get(entry.link)
+                    for entry, published in zip(candidates, published_dates)
+                ]
+
+            entries = build_dated_entries(candidates, published_dates, feed_url, feed, cutoff, stats)
+            update_feed_cache(feed_cache, feed_url, feed, entries, uses_adaptive_polling(config))
+            stats['cache'] = 'miss'
+        stats['entries'] = len(entries)
+
+        if needs_ungm_fallback(feed_url, bool(entries) or bool(feed.entries), config):
+            fallback_entries = fetch_ungm_fallback_entries(feed_url, config or {}, ungm_notice_cache, stats)
+            fallback_entries = drop_entries_outside_age_window(fallback_entries, cutoff, stats)
+            if fallback_entries:
+                print(f"UNGM fallback fetched {len(fallback_entries)} notice(s)")
+                entries.extend(fallback_entries)
+
+    except Exception as e:
+        # Entries parsed before the failure (e.g. when only the UNGM
+        # fallback failed) are kept; the error is still recorded
+        print(f"Error fetching feed {feed_url}: {e}", file=sys.stderr)
+        stats['error'] = str(e)
+        entries = entries or []
+    finally:
+        stats['latency_seconds'] = round(time.monotonic() - started_at, 3)
+
+    stats['fetched'] = len(entries)
+    stats['update_interval_hours'] = estimate_update_interval_hours(entries)
+    return entries
+
+
+def get_fetch_concurrency(config: Optional[Dict[str, Any]], feed_count: int) -> int:
+    """
+    Resolve the number of feed fetch workers from configuration.
+
+    Args:
+        config: Optional configuration dictionary
+        feed_count: Number of feeds to fetch
+
+    Returns:
+        Worker count between 1 and feed_count (1 means sequential)
+    """
+    try:
+        concurrency = int((config or {}).get('fetch_concurrency', 1) or 1)
+    except (ValueError, TypeError):
+        concurrency = 1
+    return max(1, min(concurrency, max(feed_count, 1)))
+
+
+class HostLimiter:
+    """Per-host concurrency limits for the async ingestion mode.
+
+    Each host gets its own asyncio semaphore, so a slow or strict host
+    (e.g. UNGM) cannot monopolize the event loop's outstanding requests.
+    """
+
+    def __init__(self, per_host_limit: int = 4):
+        self.per_host_limit = max(1, per_host_limit)
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def for_url(self, url: str) -> asyncio.Semaphore:
+        """Return the semaphore guarding the host of a URL."""
+        host = urlparse(url).netloc.lower()
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._semaphores[host]
+
+
+async def run_limited(limiter: HostLimiter, url: str, func, *args, **kwargs):
+    """Run a blocking network call for `url` under its host's concurrency limit."""
+    async with limiter.for_url(url):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+
+async def load_feed_document_with_retries_async(
+    feed_url: str,
+    config: Optional[Dict[str, Any]],
+    limiter: HostLimiter,
+    feed_cache: Optional[Dict[str, Any]] = None,
+    feed_stats: Optional[Dict[str, Any]] = None,
+) -> Any:
+    """Async counterpart of load_feed_document_with_retries (backoff waits free the host slot)."""
+    stats = feed_stats if feed_stats is not None else {}
+    retries, backoff = get_feed_retry_settings(config)
+    attempt = 0
+    while True:
+        feed, error = None, None
+        try:
+            feed = await run_limited(limiter, feed_url, load_feed_document, feed_url, config, feed_cache, stats)
+        except Exception as exc:
+            error = exc
+
+        delay = get_feed_retry_delay(feed_url, feed, error, attempt, retries, backoff, stats)
+        if delay is None:
+            if error is not None:
+                raise error
+            return feed
+        attempt += 1
+        await asyncio.sleep(delay)
+
+
+async def fetch_ungm_fallback_entries_async(
+    feed_url: str,
+    config: Dict[str, Any],
+    limiter: HostLimiter,
+    notice_cache: Optional[Dict[str, Any]] = None,
+    feed_stats: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """Async counterpart of fetch_ungm_fallback_entries.
+
+    Search pages are walked in order (paging stops on a short page), then
+    all notice detail pages are fetched concurrently.
+    """
+    if not config.get("ungm_fallback_enabled", True):
+        return []
+
+    if config.get("ungm_crawler_enabled"):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(crawl_ungm_notices, feed_url, config, notice_cache, feed_stats),
+        )
+
+    settings = get_ungm_search_settings(config)
+    search_url = f"{UNGM_NOTICE_ROOT}/Search"
+    filters = build_ungm_search_filters(config)
+    search_stats: Dict[str, Any] = {}
+    discovered_urls: List[str] = []
+    for page_index in range(max(settings["search_pages"], 1)):
+        links = await run_limited(
+            limiter,
+            search_url,
+            fetch_ungm_search_page,
+            page_index,
+            page_size=settings["search_page_size"],
+            filters=filters,
+            search_stats=search_stats if page_index == 0 else None,
+        )
+        if not links:
+            break
+        discovered_urls.extend(links)
+        if len(links) < settings["search_page_size"]:
+            break
+
+    stats = feed_stats if feed_stats is not None else {}
+    await run_limited(
+        limiter,
+        search_url,
+        record_ungm_pushdown_savings,
+        config,
+        filters,
+        search_stats.get('total'),
+        stats,
+    )
+    unique_urls = collect_ungm_notice_urls(feed_url, config, list(dict.fromkeys(discovered_urls)))
+    cutoff = get_age_cutoff(config)
+    cached: Dict[str, Optional[Dict[str, Any]]] = {}
+    for notice_url in unique_urls:
+        if is_cached_ungm_notice_outside_age_window(notice_cache, notice_url, cutoff):
+            stats['dropped_age'] = stats.get('dropped_age', 0) + 1
+            cached[notice_url] = None
+            continue
+        cache_hit, entry = lookup_ungm_notice_cache(
+            notice_cache,
+            notice_url,
+            feed_url,
+            settings["revalidate_days"],
+        )
+        if cache_hit:
+            cached[notice_url] = entry
+    pending = [notice_url for notice_url in unique_urls if notice_url not in cached]
+    stats['ungm_notice_cache_hits'] = stats.get('ungm_notice_cache_hits', 0) + sum(
+        1 for entry in cached.values() if entry is not None
+    )
+    stats['ungm_notice_downloads'] = stats.get('ungm_notice_downloads', 0) + len(pending)
+
+    results = await asyncio.gather(*(
+        run_limited(
+            limiter,
+            notice_url,
+            fetch_ungm_notice_entry,
+            notice_url,
+            source_url=feed_url,
+            notice_cache=notice_cache,
+        )
+        for notice_url in pending
+    ))
+    cached.update(zip(pending, results))
+    return [cached[notice_url] for notice_url in unique_urls if cached[notice_url]]
+
+
+async def fetch_feed_entries_async(
+    feed_url: str,
+    config: Optional[Dict[str, Any]],
+    limiter: HostLimiter,
+    feed_cache: Optional[Dict[str, Any]] = None,
+    feed_stats: Optional[Dict[str, Any]] = None,
+    last_modified_cache: Optional[Dict[str, Any]] = None,
+    ungm_notice_cache: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Async counterpart of fetch_feed_entries.
 
+    Last-Modified probes for undated entries that are not already cached
+    are issued concurrently on the event loop.
 
-def build_ungm_notice_url(raw_value: Any) -> Optional[str]:
-    """Normalize a notice id or URL into a full UNGM notice URL."""
-    if raw_value is None:
-        return None
+    Args:
+        feed_url: RSS feed URL
+        config: Optional configuration dictionary
+        limiter: Per-host concurrency limiter shared by the whole run
+        feed_cache: Optional conditional GET cache, updated in place
+        feed_stats: Optional dictionary that receives per-feed counters
+        last_modified_cache: Optional Last-Modified probe cache, updated in place
+        ungm_notice_cache: Optional UNGM notice cache, updated in place
 
-    value = str(raw_value).strip()
-    if not value:
-        return None
+    Returns:
+        List of parsed entry dictionaries for this feed
+    """
+    stats = feed_stats if feed_stats is not None else {}
+    started_at = time.monotonic()
+    entries: List[Dict[str, Any]] = []
 
-    if value.startswith("http"):
-        match = re.search(r"/Public/Notice/(\d+)", value, re.IGNORECASE)
-        if match:
-            return f"{UNGM_NOTICE_ROOT}/{match.group(1)}"
-        return None
+    try:
+        print(f"Fetching feed: {feed_url}")
+        feed = await load_feed_document_with_retries_async(feed_url, config, limiter, feed_cache, stats)
+        stats['status'] = getattr(feed, 'status', None)
+
+        cutoff = get_age_cutoff(config)
+
+        entries = get_cached_feed_entries(feed, feed_url, feed_cache)
+        if entries is not None:
+            entries = drop_entries_outside_age_window(entries, cutoff, stats)
+            stats['cache'] = 'hit'
+        else:
+            candidates, published_dates = get_dated_candidates(feed, cutoff, stats)
+            undated_links = [
+                entry.link for entry, published in zip(candidates, published_dates) if not published
+            ]
+            probed, pending = lookup_cached_last_modified(
+                undated_links,
+                last_modified_cache,
+                get_last_modified_cache_ttl(config),
+            )
+            stats['last_modified_cache_hits'] = len(probed)
+            stats['last_modified_probes'] = len(pending)
+            results = await asyncio.gather(*(
+                run_limited(limiter, link, get_last_modified_from_url, link) for link in pending
+            ))
+            for link, last_modified in zip(pending, results):
+                probed[link] = last_modified
+                record_last_modified(last_modified_cache, link, last_modified)
+            published_dates = [
+                published or probed.get(entry.link)
+                for entry, published in zip(candidates, published_dates)
+            ]
+
+            entries = build_dated_entries(candidates, published_dates, feed_url, feed, cutoff, stats)
+            update_feed_cache(feed_cache, feed_url, feed, entries, uses_adaptive_polling(config))
+            stats['cache'] = 'miss'
+        stats['entries'] = len(entries)
+
+        if needs_ungm_fallback(feed_url, bool(entries) or bool(feed.entries), config):
+            fallback_entries = await fetch_ungm_fallback_entries_async(
+                feed_url,
+                config or {},
+                limiter,
+                ungm_notice_cache,
+                stats,
+            )
+            fallback_entries = drop_entries_outside_age_window(fallback_entries, cutoff, stats)
+            if fallback_entries:
+                print(f"UNGM fallback fetched {len(fallback_entries)} notice(s)")
+                entries.extend(fallback_entries)
+
+    except Exception as e:
+        # Entries parsed before the failure (e.g. when only the UNGM
+        # fallback failed) are kept; the error is still recorded
+        print(f"Error fetching feed {feed_url}: {e}", file=sys.stderr)
+        stats['error'] = str(e)
+        entries = entries or []
+    finally:
+        stats['latency_seconds'] = round(time.monotonic() - started_at, 3)
+
+    stats['fetched'] = len(entries)
+    stats['update_interval_hours'] = estimate_update_interval_hours(entries)
+    return entries
 
-    if value.isdigit():
-        return f"{UNGM_NOTICE_ROOT}/{value}"
 
-    return None
+def new_fetch_scratch(
+    feed_url: str,
+    feed_cache: Optional[Dict[str, Any]],
+    last_modified_cache: Optional[Dict[str, Any]],
+    ungm_notice_cache: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Give one feed fetch private copies of the shared state it writes to.
 
+    A fetch abandoned at the deadline keeps running in its worker thread, so
+    it must never write to the dictionaries the run persists. The copies are
+    shallow: cache records are replaced rather than changed in place, so
+    sharing them is safe. See merge_fetch_scratch.
+    """
+    scratch: Dict[str, Any] = {
+        'stats': {},
+        'feed_cache': None,
+        'last_modified_cache': None,
+        'ungm_notice_cache': None,
+    }
+    if feed_cache is not None:
+        scratch['feed_cache'] = {feed_url: feed_cache[feed_url]} if feed_url in feed_cache else {}
+    if last_modified_cache is not None:
+        scratch['last_modified_cache'] = ChainMap({}, last_modified_cache)
+    if ungm_notice_cache is not None:
+        scratch['ungm_notice_cache'] = dict(
+            ungm_notice_cache,
+            notices=dict(ungm_notice_cache.get('notices', {})),
+        )
+    return scratch
 
-def fetch_ungm_fallback_entries(feed_url: str, config: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Fetch UNGM notices using HTML/API fallback when RSS parsing is unavailable."""
-    if not config.get("ungm_fallback_enabled", True):
-        return []
 
-    notice_urls: List[str] = []
+def merge_fetch_scratch(
+    scratch: Dict[str, Any],
+    feed_url: str,
+    feed_cache: Optional[Dict[str, Any]],
+    feed_stats: Dict[str, Dict[str, Any]],
+    last_modified_cache: Optional[Dict[str, Any]],
+    ungm_notice_cache: Optional[Dict[str, Any]],
+):
+    """Fold a finished fetch's scratch state (see new_fetch_scratch) into the shared state."""
+    feed_stats[feed_url].update(scratch['stats'])
+    if feed_cache is not None:
+        if feed_url in scratch['feed_cache']:
+            feed_cache[feed_url] = scratch['feed_cache'][feed_url]
+        else:
+            feed_cache.pop(feed_url, None)
+    if last_modified_cache is not None:
+        last_modified_cache.update(scratch['last_modified_cache'].maps[0])
+    if ungm_notice_cache is not None:
+        notices = scratch['ungm_notice_cache'].pop('notices')
+        ungm_notice_cache.update(scratch['ungm_notice_cache'])
+        ungm_notice_cache.setdefault('notices', {}).update(notices)
+
+
+async def fetch_and_parse_feeds_async(
+    feed_urls: List[str],
+    config: Optional[Dict[str, Any]] = None,
+    feed_cache: Optional[Dict[str, Any]] = None,
+    feed_stats: Optional[Dict[str, Dict[str, Any]]] = None,
+    last_modified_cache: Optional[Dict[str, Any]] = None,
+    ungm_notice_cache: Optional[Dict[str, Any]] = None,
+    deadline: Optional[float] = None,
+) -> List[List[Dict[str, Any]]]:
+    """
+    Fetch and parse all feeds from a single event loop.
 
-    direct_notice_url = build_ungm_notice_url(feed_url)
-    if direct_notice_url:
-        notice_urls.append(direct_notice_url)
+    RSS downloads, UNGM search/detail pages and Last-Modified probes are all
+    scheduled on one loop and bounded per host by `per_host_concurrency`.
+    The blocking feedparser/requests calls run on the loop's default
+    executor, so the number of threads stays fixed regardless of how many
+    requests are in flight. Feeds still running at the deadline are
+    cancelled and marked 'timed_out'.
 
-    for raw_value in config.get("ungm_notice_ids", []):
-        notice_url = build_ungm_notice_url(raw_value)
-        if notice_url:
-            notice_urls.append(notice_url)
+    Args:
+        feed_urls: List of RSS feed URLs
+        config: Optional configuration dictionary
+        feed_cache: Optional conditional GET cache, updated in place
+        feed_stats: Optional mapping of feed URL to per-feed counters
+        last_modified_cache: Optional Last-Modified probe cache, updated in place
+        ungm_notice_cache: Optional UNGM notice cache, updated in place
+        deadline: Optional time.monotonic() deadline for the whole fetch stage
 
-    search_pages = int(config.get("ungm_search_pages", 1) or 1)
-    search_page_size = int(config.get("ungm_search_page_size", 15) or 15)
-    discovered_urls = fetch_ungm_notice_links(
-        max_pages=search_pages,
-        page_size=search_page_size,
-    )
-    notice_urls.extend(discovered_urls)
+    Returns:
+        One list of parsed entry dictionaries per feed, in feed order
+    """
+    try:
+        per_host_limit = int((config or {}).get('per_host_concurrency', 4) or 4)
+    except (ValueError, TypeError):
+        per_host_limit = 4
+    limiter = HostLimiter(per_host_limit)
+    stats = feed_stats if feed_stats is not None else {}
 
-    max_notices = int(config.get("ungm_max_fallback_notices", 30) or 30)
-    unique_urls = list(dict.fromkeys(notice_urls))[:max_notices]
+    scratches = [
+        new_fetch_scratch(feed_url, feed_cache, last_modified_cache, ungm_notice_cache)
+        for feed_url in feed_urls
+    ]
+    tasks = [
+        asyncio.ensure_future(fetch_feed_entries_async(
+            feed_url,
+            config,
+            limiter,
+            feed_cache=scratch['feed_cache'],
+            feed_stats=scratch['stats'],
+            last_modified_cache=scratch['last_modified_cache'],
+            ungm_notice_cache=scratch['ungm_notice_cache'],
+        ))
+        for feed_url, scratch in zip(feed_urls, scratches)
+    ]
+    pending = set()
+    if deadline is not None and tasks:
+        _, pending = await asyncio.wait(tasks, timeout=max(deadline - time.monotonic(), 0))
+        for task in pending:
+            task.cancel()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    # Executor calls of cancelled feeds may still be running; only feeds that
+    # finished in time are merged into the shared state
+    for feed_url, task, scratch in zip(feed_urls, tasks, scratches):
+        stats.setdefault(feed_url, {})
+        if task in pending:
+            stats[feed_url]['timed_out'] = True
+        else:
+            merge_fetch_scratch(scratch, feed_url, feed_cache, stats, last_modified_cache, ungm_notice_cache)
+    return [feed_entries if isinstance(feed_entries, list) else [] for feed_entries in results]
+
+
+def get_fetch_deadline(config: Optional[Dict[str, Any]], started_at: float) -> Optional[float]:
+    """
+    Resolve the fetch-stage deadline from `max_run_seconds`.
 
-    entries: List[Dict[str, Any]] = []
-    for notice_url in unique_urls:
-        entry = fetch_ungm_notice_entry(notice_url, source_url=feed_url)
-        if entry:
-            entries.append(entry)
+    A share of the budget (up to RENDER_RESERVE_SECONDS) is held back so
+    filtering, scoring and rendering still finish inside the limit.
 
-    return entries
+    Args:
+        config: Optional configuration dictionary
+        started_at: time.monotonic() value when the run started
+
+    Returns:
+        time.monotonic() deadline, or None when no run budget is configured
+    """
+    try:
+        max_run_seconds = float((config or {}).get('max_run_seconds') or 0)
+    except (ValueError, TypeError):
+        max_run_seconds = 0
+    if max_run_seconds <= 0:
+        return None
+    return started_at + max_run_seconds - min(RENDER_RESERVE_SECONDS, max_run_seconds / 10)
+
+
+def run_feed_fetches(
+    feed_urls: List[str],
+    config: Optional[Dict[str, Any]],
+    feed_cache: Optional[Dict[str, Any]],
+    feed_stats: Dict[str, Dict[str, Any]],
+    last_modified_cache: Optional[Dict[str, Any]],
+    ungm_notice_cache: Optional[Dict[str, Any]],
+    deadline: Optional[float],
+) -> List[List[Dict[str, Any]]]:
+    """Run per-feed fetches in the configured mode, marking feeds cut off by the deadline."""
+    if (config or {}).get('fetch_mode') == 'async':
+        # Not asyncio.run(): it waits for every executor thread on the way out,
+        # including calls still running for feeds cancelled at the deadline
+        loop = asyncio.new_event_loop()
+        executor = ThreadPoolExecutor()
+        loop.set_default_executor(executor)
+        try:
+            return loop.run_until_complete(fetch_and_parse_feeds_async(
+                feed_urls,
+                config,
+                feed_cache,
+                feed_stats,
+                last_modified_cache,
+                ungm_notice_cache,
+                deadline,
+            ))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    concurrency = get_fetch_concurrency(config, len(feed_urls))
+
+    scratches = [
+        new_fetch_scratch(feed_url, feed_cache, last_modified_cache, ungm_notice_cache)
+        for feed_url in feed_urls
+    ]
 
+    def fetch_one(feed_url: str, scratch: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if deadline is not None and time.monotonic() >= deadline:
+            scratch['stats']['timed_out'] = True
+            return []
+        return fetch_feed_entries(
+            feed_url,
+            config,
+            scratch['feed_cache'],
+            scratch['stats'],
+            scratch['last_modified_cache'],
+            scratch['ungm_notice_cache'],
+        )
 
-def fetch_and_parse_feeds(feed_urls: List[str], config: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    def merge(feed_url: str, scratch: Dict[str, Any]):
+        merge_fetch_scratch(scratch, feed_url, feed_cache, feed_stats, last_modified_cache, ungm_notice_cache)
+
+    if concurrency <= 1:
+        # A feed that finishes just past the deadline is complete, so it is
+        # kept; only the feeds not started in time are marked timed out
+        results = [fetch_one(feed_url, scratch) for feed_url, scratch in zip(feed_urls, scratches)]
+        for feed_url, scratch in zip(feed_urls, scratches):
+            merge(feed_url, scratch)
+        return results
+
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    futures = [executor.submit(fetch_one, feed_url, scratch) for feed_url, scratch in zip(feed_urls, scratches)]
+    timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+    _, not_done = wait_futures(futures, timeout=timeout)
+    for feed_url, future, scratch in zip(feed_urls, futures, scratches):
+        if future in not_done:
+            future.cancel()
+            feed_stats[feed_url]['timed_out'] = True
+        else:
+            merge(feed_url, scratch)
+    # Fetches still running are abandoned rather than waited for: they only
+    # write to their own scratch state, and the HTTP client keeps the
+    # expired deadline, so they send nothing more.
+    executor.shutdown(wait=False, cancel_futures=True)
+    return [[] if future in not_done else future.result() for future in futures]
+
+
+def fetch_and_parse_feeds(
+    feed_urls: List[str],
+    config: Optional[Dict[str, Any]] = None,
+    feed_cache: Optional[Dict[str, Any]] = None,
+    diagnostics: Optional[Dict[str, Any]] = None,
+    last_modified_cache: Optional[Dict[str, Any]] = None,
+    ungm_notice_cache: Optional[Dict[str, Any]] = None,
+    deadline: Optional[float] = None,
+    feed_health: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
     """
     Fetch and parse entries from multiple RSS feeds.
+
+    Feeds are fetched by a bounded worker pool sized by `fetch_concurrency`,
+    or on a single event loop when `fetch_mode` is "async". Results are
+    concatenated in feed order, so output is deterministic regardless of
+    which feed finishes first.
+
+    With a `deadline`, HTTP timeouts are clamped to the time remaining and
+    feeds not finished by then are abandoned: their URLs are listed in
+    diagnostics['timed_out_feeds'] and whatever already arrived is returned.
+
+    With a `feed_health` registry, feeds whose circuit breaker is open, or
+    chronically zero-yield feeds when `skip_zero_yield_runs` is set, are
+    skipped (diagnostics['skipped_feeds']), the rest are fetched highest
+    expected yield first (see prioritize_feeds) so the most valuable
+    sources finish under a deadline, and every outcome is recorded in the
+    registry (see update_feed_health). With `adaptive_polling`, feeds whose
+    next poll is not due yet are served from the feed cache instead
+    (diagnostics['not_due_feeds']).
     
     Args:
         feed_urls: List of RSS feed URLs
         config: Optional configuration dictionary
+        feed_cache: Optional conditional GET cache (see load_feed_cache)
+        diagnostics: Optional dictionary that receives fetch counters
+        last_modified_cache: Optional Last-Modified probe cache (see load_last_modified_cache)
+        ungm_notice_cache: Optional UNGM notice cache (see load_ungm_notice_cache)
+        deadline: Optional time.monotonic() deadline for the fetch stage (see get_fetch_deadline)
+        feed_health: Optional feed health registry (see load_feed_health), updated in place
         
     Returns:
         List of parsed entry dictionaries
     """
-    entries = []
-    
+    counters = diagnostics if diagnostics is not None else {}
+    counters.setdefault('feed_cache_hits', 0)
+    counters.setdefault('feed_cache_misses', 0)
+    counters.setdefault('feed_cache_entries_reused', 0)
+    counters.setdefault('last_modified_probes', 0)
+    counters.setdefault('last_modified_cache_hits', 0)
+    counters.setdefault('ungm_notice_cache_hits', 0)
+    counters.setdefault('ungm_notice_downloads', 0)
+    counters.setdefault('ungm_pushdown_avoided', 0)
+    counters.setdefault('dropped_age', 0)
+    counters.setdefault('feed_retries', 0)
+    counters.setdefault('feed_parsers', {})
+    feed_stats: Dict[str, Dict[str, Any]] = counters.setdefault('feeds', {})
     for feed_url in feed_urls:
-        try:
-            print(f"Fetching feed: {feed_url}")
-            feed = feedparser.parse(feed_url)
-            
-            for entry in feed.entries:
-                # Skip entries without required fields
-                if not hasattr(entry, 'title') or not hasattr(entry, 'link'):
-                    continue
-                
-                published = normalize_published_date(entry, feed_url)
-                if not published:
-                    print(f"Skipping entry without date: {entry.get('title', 'Unknown')}")
-                    continue
-                
-                # Extract entry data
-                entry_data = {
-                    'title': entry.title,
-                    'link': entry.link,
-                    'description': entry.get('summary', entry.get('description', '')),
-                    'published': published.isoformat(),
-                    'source': feed_url,
-                    'source_name': feed.feed.get('title', urlparse(feed_url).netloc),
-                }
-                
-                entries.append(entry_data)
-
-            if is_ungm_notice_source(feed_url):
-                has_configured_notice_ids = bool((config or {}).get("ungm_notice_ids"))
-                if not feed.entries or has_configured_notice_ids:
-                    fallback_entries = fetch_ungm_fallback_entries(feed_url, config or {})
-                    if fallback_entries:
-                        print(f"UNGM fallback fetched {len(fallback_entries)} notice(s)")
-                        entries.extend(fallback_entries)
-        
-        except Exception as e:
-            print(f"Error fetching feed {feed_url}: {e}", file=sys.stderr)
+        feed_stats.setdefault(feed_url, {})
+
+    active_urls = []
+    scheduled_results: Dict[str, List[Dict[str, Any]]] = {}
+    for feed_url in feed_urls:
+        record = (feed_health or {}).get(feed_url)
+        if feed_health is not None and is_feed_circuit_open(record):
+            feed_stats[feed_url]['skipped'] = 'circuit_open'
             continue
+        if feed_health is not None and is_zero_yield_feed(record, config):
+            feed_stats[feed_url]['skipped'] = 'zero_yield'
+            continue
+        if feed_health is not None and uses_adaptive_polling(config) and not is_feed_due(record):
+            cached_entries = get_scheduled_feed_entries(feed_cache, feed_url, config, feed_stats[feed_url])
+            if cached_entries is not None:
+                scheduled_results[feed_url] = cached_entries
+                continue
+        active_urls.append(feed_url)
+    if (config or {}).get('feed_prioritization', True):
+        fetch_order = prioritize_feeds(active_urls, feed_health)
+    else:
+        fetch_order = active_urls
+
+    http_client = get_http_client()
+    http_client.set_deadline(deadline)
+    try:
+        ordered_results = run_feed_fetches(
+            fetch_order,
+            config,
+            feed_cache,
+            feed_stats,
+            last_modified_cache,
+            ungm_notice_cache,
+            deadline,
+        )
+    finally:
+        # Fetches abandoned at the deadline may still be running; leaving
+        # the expired deadline in place stops them at their next request
+        # (the next fetch stage sets its own deadline)
+        if not any(stats.get('timed_out') for stats in feed_stats.values()):
+            http_client.set_deadline(None)
+
+    results_by_url: Dict[str, List[List[Dict[str, Any]]]] = {}
+    for feed_url, feed_entries in zip(fetch_order, ordered_results):
+        results_by_url.setdefault(feed_url, []).append(feed_entries)
+    results = [
+        [dict(entry) for entry in scheduled_results[feed_url]] if feed_url in scheduled_results
+        else results_by_url[feed_url].pop(0)
+        for feed_url in feed_urls
+        if feed_url in scheduled_results or feed_url in results_by_url
+    ]
+
+    unique_urls = list(dict.fromkeys(feed_urls))
+    counters['timed_out_feeds'] = [feed_url for feed_url in unique_urls if feed_stats[feed_url].get('timed_out')]
+    counters['skipped_feeds'] = [feed_url for feed_url in unique_urls if feed_stats[feed_url].get('skipped')]
+    counters['failed_feeds'] = [feed_url for feed_url in unique_urls if is_feed_failure(feed_stats[feed_url])]
+    counters['not_due_feeds'] = [feed_url for feed_url in unique_urls if feed_stats[feed_url].get('not_due')]
+    if feed_health is not None:
+        for feed_url in unique_urls:
+            update_feed_health(feed_health, feed_url, feed_stats[feed_url], config)
+
+    entries = []
+    for feed_entries in results:
+        entries.extend(feed_entries)
+
+    for feed_url in dict.fromkeys(feed_urls):
+        counters['last_modified_probes'] += feed_stats[feed_url].get('last_modified_probes', 0)
+        counters['last_modified_cache_hits'] += feed_stats[feed_url].get('last_modified_cache_hits', 0)
+        counters['ungm_notice_cache_hits'] += feed_stats[feed_url].get('ungm_notice_cache_hits', 0)
+        counters['ungm_notice_downloads'] += feed_stats[feed_url].get('ungm_notice_downloads', 0)
+        counters['ungm_pushdown_avoided'] += feed_stats[feed_url].get('ungm_pushdown_avoided', 0)
+        counters['dropped_age'] += feed_stats[feed_url].get('dropped_age', 0)
+        counters['feed_retries'] += feed_stats[feed_url].get('retries', 0)
+        parser = feed_stats[feed_url].get('parser')
+        if parser:
+            counters['feed_parsers'][parser] = counters['feed_parsers'].get(parser, 0) + 1
+    speedups = [stats['parse_speedup'] for stats in feed_stats.values() if stats.get('parse_speedup')]
+    if speedups:
+        counters['fast_parser_speedup'] = round(sum(speedups) / len(speedups), 1)
+
+    if feed_cache is not None:
+        for feed_url in dict.fromkeys(feed_urls):
+            cache_status = feed_stats[feed_url].get('cache')
+            if cache_status == 'hit':
+                counters['feed_cache_hits'] += 1
+                counters['feed_cache_entries_reused'] += feed_stats[feed_url].get('entries', 0)
+            elif cache_status == 'miss':
+                counters['feed_cache_misses'] += 1
     
     return entries
 
@@ -747,12 +3632,9 @@ def score_keyword_match(text: str, keywords: List[str]) -> float:
     """
     if not text or not keywords:
         return 0.0
-    
-    text_lower = text.lower()
-    matches = sum(1 for keyword in keywords if keyword.lower() in text_lower)
-    
-    # Normalize by number of keywords (but allow scores > 1.0 for multiple matches)
-    return matches / max(len(keywords), 1)
+
+    scanner = build_term_scanner(tuple(keywords), ())
+    return scanner.keyword_score(scanner.scan(text))
 
 
 def score_budget(budget: Optional[float], min_budget: float) -> float:
@@ -780,20 +3662,20 @@ def score_budget(budget: Optional[float], min_budget: float) -> float:
     return min(1.0, 0.5 + (budget - min_budget) / (min_budget * 2))
 
 
-def score_recency(published: str, max_age_days: int) -> float:
+def score_recency(published: Union[str, datetime, None], max_age_days: int) -> float:
     """
     Calculate recency score with decay.
     
     Args:
-        published: ISO 8601 timestamp
+        published: ISO 8601 timestamp or parsed datetime
         max_age_days: Maximum age in days
         
     Returns:
         Score based on recency (0.0 to 1.0)
     """
     try:
-        pub_date = datetime.fromisoformat(published)
-        now = datetime.now(timezone.utc)
+        pub_date = published if isinstance(published, datetime) else datetime.fromisoformat(published)
+        now = utc_now()
         age_days = (now - pub_date).days
         
         if age_days < 0:
@@ -809,6 +3691,246 @@ def score_recency(published: str, max_age_days: int) -> float:
         return 0.0
 
 
+def parse_published_date(published: Any) -> Optional[datetime]:
+    """Parse an entry's ISO 8601 'published' value, or None if it is invalid."""
+    if isinstance(published, datetime):
+        return published
+    try:
+        return datetime.fromisoformat(published)
+    except (ValueError, TypeError):
+        return None
+
+
+# Marks an unset Entry slot, so lookups never pay for an AttributeError
+_UNSET = object()
+
+
+class Entry(MutableMapping):
+    """
+    Compact record for one entry between normalization and rendering.
+
+    Feed parsing and the caches work with plain dictionaries; normalize_entries
+    converts them into Entry records once. The publication date is parsed
+    into `published_at` and the description converted to `description_text`
+    when they are set, and the derived `score`, `budget` and
+    `matched_regions` live in slots instead of a per-entry dict.
+    `term_hits` caches the TermScanner result that filtering and scoring
+    share; it is cleared whenever the title or description changes.
+
+    Entry is also a mutable mapping over the same keys as the dictionary it
+    replaces ('published' stays the ISO string), so dict-style access,
+    dict(entry) and comparisons with dictionaries keep working. Unset slots
+    hold _UNSET and read as absent keys; unknown keys go to a small overflow
+    dict. keys(), items(), iteration and equality are implemented directly
+    rather than through the MutableMapping mixins, which cost several
+    Python-level calls per key.
+    """
+
+    __slots__ = (
+        'title',
+        'link',
+        'description',
+        'published',
+        'source',
+        'source_name',
+        'description_text',
+        'score',
+        'budget',
+        'matched_regions',
+        'published_at',
+        'extra',
+        'term_hits',
+    )
+    KEYS = __slots__[:10]
+    KEY_SET = frozenset(KEYS)
+
+    def __init__(self, fields: Optional[Dict[str, Any]] = None, **kwargs: Any):
+        for key in self.KEYS:
+            setattr(self, key, _UNSET)
+        self.extra: Optional[Dict[str, Any]] = None
+        self.term_hits: Optional[Tuple[TermScanner, TermHits]] = None
+        # Assigned directly rather than through __setitem__, with the derived
+        # fields computed once at the end
+        key_set = self.KEY_SET
+        for source in (fields, kwargs):
+            for key, value in (source or {}).items():
+                if key in key_set:
+                    setattr(self, key, value)
+                else:
+                    if self.extra is None:
+                        self.extra = {}
+                    self.extra[key] = value
+        published = self.published
+        self.published_at = None if published is _UNSET else parse_published_date(published)
+        if self.description_text is _UNSET:
+            description = self.description
+            self.description_text = html_to_text(None if description is _UNSET else description)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.KEY_SET:
+            value = getattr(self, key)
+            if value is not _UNSET:
+                return value
+        elif self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key in self.KEY_SET:
+            setattr(self, key, value)
+            if key == 'published':
+                self.published_at = parse_published_date(value)
+            elif key == 'description':
+                self.description_text = html_to_text(value)
+                self.term_hits = None
+            elif key in ('title', 'description_text'):
+                self.term_hits = None
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __delitem__(self, key: str):
+        if key in self.KEY_SET:
+            if getattr(self, key) is _UNSET:
+                raise KeyError(key)
+            setattr(self, key, _UNSET)
+            if key == 'published':
+                self.published_at = None
+            elif key == 'description':
+                self.description_text = html_to_text(None)
+                self.term_hits = None
+            elif key in ('title', 'description_text'):
+                self.term_hits = None
+        elif self.extra and key in self.extra:
+            del self.extra[key]
+        else:
+            raise KeyError(key)
+
+    def keys(self) -> List[str]:  # type: ignore[override]
+        keys = [key for key in self.KEYS if getattr(self, key) is not _UNSET]
+        if self.extra:
+            keys.extend(self.extra)
+        return keys
+
+    def items(self) -> List[Tuple[str, Any]]:  # type: ignore[override]
+        items = [(key, value) for key in self.KEYS if (value := getattr(self, key)) is not _UNSET]
+        if self.extra:
+            items.extend(self.extra.items())
+        return items
+
+    def values(self) -> List[Any]:  # type: ignore[override]
+        return [value for _, value in self.items()]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def __contains__(self, key: Any) -> bool:
+        if key in self.KEY_SET:
+            return getattr(self, key) is not _UNSET
+        return bool(self.extra) and key in self.extra
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self.KEY_SET:
+            value = getattr(self, key)
+            return default if value is _UNSET else value
+        return self.extra.get(key, default) if self.extra else default
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Entry):
+            return self.items() == other.items() or dict(self.items()) == dict(other.items())
+        if isinstance(other, dict):
+            return dict(self.items()) == other
+        if isinstance(other, Mapping):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __copy__(self) -> 'Entry':
+        clone = Entry.__new__(Entry)
+        for slot in self.__slots__:
+            setattr(clone, slot, getattr(self, slot))
+        if self.extra is not None:
+            clone.extra = dict(self.extra)
+        return clone
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'Entry':
+        clone = Entry.__new__(Entry)
+        for slot in self.__slots__:
+            value = getattr(self, slot)
+            setattr(clone, slot, value if value is _UNSET else copy.deepcopy(value, memo))
+        return clone
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (Entry, (dict(self.items()),))
+
+    def __repr__(self) -> str:
+        return f"Entry({dict(self.items())!r})"
+
+
+def get_published_datetime(entry: Dict[str, Any]) -> Optional[datetime]:
+    """Return the entry's publication datetime, parsed once for Entry records."""
+    if isinstance(entry, Entry):
+        return entry.published_at
+    return parse_published_date(entry.get('published'))
+
+
+def get_description_text(entry: Dict[str, Any]) -> str:
+    """
+    Return the entry's description as plain text, converting it on first use.
+
+    The result is stored as entry['description_text'] so filtering, scoring
+    and rendering share a single conversion.
+    """
+    text = entry.get('description_text')
+    if text is None:
+        text = html_to_text(entry.get('description'))
+        entry['description_text'] = text
+    return text
+
+
+def get_entry_text(entry: Dict[str, Any]) -> str:
+    """Return the title and plain-text description used for matching."""
+    return f"{entry.get('title', '')} {get_description_text(entry)}"
+
+
+def get_entry_term_hits(entry: Dict[str, Any], scanner: TermScanner) -> TermHits:
+    """
+    Scan the entry's title and plain-text description with a term scanner.
+
+    Entry records keep the result, so filtering and scoring with the same
+    scanner share one pass per entry.
+    """
+    if isinstance(entry, Entry):
+        cached = entry.term_hits
+        if cached is not None and cached[0] is scanner:
+            return cached[1]
+        hits = scanner.scan(get_entry_text(entry))
+        entry.term_hits = (scanner, hits)
+        return hits
+    return scanner.scan(get_entry_text(entry))
+
+
+def normalize_entries(entries: List[Dict[str, Any]]) -> List[Entry]:
+    """
+    Convert fetched entry dictionaries into Entry records, before filtering.
+
+    Each record parses its publication date and converts its description to
+    plain text once, for filtering, scoring and rendering to share.
+
+    Args:
+        entries: List of entry dictionaries
+
+    Returns:
+        List of Entry records in the same order
+    """
+    return [entry if isinstance(entry, Entry) else Entry(entry) for entry in entries]
+
+
 def calculate_score(entry: Dict[str, Any], config: Dict[str, Any]) -> float:
     """
     Calculate overall score for an entry.
@@ -820,18 +3942,22 @@ def calculate_score(entry: Dict[str, Any], config: Dict[str, Any]) -> float:
     Returns:
         Total score
     """
-    # Combine title and description for keyword matching
-    text = f"{entry.get('title', '')} {entry.get('description', '')}"
+    # Combine title and plain-text description for budget extraction
+    text = get_entry_text(entry)
     
     # Extract budget from text
     budget = extract_budget(text)
+
+    # Keyword and region hits come from one scan shared with filter_entries
+    scanner = get_term_scanner(config)
+    hits = get_entry_term_hits(entry, scanner)
     
     # Calculate component scores
-    keyword_score = score_keyword_match(text, config['keywords'])
+    keyword_score = scanner.keyword_score(hits)
     budget_score = score_budget(budget, config['min_budget'])
-    recency_score = score_recency(entry['published'], config['max_age_days'])
+    recency_score = score_recency(get_published_datetime(entry), config['max_age_days'])
     source_weight = apply_source_weighting(entry['source'], config)
-    matched_region_groups = get_matched_region_groups(text, config.get('regions', []))
+    matched_region_groups = hits.names('region')
     region_score = 1.0 if matched_region_groups else 0.0
     
     # Weighted combination
@@ -882,13 +4008,14 @@ def filter_entries(
 
     strict_region_filter = bool(config.get('strict_region_filter', False))
     configured_region_labels = extract_region_labels(config.get('regions', []))
+    scanner = get_term_scanner(config)
     strict_region_dropped_entries: List[Dict[str, Any]] = []
     
     for entry in entries:
         # Check age
         try:
-            pub_date = datetime.fromisoformat(entry['published'])
-            now = datetime.now(timezone.utc)
+            pub_date = get_published_datetime(entry)
+            now = utc_now()
             age_days = (now - pub_date).days
             
             if age_days > config['max_age_days']:
@@ -899,14 +4026,11 @@ def filter_entries(
             continue
 
         if configured_region_labels:
-            text = f"{entry.get('title', '')} {entry.get('description', '')}"
-            matched_region_groups = get_matched_region_groups(text, configured_region_labels)
+            hits = get_entry_term_hits(entry, scanner)
+            matched_region_groups = hits.names('region')
             if not matched_region_groups:
-                fallback_match = any(
-                    region and region.lower() in text.lower()
-                    for region in configured_region_labels
-                )
-                if fallback_match:
+                # Fall back to the configured labels appearing verbatim
+                if hits.names('label'):
                     counters['region_matched'] += 1
                 else:
                     counters['region_unmatched'] += 1
@@ -999,7 +4123,7 @@ def save_last_run(entries: List[Dict[str, Any]], last_run_path: str = "data/last
     os.makedirs(os.path.dirname(last_run_path), exist_ok=True)
     
     data = {
-        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'timestamp': utc_now().isoformat(),
         'entry_ids': [generate_entry_id(entry) for entry in entries]
     }
     
@@ -1039,22 +4163,20 @@ def format_currency(amount: Optional[float]) -> str:
     return f"${amount:,.0f}"
 
 
-def format_published_date(published: Optional[str]) -> str:
+def format_published_date(published: Union[str, datetime, None]) -> str:
     """
     Format ISO timestamp as YYYY-MM-DD.
 
     Args:
-        published: ISO 8601 timestamp
+        published: ISO 8601 timestamp or parsed datetime
 
     Returns:
         Formatted date string or "Unknown"
     """
-    if not published:
-        return "Unknown"
-    try:
-        return datetime.fromisoformat(published).strftime('%Y-%m-%d')
-    except (ValueError, TypeError):
+    parsed = parse_published_date(published) if published else None
+    if not parsed:
         return "Unknown"
+    return parsed.strftime('%Y-%m-%d')
 
 
 def get_source_display_name(entry: Dict[str, Any]) -> str:
@@ -1090,13 +4212,7 @@ def sanitize_summary(summary: Optional[str]) -> str:
     Returns:
         Sanitized plain-text summary
     """
-    if not summary:
-        return ""
-
-    cleaned = re.sub(r'<[^>]+>', ' ', summary)
-    cleaned = html.unescape(cleaned)
-    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-    return cleaned
+    return html_to_text(summary)
 
 
 # ---------------------------------------------------------------------------
@@ -1390,9 +4506,16 @@ _PAGE_NAV_BLOCK = """\
 </nav>"""
 
 
+def format_timed_out_feeds(feed_urls: List[str]) -> str:
+    """Render the timed-out feed count, followed by the feed URLs if any."""
+    if not feed_urls:
+        return "0"
+    return f"{len(feed_urls)} ({', '.join(f'`{feed_url}`' for feed_url in feed_urls)})"
+
+
 def generate_markdown_output(
     entries: List[Dict[str, Any]],
-    metrics: Dict[str, int],
+    metrics: Dict[str, Any],
     output_path: str = "docs/index.md"
 ):
     """
@@ -1403,7 +4526,7 @@ def generate_markdown_output(
         metrics: Pipeline metrics dictionary
         output_path: Path to output file
     """
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
     
     # Read existing file to check if content would be different
     existing_content = ""
@@ -1412,7 +4535,7 @@ def generate_markdown_output(
             existing_content = f.read()
     
     # Generate new content
-    timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
+    timestamp = utc_now().strftime('%Y-%m-%d %H:%M:%S UTC')
     
     avg_score = sum(entry.get('score', 0.0) for entry in entries) / len(entries) if entries else 0.0
     max_score = max((entry.get('score', 0.0) for entry in entries), default=0.0)
@@ -1473,6 +4596,21 @@ def generate_markdown_output(
         f"- **Dropped by region:** {metrics.get('dropped_region', 0)}",
         f"- **Region matched (annotated):** {metrics.get('region_matched', 0)}",
         f"- **Region unmatched (kept):** {metrics.get('region_unmatched', 0)}",
+        f"- **Feed cache hits (not modified):** {metrics.get('feed_cache_hits', 0)}",
+        f"- **Feed cache misses (downloaded):** {metrics.get('feed_cache_misses', 0)}",
+        f"- **Entries served from cache:** {metrics.get('feed_cache_entries_reused', 0)}",
+        f"- **Last-Modified probes:** {metrics.get('last_modified_probes', 0)}",
+        f"- **Last-Modified cache hits:** {metrics.get('last_modified_cache_hits', 0)}",
+        f"- **UNGM notices from cache:** {metrics.get('ungm_notice_cache_hits', 0)}",
+        f"- **UNGM notices downloaded:** {metrics.get('ungm_notice_downloads', 0)}",
+        f"- **UNGM downloads avoided by search filters:** {metrics.get('ungm_pushdown_avoided', 0)}",
+        f"- **HTTP connections opened:** {metrics.get('http_new_connections', 0)}",
+        f"- **HTTP connections reused:** {metrics.get('http_reused_connections', 0)}",
+        f"- **Feeds timed out (run deadline):** {format_timed_out_feeds(metrics.get('timed_out_feeds') or [])}",
+        f"- **Feeds failed:** {metrics.get('failed_feeds', 0)}",
+        f"- **Feeds skipped (circuit open or zero yield):** {metrics.get('skipped_feeds', 0)}",
+        f"- **Feed fetch retries:** {metrics.get('feed_retries', 0)}",
+        f"- **Feeds not due (adaptive polling, served from cache):** {metrics.get('not_due_feeds', 0)}",
         "",
         "## Scoring Summary",
         "",
@@ -1524,11 +4662,11 @@ def generate_markdown_output(
             link = entry.get('link', '').strip()
             score = entry.get('score', 0.0)
             priority = get_priority_band(score)
-            published = format_published_date(entry.get('published'))
+            published = format_published_date(get_published_datetime(entry))
             source = get_source_display_name(entry)
             budget = format_currency(entry.get('budget'))
             matched_regions = entry.get('matched_regions', [])
-            summary = sanitize_summary(entry.get('description'))
+            summary = get_description_text(entry)
 
             heading = f"### {index}. {title}"
             if link:
@@ -1571,31 +4709,243 @@ def generate_markdown_output(
         print(f"No changes to output: {output_path}")
 
 
-def main():
-    """Main execution function."""
-    print("RFP Intelligence Collection Script")
-    print("=" * 40)
-    
-    # Load configuration
-    config = load_config()
+def get_source_mtimes(*paths: str) -> Dict[str, Optional[float]]:
+    """Return the modification time of each path (None if missing)."""
+    mtimes: Dict[str, Optional[float]] = {}
+    for path in paths:
+        try:
+            mtimes[path] = os.path.getmtime(path)
+        except OSError:
+            mtimes[path] = None
+    return mtimes
+
+
+def apply_collector_config(state: Dict[str, Any], config: Dict[str, Any]):
+    """
+    Make `config` current for a collector state.
+
+    The shared HTTP client is rebuilt (pool and timeout settings may have
+    changed); caches already held in memory are kept, and caches enabled
+    by the new configuration are loaded from disk. A state with
+    persist_caches off starts from empty caches instead, so its runs do not
+    depend on (or change) the data/ files.
+    """
+    persist = state.get('persist_caches', True)
+    state['config'] = config
+    state['http_client'] = configure_http_client(config)
+    state.setdefault('last_modified_cache', load_last_modified_cache() if persist else {})
+    if config.get('feed_cache_enabled', True):
+        if state.get('feed_cache') is None:
+            state['feed_cache'] = load_feed_cache() if persist else {}
+    else:
+        state['feed_cache'] = None
+    if config.get('ungm_notice_cache_enabled', True):
+        if state.get('ungm_notice_cache') is None:
+            state['ungm_notice_cache'] = load_ungm_notice_cache() if persist else {'notices': {}}
+    else:
+        state['ungm_notice_cache'] = None
+    if config.get('feed_health_enabled', True):
+        if state.get('feed_health') is None:
+            state['feed_health'] = load_feed_health() if persist else {}
+    else:
+        state['feed_health'] = None
+
+
+def load_collector_state(
+    config_path: str = "config.yml",
+    feeds_path: str = "feeds.txt",
+    persist_caches: bool = True,
+) -> Dict[str, Any]:
+    """
+    Load configuration, feeds and caches into a collector state.
+
+    The state holds everything a collection cycle needs (configuration,
+    feed list, shared HTTP client, caches and the last rendered output
+    signature), so a long-running collector keeps it warm between cycles.
+
+    Args:
+        config_path: Path to configuration file
+        feeds_path: Path to feeds file
+        persist_caches: Load caches from and save them to data/ (off for record/replay runs)
+
+    Returns:
+        Collector state dictionary
+    """
+    config = load_config(config_path)
     print(f"Loaded configuration: {config.get('max_results', 0)} max results")
-    
-    # Load feeds
-    feeds = load_feeds()
+    feeds = load_feeds(feeds_path)
     print(f"Loaded {len(feeds)} feed(s)")
-    
-    if not feeds:
-        print("No feeds to process. Exiting.")
-        sys.exit(0)
-    
+
+    state: Dict[str, Any] = {
+        'config_path': config_path,
+        'feeds_path': feeds_path,
+        'feeds': feeds,
+        'mtimes': get_source_mtimes(config_path, feeds_path),
+        'output_signature': None,
+        'persist_caches': persist_caches,
+    }
+    apply_collector_config(state, config)
+    return state
+
+
+def reload_changed_sources(state: Dict[str, Any]) -> bool:
+    """
+    Reload config.yml and feeds.txt if either changed on disk.
+
+    An invalid configuration or feeds file is reported and the previous
+    values are kept, so a bad edit does not stop a running collector.
+
+    Args:
+        state: Collector state, updated in place
+
+    Returns:
+        True if anything was reloaded
+    """
+    config_path, feeds_path = state['config_path'], state['feeds_path']
+    mtimes = get_source_mtimes(config_path, feeds_path)
+    if mtimes == state['mtimes']:
+        return False
+
+    try:
+        config = load_config(config_path) if mtimes[config_path] != state['mtimes'][config_path] else None
+        feeds = load_feeds(feeds_path) if mtimes[feeds_path] != state['mtimes'][feeds_path] else None
+    except (SystemExit, yaml.YAMLError, OSError):
+        print("Keeping previous configuration: reload failed", file=sys.stderr)
+        state['mtimes'] = mtimes
+        return False
+
+    state['mtimes'] = mtimes
+    if config is not None:
+        print(f"Reloaded {config_path}")
+        apply_collector_config(state, config)
+        state['output_signature'] = None
+    if feeds is not None:
+        print(f"Reloaded {feeds_path}: {len(feeds)} feed(s)")
+        state['feeds'] = feeds
+    return True
+
+
+def get_ranked_output_signature(entries: List[Dict[str, Any]]) -> str:
+    """Fingerprint the ranked output (entry identity, order and score)."""
+    ranked = [(generate_entry_id(entry), round(entry.get('score', 0.0), 6)) for entry in entries]
+    return hashlib.sha256(json.dumps(ranked).encode('utf-8')).hexdigest()
+
+
+def run_collection_cycle(
+    state: Dict[str, Any],
+    started_at: Optional[float] = None,
+    render_unchanged: bool = True,
+) -> Dict[str, Any]:
+    """
+    Run one fetch/filter/score/render cycle against a collector state.
+
+    Args:
+        state: Collector state (see load_collector_state), caches updated in place
+        started_at: Optional time.monotonic() start used for the max_run_seconds budget
+        render_unchanged: Re-render docs/index.md even if the ranked output is unchanged
+
+    Returns:
+        Dictionary with 'entries' (top ranked), 'metrics' and 'rendered'
+    """
+    started_at = time.monotonic() if started_at is None else started_at
+    config = state['config']
+    feeds = state['feeds']
+    http_client = state['http_client']
+    feed_cache = state['feed_cache']
+    last_modified_cache = state['last_modified_cache']
+    ungm_notice_cache = state['ungm_notice_cache']
+    feed_health = state['feed_health']
+    persist = state.get('persist_caches', True)
+    connections_before = http_client.connection_stats()
+
     # Fetch and parse feeds
-    entries = fetch_and_parse_feeds(feeds, config)
+    fetch_diagnostics: Dict[str, Any] = {}
+    entries = fetch_and_parse_feeds(
+        feeds,
+        config,
+        feed_cache=feed_cache,
+        diagnostics=fetch_diagnostics,
+        last_modified_cache=last_modified_cache,
+        ungm_notice_cache=ungm_notice_cache,
+        deadline=get_fetch_deadline(config, started_at),
+        feed_health=feed_health,
+    )
     fetched_count = len(entries)
-    print(f"Fetched {fetched_count} total entries")
+    print(
+        f"Fetched {fetched_count} total entries "
+        f"({fetch_diagnostics.get('dropped_age', 0)} dropped by age while parsing)"
+    )
+    timed_out_feeds = fetch_diagnostics.get('timed_out_feeds', [])
+    if timed_out_feeds:
+        print(
+            f"Run deadline reached: {len(timed_out_feeds)} feed(s) timed out: {', '.join(timed_out_feeds)}",
+            file=sys.stderr,
+        )
+    print(
+        "Feed health: "
+        f"failed={len(fetch_diagnostics.get('failed_feeds', []))}, "
+        f"skipped={len(fetch_diagnostics.get('skipped_feeds', []))}, "
+        f"retries={fetch_diagnostics.get('feed_retries', 0)}, "
+        f"not_due={len(fetch_diagnostics.get('not_due_feeds', []))}"
+    )
+    feed_parsers = fetch_diagnostics.get('feed_parsers') or {}
+    if feed_parsers:
+        speedup = fetch_diagnostics.get('fast_parser_speedup')
+        print(
+            "Feed parsers: "
+            + ", ".join(f"{parser}={count}" for parser, count in sorted(feed_parsers.items()))
+            + (f" (fast path {speedup}x faster than feedparser)" if speedup else "")
+        )
+    if feed_cache is not None:
+        print(
+            "Feed cache: "
+            f"hits={fetch_diagnostics.get('feed_cache_hits', 0)}, "
+            f"misses={fetch_diagnostics.get('feed_cache_misses', 0)}, "
+            f"entries_reused={fetch_diagnostics.get('feed_cache_entries_reused', 0)}"
+        )
+        if persist:
+            save_feed_cache({url: feed_cache[url] for url in feeds if url in feed_cache})
+    print(
+        "Last-Modified fallback: "
+        f"probes={fetch_diagnostics.get('last_modified_probes', 0)}, "
+        f"cache_hits={fetch_diagnostics.get('last_modified_cache_hits', 0)}"
+    )
+    if persist:
+        save_last_modified_cache(last_modified_cache, ttl_days=get_last_modified_cache_ttl(config))
+    if ungm_notice_cache is not None:
+        print(
+            "UNGM notice cache: "
+            f"hits={fetch_diagnostics.get('ungm_notice_cache_hits', 0)}, "
+            f"downloads={fetch_diagnostics.get('ungm_notice_downloads', 0)}, "
+            f"avoided_by_pushdown={fetch_diagnostics.get('ungm_pushdown_avoided', 0)}"
+        )
+        if persist:
+            save_ungm_notice_cache(
+                ungm_notice_cache,
+                max_age_days=float(config.get('ungm_notice_cache_max_age_days', 90) or 90),
+                max_entries=int(config.get('ungm_notice_cache_max_entries', 2000) or 2000),
+            )
     
+    connection_stats = {
+        key: value - connections_before[key]
+        for key, value in http_client.connection_stats().items()
+    }
+    print(
+        "HTTP connections: "
+        f"requests={connection_stats['requests']}, "
+        f"new={connection_stats['new_connections']}, "
+        f"reused={connection_stats['reused_connections']}"
+    )
+    
+    # Build Entry records (parsed date, plain-text description) once for
+    # filtering, scoring and rendering
+    entries = normalize_entries(entries)
+
     # Filter entries
     filter_diagnostics: Dict[str, int] = {}
     entries = filter_entries(entries, config, diagnostics=filter_diagnostics)
+    filter_diagnostics['dropped_age'] += fetch_diagnostics.get('dropped_age', 0)
+    filtered_entries = entries
     filtered_count = len(entries)
     print(f"After filtering: {filtered_count} entries")
     print(
@@ -1625,6 +4975,14 @@ def main():
     top_entries = entries[:max_results]
     selected_count = len(top_entries)
     print(f"Selected top {selected_count} entries")
+
+    if feed_health is not None:
+        record_feed_yield(feed_health, fetch_diagnostics.get('feeds', {}), filtered_entries, top_entries)
+        if persist:
+            save_feed_health({url: feed_health[url] for url in feeds if url in feed_health})
+        next_poll_at = get_next_feed_poll_at(feed_health, feeds)
+        if uses_adaptive_polling(config) and next_poll_at:
+            print(f"Next feed poll due: {next_poll_at.isoformat()}")
     
     # Generate output
     metrics = {
@@ -1638,12 +4996,179 @@ def main():
         'region_matched': filter_diagnostics.get('region_matched', 0),
         'region_unmatched': filter_diagnostics.get('region_unmatched', 0),
         'strict_region_fallback': filter_diagnostics.get('strict_region_fallback', 0),
+        'feed_cache_hits': fetch_diagnostics.get('feed_cache_hits', 0),
+        'feed_cache_misses': fetch_diagnostics.get('feed_cache_misses', 0),
+        'feed_cache_entries_reused': fetch_diagnostics.get('feed_cache_entries_reused', 0),
+        'last_modified_probes': fetch_diagnostics.get('last_modified_probes', 0),
+        'last_modified_cache_hits': fetch_diagnostics.get('last_modified_cache_hits', 0),
+        'ungm_notice_cache_hits': fetch_diagnostics.get('ungm_notice_cache_hits', 0),
+        'ungm_notice_downloads': fetch_diagnostics.get('ungm_notice_downloads', 0),
+        'ungm_pushdown_avoided': fetch_diagnostics.get('ungm_pushdown_avoided', 0),
+        'http_new_connections': connection_stats['new_connections'],
+        'http_reused_connections': connection_stats['reused_connections'],
+        'timed_out_feeds': timed_out_feeds,
+        'failed_feeds': len(fetch_diagnostics.get('failed_feeds', [])),
+        'skipped_feeds': len(fetch_diagnostics.get('skipped_feeds', [])),
+        'feed_retries': fetch_diagnostics.get('feed_retries', 0),
+        'not_due_feeds': len(fetch_diagnostics.get('not_due_feeds', [])),
     }
-    generate_markdown_output(top_entries, metrics)
+    signature = get_ranked_output_signature(top_entries)
+    rendered = render_unchanged or signature != state.get('output_signature')
+    # Record/replay runs leave docs/index.md and data/last_run.json alone and
+    # only render to an explicit --output path
+    output_path = state.get('output_path')
+    if rendered and (persist or output_path):
+        generate_markdown_output(top_entries, metrics, output_path or "docs/index.md")
+
+        # Save last run data
+        if persist:
+            save_last_run(top_entries)
+            print("Saved last run data")
+    elif rendered:
+        rendered = False
+        print("Output not persisted for record/replay runs; pass --output to render it")
+    else:
+        print("Ranked output unchanged; docs/index.md not re-rendered")
+    state['output_signature'] = signature
+
+    return {'entries': top_entries, 'metrics': metrics, 'rendered': rendered}
+
+
+def get_daemon_sleep_seconds(state: Dict[str, Any], now: Optional[datetime] = None) -> float:
+    """
+    Seconds to wait before the next daemon cycle.
+
+    Normally `daemon_interval_seconds`; with adaptive polling the wait ends
+    early when a feed's next poll falls due sooner (at least
+    DAEMON_MIN_SLEEP_SECONDS).
+    """
+    config = state['config']
+    interval = float(config.get('daemon_interval_seconds', 3600) or 3600)
+    if uses_adaptive_polling(config) and state.get('feed_health'):
+        next_poll_at = get_next_feed_poll_at(state['feed_health'], state['feeds'])
+        if next_poll_at:
+            until_due = (next_poll_at - (now or utc_now())).total_seconds()
+            interval = min(interval, max(until_due, DAEMON_MIN_SLEEP_SECONDS))
+    return interval
+
+
+def run_daemon(
+    state: Dict[str, Any],
+    stop_event: Optional[threading.Event] = None,
+    max_cycles: Optional[int] = None,
+):
+    """
+    Run collection cycles until stopped, keeping state warm in memory.
+
+    Before each cycle config.yml/feeds.txt are reloaded if they changed on
+    disk. docs/index.md and data/last_run.json are only rewritten when the
+    ranked output changed. SIGTERM/SIGINT (or `stop_event`) end the loop
+    after the current cycle; caches are saved by every cycle.
+
+    Args:
+        state: Collector state (see load_collector_state)
+        stop_event: Optional event that stops the daemon when set
+        max_cycles: Optional number of cycles to run before returning
+    """
+    stop_event = stop_event or threading.Event()
+    previous_handlers = {}
+    if threading.current_thread() is threading.main_thread():
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            previous_handlers[signal_number] = signal.signal(signal_number, lambda *_: stop_event.set())
+
+    cycles = 0
+    try:
+        while not stop_event.is_set():
+            reload_changed_sources(state)
+            cycle_started = time.monotonic()
+            print(f"Daemon cycle {cycles + 1} at {utc_now().isoformat()}")
+            try:
+                run_collection_cycle(state, started_at=cycle_started, render_unchanged=False)
+            except Exception as e:
+                print(f"Collection cycle failed: {e}", file=sys.stderr)
+            cycles += 1
+            if max_cycles is not None and cycles >= max_cycles:
+                break
+            sleep_seconds = get_daemon_sleep_seconds(state)
+            print(f"Next cycle in {sleep_seconds:.0f}s")
+            stop_event.wait(sleep_seconds)
+    finally:
+        for signal_number, handler in previous_handlers.items():
+            signal.signal(signal_number, handler)
+    print("Daemon stopped")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Collect, score and publish RFPs from RSS feeds.")
+    parser.add_argument('--config', default="config.yml", help="Path to configuration file")
+    parser.add_argument('--feeds', default="feeds.txt", help="Path to feeds file")
+    parser.add_argument(
+        '--daemon',
+        action='store_true',
+        help="Keep running and collect every daemon_interval_seconds (reloads changed config/feeds)",
+    )
+    parser.add_argument('--max-cycles', type=int, default=None, help="Stop the daemon after this many cycles")
+    archive_group = parser.add_mutually_exclusive_group()
+    archive_group.add_argument(
+        '--record',
+        metavar='ARCHIVE',
+        help="Write every raw HTTP response to a gzip-compressed archive (caches in data/ are not used)",
+    )
+    archive_group.add_argument(
+        '--replay',
+        metavar='ARCHIVE',
+        help="Serve HTTP responses from an archive written by --record, with the clock frozen at recording time",
+    )
+    parser.add_argument(
+        '--output',
+        metavar='PATH',
+        help="Write the Markdown output here instead of docs/index.md (required for --record/--replay to render)",
+    )
+    args = parser.parse_args(argv)
+    if args.daemon and (args.record or args.replay):
+        parser.error("--record/--replay cannot be combined with --daemon")
+    return args
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main execution function."""
+    started_at = time.monotonic()
+    args = parse_args(argv)
+    print("RFP Intelligence Collection Script")
+    print("=" * 40)
     
-    # Save last run data
-    save_last_run(top_entries)
-    print("Saved last run data")
+    archive = None
+    if args.record:
+        archive = new_http_archive()
+        configure_http_archive(archive, 'record')
+        print(f"Recording HTTP responses to {args.record}")
+    elif args.replay:
+        archive = load_http_archive(args.replay)
+        configure_http_archive(archive, 'replay')
+        print(
+            f"Replaying {sum(len(records) for records in archive['responses'].values())} HTTP responses "
+            f"from {args.replay} (clock frozen at {archive['recorded_at']})"
+        )
+
+    # Load configuration, feeds and caches
+    state = load_collector_state(args.config, args.feeds, persist_caches=archive is None)
+    state['output_path'] = args.output
+    
+    if args.daemon:
+        run_daemon(state, max_cycles=args.max_cycles)
+        return
+
+    if not state['feeds']:
+        print("No feeds to process. Exiting.")
+        sys.exit(0)
+    
+    try:
+        run_collection_cycle(state, started_at=started_at)
+    finally:
+        if args.record:
+            save_http_archive(archive, args.record)
+            print(f"Recorded {sum(len(records) for records in archive['responses'].values())} HTTP responses")
     
     print("=" * 40)
     print("Collection complete!")
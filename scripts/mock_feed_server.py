@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+Local Mock Feed Server
+
+Serves synthetic RSS/Atom feeds and UNGM-style notice search/detail pages
+so the collector's fetch layer can be load-tested and benchmarked offline.
+
+Endpoints:
+- GET  /feeds/index.txt           feed URLs, one per line (a ready feeds.txt)
+- GET  /feeds/<n>.rss|.atom       synthetic feed number n
+- POST /Public/Notice/Search      UNGM search results (PageIndex/PageSize from the JSON body)
+- GET  /Public/Notice/<id>        UNGM notice detail page
+- HEAD <any of the above>         headers only (Last-Modified, ETag)
+
+Feed entries come from synthetic_corpus.generate_entries. Latency, 5xx
+errors, stalled responses (client timeouts), payload size, duplication and
+ETag/304 behaviour are configurable; see DEFAULT_OPTIONS.
+
+Usage:
+    python scripts/mock_feed_server.py --feeds 50 --entries 200 --latency-ms 40 --error-rate 0.05
+
+To exercise the UNGM fallback against the server, patch the notice root
+and call the fallback directly:
+    with patch('collect_rfps.UNGM_NOTICE_ROOT', server.ungm_notice_root):
+        fetch_ungm_fallback_entries(server.ungm_notice_root, config)
+
+fetch_and_parse_feeds only takes the fallback for ungm.org feed URLs, so
+going through it also needs is_ungm_notice_source patched:
+    with patch('collect_rfps.UNGM_NOTICE_ROOT', server.ungm_notice_root), \\
+            patch('collect_rfps.is_ungm_notice_source', return_value=True): ...
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timezone, timedelta
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from synthetic_corpus import generate_entries, render_atom_document, render_rss_document
+
+
+DEFAULT_OPTIONS = {
+    "feeds": 10,                   # number of feeds under /feeds/
+    "feed_format": "mixed",        # "rss", "atom" or "mixed" (alternating)
+    "entries_per_feed": 50,
+    "entry_interval_hours": 6,     # publication gap between consecutive entries
+    "payload_bytes": 0,            # extra description padding per entry
+    "duplicate_rate": 0.0,         # share of entries repeating an earlier link
+    "ungm_notices": 100,           # notices available through the UNGM search
+    "latency_ms": 0,               # mean response latency
+    "latency_distribution": "fixed",  # "fixed", "uniform" (0..2x mean) or "exponential"
+    "error_rate": 0.0,             # share of requests answered with a 5xx status
+    "timeout_rate": 0.0,           # share of requests stalled for stall_seconds
+    "stall_seconds": 30.0,
+    "etag": True,                  # send ETag/Last-Modified and honour conditional GETs
+    "seed": 0,
+}
+
+ERROR_STATUSES = (500, 502, 503, 504)
+
+
+def build_feed_items(options: Dict[str, Any], feed_index: int, source: str, now: datetime) -> List[Dict[str, Any]]:
+    """Build the synthetic entries of one feed, newest first."""
+    entries = generate_entries(
+        int(options["entries_per_feed"]),
+        seed=int(options["seed"]) * 10_000 + feed_index,
+        duplicate_rate=float(options["duplicate_rate"]),
+        interval_hours=float(options["entry_interval_hours"]),
+        now=now,
+        source=source,
+    )
+    padding = "x" * int(options["payload_bytes"])
+    if padding:
+        entries = [dict(entry, description=entry["description"] + padding) for entry in entries]
+    return entries
+
+
+def render_ungm_search(notice_ids: List[int], total: int) -> str:
+    """Render a UNGM search results fragment."""
+    rows = "".join(
+        f'<div class="tableRow" data-noticeid="{notice_id}">'
+        f'<a href="/Public/Notice/{notice_id}">Notice {notice_id}</a></div>'
+        for notice_id in notice_ids
+    )
+    return f'<span id="lblNoticeSearchTotal">{total}</span><div class="tableBody">{rows}</div>'
+
+
+def render_ungm_notice(notice_id: int, published: datetime, payload_bytes: int) -> str:
+    """Render a UNGM notice detail page in the layout parse_ungm_notice_entry expects."""
+    padding = "x" * payload_bytes
+    return (
+        f"<html><head><title>Evaluation consultancy notice {notice_id}</title></head><body>"
+        f'<span class="label">Published on:</span> <span class="value">{published.strftime("%d-%b-%Y")}</span>'
+        f'<span class="label">Reference:</span> <span class="value">RFP/{notice_id}</span>'
+        '<div><div class="title">Description</div>'
+        f"<div>Monitoring and evaluation services for notice {notice_id}. {padding}</div></div><br/>"
+        "</body></html>"
+    )
+
+
+class MockFeedServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the synthetic content and injection settings."""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], options: Optional[Dict[str, Any]] = None):
+        super().__init__(address, MockFeedHandler)
+        self.options = {**DEFAULT_OPTIONS, **(options or {})}
+        self.started = datetime.now(timezone.utc).replace(microsecond=0)
+        self.random = random.Random(self.options["seed"])
+        self.lock = threading.Lock()
+        self.stats: Dict[str, int] = {}
+        self.documents: Dict[str, Tuple[bytes, str]] = {}
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def feed_urls(self) -> List[str]:
+        return [
+            f"{self.base_url}/feeds/{index}.{self.feed_extension(index)}"
+            for index in range(int(self.options["feeds"]))
+        ]
+
+    @property
+    def ungm_notice_root(self) -> str:
+        return f"{self.base_url}/Public/Notice"
+
+    def feed_extension(self, index: int) -> str:
+        feed_format = self.options["feed_format"]
+        if feed_format == "mixed":
+            return "atom" if index % 2 else "rss"
+        return feed_format
+
+    def count(self, key: str):
+        with self.lock:
+            self.stats[key] = self.stats.get(key, 0) + 1
+
+    def draw(self) -> float:
+        with self.lock:
+            return self.random.random()
+
+    def latency_seconds(self) -> float:
+        mean = float(self.options["latency_ms"]) / 1000
+        if mean <= 0:
+            return 0.0
+        distribution = self.options["latency_distribution"]
+        with self.lock:
+            if distribution == "uniform":
+                return self.random.uniform(0, 2 * mean)
+            if distribution == "exponential":
+                return self.random.expovariate(1 / mean)
+        return mean
+
+    def feed_document(self, index: int, extension: str) -> Tuple[bytes, str]:
+        """Return (body, etag) for a feed, rendering it once."""
+        key = f"{index}.{extension}"
+        with self.lock:
+            cached = self.documents.get(key)
+        if cached:
+            return cached
+        source = f"{self.base_url}/feeds/{key}"
+        items = build_feed_items(self.options, index, source, self.started)
+        title = f"Mock feed {index}"
+        text = render_atom_document(items, title) if extension == "atom" else render_rss_document(items, title)
+        body = text.encode("utf-8")
+        document = (body, '"' + hashlib.sha256(body).hexdigest()[:16] + '"')
+        with self.lock:
+            self.documents[key] = document
+        return document
+
+    def notice_published(self, notice_id: int) -> datetime:
+        return self.started - timedelta(hours=float(self.options["entry_interval_hours"]) * (notice_id - 1))
+
+    def start(self) -> "MockFeedServer":
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class MockFeedHandler(BaseHTTPRequestHandler):
+    """Request handler applying latency/failure injection before serving content."""
+
+    protocol_version = "HTTP/1.1"
+    server: MockFeedServer
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.handle_request(send_body=True)
+
+    def do_HEAD(self):
+        self.handle_request(send_body=False)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self.request_body = self.rfile.read(length) if length else b""
+        self.handle_request(send_body=True)
+
+    def handle_request(self, send_body: bool):
+        server = self.server
+        path = urlparse(self.path).path
+        server.count("requests")
+
+        latency = server.latency_seconds()
+        if latency:
+            time.sleep(latency)
+        if server.draw() < float(server.options["timeout_rate"]):
+            server.count("stalled")
+            time.sleep(float(server.options["stall_seconds"]))
+        if server.draw() < float(server.options["error_rate"]):
+            server.count("errors")
+            self.respond(ERROR_STATUSES[int(server.draw() * len(ERROR_STATUSES))], b"error", "text/plain", send_body)
+            return
+
+        if path == "/feeds/index.txt":
+            self.respond(200, "\n".join(server.feed_urls).encode("utf-8") + b"\n", "text/plain", send_body)
+            return
+
+        feed_match = re.fullmatch(r"/feeds/(\d+)\.(rss|atom)", path)
+        if feed_match and int(feed_match.group(1)) < int(server.options["feeds"]):
+            self.serve_feed(int(feed_match.group(1)), feed_match.group(2), send_body)
+            return
+
+        if path.lower() == "/public/notice/search" and self.command == "POST":
+            self.serve_ungm_search(send_body)
+            return
+
+        notice_match = re.fullmatch(r"/Public/Notice/(\d+)", path, re.IGNORECASE)
+        if notice_match and 0 < int(notice_match.group(1)) <= int(server.options["ungm_notices"]):
+            notice_id = int(notice_match.group(1))
+            server.count("ungm_notices")
+            body = render_ungm_notice(notice_id, server.notice_published(notice_id), int(server.options["payload_bytes"]))
+            self.respond(200, body.encode("utf-8"), "text/html; charset=utf-8", send_body)
+            return
+
+        self.respond(404, b"not found", "text/plain", send_body)
+
+    def serve_feed(self, index: int, extension: str, send_body: bool):
+        server = self.server
+        server.count("feeds")
+        body, etag = server.feed_document(index, extension)
+        headers = {}
+        if server.options["etag"]:
+            headers = {"ETag": etag, "Last-Modified": format_datetime(server.started, usegmt=True)}
+            if self.headers.get("If-None-Match") == etag:
+                server.count("not_modified")
+                self.respond(304, b"", None, send_body, headers)
+                return
+        content_type = "application/atom+xml" if extension == "atom" else "application/rss+xml"
+        self.respond(200, body, content_type, send_body, headers)
+
+    def serve_ungm_search(self, send_body: bool):
+        server = self.server
+        server.count("ungm_searches")
+        try:
+            payload = json.loads(getattr(self, "request_body", b"") or b"{}")
+        except ValueError:
+            payload = {}
+        page_index = int(payload.get("PageIndex") or 0)
+        page_size = max(int(payload.get("PageSize") or 15), 1)
+        total = int(server.options["ungm_notices"])
+        first = page_index * page_size
+        # Newest notices have the highest IDs, as on the live site.
+        notice_ids = [total - offset for offset in range(first, min(first + page_size, total))]
+        body = render_ungm_search(notice_ids, total)
+        self.respond(200, body.encode("utf-8"), "text/html; charset=utf-8", send_body)
+
+    def respond(
+        self,
+        status: int,
+        body: bytes,
+        content_type: Optional[str],
+        send_body: bool,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body) if status != 304 else 0))
+        self.end_headers()
+        if send_body and status != 304:
+            try:
+                self.wfile.write(body)
+            except (BrokenPipeError, ConnectionResetError):
+                # Clients that timed out on a stalled response have hung up.
+                self.server.count("disconnects")
+
+
+def start_mock_feed_server(
+    options: Optional[Dict[str, Any]] = None,
+    host: str = "127.0.0.1",
+    port: int = 0,
+) -> MockFeedServer:
+    """
+    Start a mock feed server on a background thread.
+
+    Args:
+        options: Overrides for DEFAULT_OPTIONS
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+
+    Returns:
+        The running server (call stop() when done)
+    """
+    return MockFeedServer((host, port), options).start()
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Serve synthetic feeds and UNGM pages for offline load tests.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--feeds", type=int, default=DEFAULT_OPTIONS["feeds"])
+    parser.add_argument("--feed-format", choices=["rss", "atom", "mixed"], default=DEFAULT_OPTIONS["feed_format"])
+    parser.add_argument("--entries", type=int, default=DEFAULT_OPTIONS["entries_per_feed"])
+    parser.add_argument("--payload-bytes", type=int, default=DEFAULT_OPTIONS["payload_bytes"])
+    parser.add_argument("--duplicate-rate", type=float, default=DEFAULT_OPTIONS["duplicate_rate"])
+    parser.add_argument("--ungm-notices", type=int, default=DEFAULT_OPTIONS["ungm_notices"])
+    parser.add_argument("--latency-ms", type=float, default=DEFAULT_OPTIONS["latency_ms"])
+    parser.add_argument(
+        "--latency-distribution",
+        choices=["fixed", "uniform", "exponential"],
+        default=DEFAULT_OPTIONS["latency_distribution"],
+    )
+    parser.add_argument("--error-rate", type=float, default=DEFAULT_OPTIONS["error_rate"])
+    parser.add_argument("--timeout-rate", type=float, default=DEFAULT_OPTIONS["timeout_rate"])
+    parser.add_argument("--stall-seconds", type=float, default=DEFAULT_OPTIONS["stall_seconds"])
+    parser.add_argument("--no-etag", action="store_true", help="Do not send validators or answer 304")
+    parser.add_argument("--seed", type=int, default=DEFAULT_OPTIONS["seed"])
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Run the mock server in the foreground until interrupted."""
+    args = parse_args(argv)
+    options = {
+        "feeds": args.feeds,
+        "feed_format": args.feed_format,
+        "entries_per_feed": args.entries,
+        "payload_bytes": args.payload_bytes,
+        "duplicate_rate": args.duplicate_rate,
+        "ungm_notices": args.ungm_notices,
+        "latency_ms": args.latency_ms,
+        "latency_distribution": args.latency_distribution,
+        "error_rate": args.error_rate,
+        "timeout_rate": args.timeout_rate,
+        "stall_seconds": args.stall_seconds,
+        "etag": not args.no_etag,
+        "seed": args.seed,
+    }
+    server = MockFeedServer((args.host, args.port), options)
+    print(f"Mock feed server on {server.base_url}")
+    print(f"Feed list: {server.base_url}/feeds/index.txt")
+    print(f"UNGM notice root: {server.ungm_notice_root}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Requests served: {server.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Synthetic RFP Corpus Generator
+
+Produces realistic entry dictionaries (the shape fetch_and_parse_feeds
+returns) and RSS/Atom documents in bulk for scale benchmarks and the mock
+feed server. Entries mix configured keywords, region and country terms,
+budget strings in every format extract_budget recognises, HTML noise and a
+controlled share of duplicate links. Output is deterministic for a seed.
+
+Usage:
+    python scripts/synthetic_corpus.py --count 100000 --duplicate-rate 0.1 --json /tmp/corpus.json
+    python scripts/synthetic_corpus.py --count 5000 --feeds 20 --rss-dir /tmp/feeds
+"""
+
+import argparse
+import json
+import os
+import random
+from datetime import datetime, timezone, timedelta
+from email.utils import format_datetime
+from html import escape
+from typing import Any, Dict, List, Optional
+
+from collect_rfps import COUNTRY_TO_REGION_GROUP, REGION_GROUP_TERMS, load_config
+
+
+DEFAULT_KEYWORDS = [
+    "climate adaptation",
+    "WASH",
+    "food security",
+    "renewable energy",
+    "public health",
+    "capacity building",
+]
+
+# Locations that match no configured region group, so region filtering has
+# something to drop.
+UNMATCHED_LOCATIONS = ["Norway", "Canada", "Portugal", "Japan", "New Zealand"]
+
+OFF_TOPIC_SUBJECTS = [
+    "office furniture",
+    "vehicle leasing",
+    "catering services",
+    "IT helpdesk support",
+    "printing and stationery",
+]
+
+SERVICES = [
+    "Evaluation of",
+    "Baseline survey for",
+    "Technical assistance on",
+    "Mid-term review of",
+    "Consultancy services for",
+    "Monitoring framework for",
+]
+
+SYNTHETIC_SOURCES = [
+    "procurement.example.gov",
+    "tenders.example.org",
+    "grants.example.int",
+    "bids.example.com",
+    "opportunities.example.net",
+]
+
+# One template per extract_budget pattern; {amount} is filled per format.
+BUDGET_FORMATS = [
+    ("{millions} million USD", "millions"),
+    ("{millions}M", "millions"),
+    ("USD {thousands}K", "thousands"),
+    ("${thousands}K", "thousands"),
+    ("${grouped}", "grouped"),
+    ("USD {grouped}", "grouped"),
+    ("Budget: {grouped}", "grouped"),
+    ("estimated value: ${grouped}", "grouped"),
+    ("€{grouped}", "grouped"),
+]
+
+HTML_NOISE = [
+    '<p>{text}</p>',
+    '<div class="content"><strong>Summary:</strong> {text}<br/></div>',
+    '<p>{text}&nbsp;&nbsp;<a href="https://example.org/docs">Tender documents</a></p>',
+    '<table><tr><td>{text}</td></tr></table><!-- generated -->',
+    '<p>{text}</p><p>Deadline &amp; submission details are in the <em>attached</em> ToR.</p>',
+]
+
+
+def get_region_terms() -> List[str]:
+    """Return every region and country term the region matcher knows about."""
+    terms = [term for group_terms in REGION_GROUP_TERMS.values() for term in group_terms if len(term) > 3]
+    terms.extend(COUNTRY_TO_REGION_GROUP)
+    return sorted(set(terms))
+
+
+def format_budget(rng: random.Random) -> str:
+    """Return a budget string in one of the formats extract_budget handles."""
+    template, kind = rng.choice(BUDGET_FORMATS)
+    if kind == "millions":
+        return template.format(millions=rng.choice(["1", "1.5", "2.5", "3", "12"]))
+    if kind == "thousands":
+        return template.format(thousands=rng.choice(["45", "150", "500", "750"]))
+    return template.format(grouped=f"{rng.randrange(20, 5000) * 1000:,}")
+
+
+def build_synthetic_text(
+    rng: random.Random,
+    keywords: List[str],
+    region_terms: List[str],
+    keyword_rate: float,
+    region_rate: float,
+    budget_rate: float,
+) -> Dict[str, str]:
+    """Compose a title and plain-text description for one entry."""
+    subject = rng.choice(keywords) if rng.random() < keyword_rate else rng.choice(OFF_TOPIC_SUBJECTS)
+    if rng.random() < region_rate:
+        location = rng.choice(region_terms).title()
+    else:
+        location = rng.choice(UNMATCHED_LOCATIONS)
+    title = f"{rng.choice(SERVICES)} {subject} programme in {location}"
+
+    sentences = [
+        f"The ministry invites proposals for {subject} activities in {location}.",
+        f"The assignment covers design, data collection and reporting over {rng.randint(3, 36)} months.",
+    ]
+    if rng.random() < budget_rate:
+        sentences.append(f"The indicative budget is {format_budget(rng)}.")
+    if rng.random() < keyword_rate / 2:
+        sentences.append(f"Experience in {rng.choice(keywords)} is an advantage.")
+    return {"title": title, "description": " ".join(sentences)}
+
+
+def generate_entries(
+    count: int,
+    config: Optional[Dict[str, Any]] = None,
+    seed: int = 0,
+    duplicate_rate: float = 0.0,
+    html_noise_rate: float = 0.5,
+    keyword_rate: float = 0.6,
+    region_rate: float = 0.7,
+    budget_rate: float = 0.6,
+    interval_hours: Optional[float] = None,
+    now: Optional[datetime] = None,
+    source: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Generate synthetic collector entries, newest first.
+
+    Without interval_hours, publication dates are spread over 1.25x
+    max_age_days so that age filtering drops a share of the corpus.
+    Duplicates reuse the link of an earlier entry (dedup is by link), half
+    of them cross-posted from a different source.
+
+    Args:
+        count: Total number of entries, duplicates included
+        config: Optional configuration supplying keywords and max_age_days
+        seed: Random seed; equal arguments give identical output
+        duplicate_rate: Share of entries that repeat an earlier link
+        html_noise_rate: Share of descriptions wrapped in HTML markup
+        keyword_rate: Share of entries about a configured keyword
+        region_rate: Share of entries naming a known region or country
+        budget_rate: Share of descriptions stating a budget
+        interval_hours: Fixed gap between consecutive publication dates
+        now: Reference time (defaults to the current UTC time)
+        source: Feed URL for every entry (defaults to a mix of synthetic hosts)
+
+    Returns:
+        List of entry dictionaries
+    """
+    config = config or {}
+    rng = random.Random(seed)
+    now = now or datetime.now(timezone.utc)
+    keywords = list(config.get("keywords") or DEFAULT_KEYWORDS)
+    region_terms = get_region_terms()
+    window_hours = float(config.get("max_age_days", 30)) * 24 * 1.25
+
+    entries: List[Dict[str, Any]] = []
+    originals: List[Dict[str, Any]] = []
+    for index in range(count):
+        if interval_hours is not None:
+            published = now - timedelta(hours=interval_hours * index)
+        else:
+            published = now - timedelta(hours=rng.uniform(0, window_hours))
+        entry_source = source or f"https://{rng.choice(SYNTHETIC_SOURCES)}/rss"
+
+        if originals and rng.random() < duplicate_rate:
+            original = rng.choice(originals)
+            duplicate = dict(original, published=published.isoformat())
+            if rng.random() < 0.5:
+                duplicate["source"] = entry_source
+                duplicate["source_name"] = entry_source.split("/")[2]
+            entries.append(duplicate)
+            continue
+
+        text = build_synthetic_text(rng, keywords, region_terms, keyword_rate, region_rate, budget_rate)
+        description = text["description"]
+        if rng.random() < html_noise_rate:
+            description = rng.choice(HTML_NOISE).format(text=description)
+        entry = {
+            "title": text["title"],
+            "link": f"https://{entry_source.split('/')[2]}/rfp/{seed}-{index}",
+            "description": description,
+            "published": published.isoformat(),
+            "source": entry_source,
+            "source_name": entry_source.split("/")[2],
+        }
+        originals.append(entry)
+        entries.append(entry)
+
+    entries.sort(key=lambda entry: entry["published"], reverse=True)
+    return entries
+
+
+def render_rss_document(entries: List[Dict[str, Any]], title: str = "Synthetic RFPs") -> str:
+    """Render entries as an RSS 2.0 document."""
+    items = "".join(
+        "<item>"
+        f"<title>{escape(entry['title'])}</title>"
+        f"<link>{escape(entry['link'])}</link>"
+        f"<description>{escape(entry['description'])}</description>"
+        f"<pubDate>{format_datetime(datetime.fromisoformat(entry['published']), usegmt=True)}</pubDate>"
+        "</item>"
+        for entry in entries
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f'<rss version="2.0"><channel><title>{escape(title)}</title>{items}</channel></rss>'
+    )
+
+
+def render_atom_document(entries: List[Dict[str, Any]], title: str = "Synthetic RFPs") -> str:
+    """Render entries as an Atom 1.0 document."""
+    items = "".join(
+        "<entry>"
+        f"<title>{escape(entry['title'])}</title>"
+        f'<link rel="alternate" href="{escape(entry["link"])}"/>'
+        f"<summary>{escape(entry['description'])}</summary>"
+        f"<updated>{entry['published']}</updated>"
+        "</entry>"
+        for entry in entries
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f'<feed xmlns="http://www.w3.org/2005/Atom"><title>{escape(title)}</title>{items}</feed>'
+    )
+
+
+def split_into_feeds(entries: List[Dict[str, Any]], feeds: int) -> List[List[Dict[str, Any]]]:
+    """Distribute entries round-robin over a number of feeds, keeping each newest first."""
+    feeds = max(1, feeds)
+    return [entries[index::feeds] for index in range(feeds)]
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Generate a synthetic RFP corpus.")
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--duplicate-rate", type=float, default=0.1)
+    parser.add_argument("--html-noise-rate", type=float, default=0.5)
+    parser.add_argument("--config", default="config.yml", help="Config supplying keywords and max_age_days")
+    parser.add_argument("--json", help="Write the entry dictionaries to this JSON file")
+    parser.add_argument("--rss-dir", help="Write RSS documents (feed_<n>.xml) into this directory")
+    parser.add_argument("--feeds", type=int, default=1, help="Number of RSS documents for --rss-dir")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Generate a corpus and write it as JSON and/or RSS files."""
+    args = parse_args(argv)
+    config = load_config(args.config) if os.path.exists(args.config) else {}
+    entries = generate_entries(
+        args.count,
+        config,
+        seed=args.seed,
+        duplicate_rate=args.duplicate_rate,
+        html_noise_rate=args.html_noise_rate,
+    )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+        print(f"Wrote {len(entries)} entries to {args.json}")
+
+    if args.rss_dir:
+        os.makedirs(args.rss_dir, exist_ok=True)
+        for index, feed_entries in enumerate(split_into_feeds(entries, args.feeds)):
+            path = os.path.join(args.rss_dir, f"feed_{index}.xml")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(render_rss_document(feed_entries, title=f"Synthetic feed {index}"))
+        print(f"Wrote {args.feeds} RSS documents to {args.rss_dir}")
+
+    if not args.json and not args.rss_dir:
+        print(json.dumps(entries[:3], indent=2))
+
+
+if __name__ == "__main__":
+    main()
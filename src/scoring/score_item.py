@@ -1,7 +1,10 @@
 """Score calculation for RFP items."""
 from datetime import datetime, timezone
+from functools import lru_cache
 import re
 
+from .term_scanner import TermScanner
+
 
 # Constants
 BUDGET_MULTIPLIER = 10
@@ -80,25 +83,34 @@ def get_configured_region_groups(regions):
     return configured_groups
 
 
+@lru_cache(maxsize=32)
+def build_term_scanner(keywords, regions):
+    """
+    Compile and cache the scanner for keyword and region terms.
+
+    Targets are ("keyword", keyword) substrings and ("region", group)
+    word-bounded terms of every configured region group.
+    """
+    targets = {}
+
+    def add_target(pattern, kind, name, word_bounded):
+        target = (kind, name, word_bounded)
+        if pattern and target not in targets.setdefault(pattern, []):
+            targets[pattern].append(target)
+
+    for keyword in keywords:
+        add_target(keyword, "keyword", keyword, False)
+    for group in sorted(get_configured_region_groups(regions)):
+        for term in REGION_GROUP_TERMS.get(group, []):
+            add_target(term.lower(), "region", group, True)
+    return TermScanner(targets)
+
+
 def get_matched_region_groups(text, configured_regions):
     """Find semantic region-group matches from text for configured regions."""
     if not text or not configured_regions:
         return set()
-
-    configured_groups = get_configured_region_groups(configured_regions)
-    if not configured_groups:
-        return set()
-
-    text_lower = text.lower()
-    matched_groups = set()
-    for group in configured_groups:
-        terms = REGION_GROUP_TERMS.get(group, [])
-        for term in terms:
-            if re.search(rf"\b{re.escape(term.lower())}\b", text_lower):
-                matched_groups.add(group)
-                break
-
-    return matched_groups
+    return build_term_scanner((), tuple(configured_regions)).scan(text).names("region")
 
 
 def apply_source_weighting(source, source_weights):
@@ -141,8 +153,10 @@ def score_item(item, config):
     days_window = config.get("days_window", 30)
     text = (item.get("title", "") + " " + item.get("summary", "")).lower()
     keywords = [k.lower() for k in config.get("keywords", [])]
+    scanner = build_term_scanner(tuple(keywords), tuple(config.get("regions", []) or []))
+    hits = scanner.scan(text)
     if keywords:
-        matches = sum(1 for k in keywords if k in text)
+        matches = sum(1 for k in keywords if not k or ("keyword", k) in hits.positions)
         keyword_score = matches / len(keywords)
     else:
         keyword_score = 0.0
@@ -160,7 +174,7 @@ def score_item(item, config):
         age_days = (now - pub).total_seconds() / SECONDS_PER_DAY
         recency_score = max(0.0, min(1.0, (days_window - age_days) / days_window))
     source_score = apply_source_weighting(item.get("source", ""), config.get("source_weights", {}))
-    matched_region_groups = get_matched_region_groups(text, config.get("regions", []))
+    matched_region_groups = hits.names("region")
     region_score = 1.0 if matched_region_groups else 0.0
     kw_w = float(weights.get("keyword", 0.45) or 0)
     bd_w = float(weights.get("budget", 0.25) or 0)
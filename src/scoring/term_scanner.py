@@ -0,0 +1,121 @@
+"""Aho-Corasick multi-pattern scanner for keyword and region terms."""
+
+
+def is_word_boundary(text, index):
+    """Whether `index` in text is a regex \\b word boundary."""
+    before = index > 0 and (text[index - 1].isalnum() or text[index - 1] == "_")
+    after = index < len(text) and (text[index].isalnum() or text[index] == "_")
+    return before != after
+
+
+class TermHits:
+    """Hit positions from one TermScanner pass, keyed by (kind, name)."""
+
+    __slots__ = ("positions",)
+
+    def __init__(self):
+        self.positions = {}
+
+    def add(self, kind, name, start):
+        self.positions.setdefault((kind, name), []).append(start)
+
+    def count(self, kind, name):
+        """Number of hits for one target."""
+        return len(self.positions.get((kind, name), ()))
+
+    def names(self, kind):
+        """Names of every target of a kind that was hit."""
+        return {name for hit_kind, name in self.positions if hit_kind == kind}
+
+
+class TermScanner:
+    """
+    Aho-Corasick automaton finding many terms in one pass over a text.
+
+    targets maps each lowercase pattern to a list of (kind, name, word_bounded)
+    targets. Transitions are resolved through the failure links up front
+    (omitting those equal to the root's), so scanning costs one or two dict
+    lookups per character regardless of the number of patterns.
+    Word-bounded targets only count on regex word boundaries. Positions are
+    offsets into the lowercased text.
+
+    This is the single implementation shared by src.scoring and
+    scripts/collect_rfps.py. Scanners are immutable once built and are
+    shared, not copied.
+    """
+
+    def __init__(self, targets):
+        transitions = [{}]
+        pattern_ends = [None]
+        for pattern in targets:
+            state = 0
+            for char in pattern:
+                next_state = transitions[state].get(char)
+                if next_state is None:
+                    next_state = len(transitions)
+                    transitions.append({})
+                    pattern_ends.append(None)
+                    transitions[state][char] = next_state
+                state = next_state
+            pattern_ends[state] = pattern
+
+        def own_output(state):
+            pattern = pattern_ends[state]
+            return ((len(pattern), tuple(targets[pattern])),) if pattern is not None else ()
+
+        root = transitions[0]
+        failure = [0] * len(transitions)
+        outputs = [()] * len(transitions)
+        resolved = [root] + [{} for _ in range(len(transitions) - 1)]
+        queue = list(root.values())
+        for state in queue:
+            outputs[state] = own_output(state)
+        position = 0
+        while position < len(queue):
+            state = queue[position]
+            position += 1
+            merged = {
+                char: target for char, target in resolved[failure[state]].items()
+                if failure[state] and root.get(char) != target
+            }
+            merged.update(transitions[state])
+            resolved[state] = merged
+            for char, child in transitions[state].items():
+                fallback = failure[state]
+                while fallback and char not in transitions[fallback]:
+                    fallback = failure[fallback]
+                failure[child] = transitions[fallback].get(char, 0)
+                outputs[child] = own_output(child) + outputs[failure[child]]
+                queue.append(child)
+
+        self.targets = targets
+        self.transitions = resolved
+        self.outputs = outputs
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def scan(self, text):
+        """Find every target hit in text in a single pass."""
+        hits = TermHits()
+        if not text:
+            return hits
+        text = text.lower()
+        transitions = self.transitions
+        outputs = self.outputs
+        root_get = transitions[0].get
+        state = 0
+        for index, char in enumerate(text):
+            state = transitions[state].get(char) or root_get(char, 0)
+            if outputs[state]:
+                end = index + 1
+                for length, targets in outputs[state]:
+                    start = end - length
+                    for kind, name, word_bounded in targets:
+                        if word_bounded and not (is_word_boundary(text, start) and is_word_boundary(text, end)):
+                            continue
+                        hits.add(kind, name, start)
+        return hits
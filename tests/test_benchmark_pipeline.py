@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for the pipeline benchmark harness.
+"""
+
+import sys
+import os
+
+# Add scripts directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from collect_rfps import configure_http_client
+from benchmark_pipeline import (
+    STAGES,
+    build_ungm_pages,
+    compare_with_baseline,
+    format_results,
+    load_ungm_pages,
+    merge_baseline,
+    run_benchmarks,
+)
+
+
+CONFIG = {
+    'keywords': ['WASH', 'public health'],
+    'regions': ['South Asia (SAR)'],
+    'min_budget': 50000,
+    'max_age_days': 30,
+    'max_results': 5,
+}
+
+
+class TestBenchmarkPipeline:
+    """Tests for stage timing and baseline comparison."""
+
+    def test_run_benchmarks_times_every_stage(self):
+        try:
+            results = run_benchmarks([60], CONFIG, repeat=1)
+        finally:
+            configure_http_client({})
+
+        stages = results['sizes']['60']
+        assert set(stages) == set(STAGES)
+        assert stages['fetch']['entries'] == 60
+        for measured in stages.values():
+            assert measured['seconds'] >= 0
+            assert measured['peak_kib'] >= 0
+        assert 'fetch' in format_results(results)
+
+    def test_ungm_parse_stage_uses_saved_pages(self, tmp_path):
+        for index, page in enumerate(build_ungm_pages(3, page_bytes=5000)):
+            (tmp_path / f"notice_{index}.html").write_text(page, encoding='utf-8')
+        pages = load_ungm_pages(str(tmp_path))
+
+        results = run_benchmarks([10], CONFIG, repeat=1, stages=['ungm_parse'], ungm_pages=pages)
+
+        assert len(pages) == 3
+        assert results['sizes']['10']['ungm_parse']['entries'] == 3
+
+    def test_compare_with_baseline_flags_slow_stages(self):
+        baseline = {'sizes': {'1000': {'filter': {'seconds': 1.0}, 'score': {'seconds': 1.0}}}}
+        results = {'sizes': {'1000': {
+            'filter': {'seconds': 1.1},
+            'score': {'seconds': 1.6},
+            'render': {'seconds': 9.0},
+        }}}
+
+        regressions = compare_with_baseline(results, baseline, tolerance=0.25)
+
+        assert len(regressions) == 1
+        assert regressions[0].startswith('score @ 1000')
+
+    def test_merge_baseline_keeps_stages_that_were_not_run(self):
+        baseline = {'environment': {}, 'sizes': {'1000': {'filter': {'seconds': 1.0}, 'score': {'seconds': 1.0}}}}
+        results = {'environment': {'python': '3.11'}, 'sizes': {
+            '1000': {'score': {'seconds': 0.5}},
+            '5000': {'score': {'seconds': 2.5}},
+        }}
+
+        merged = merge_baseline(baseline, results)
+
+        assert merged['sizes']['1000'] == {'filter': {'seconds': 1.0}, 'score': {'seconds': 0.5}}
+        assert merged['sizes']['5000'] == {'score': {'seconds': 2.5}}
+        assert baseline['sizes']['1000']['score'] == {'seconds': 1.0}
@@ -9,18 +9,30 @@ Tests validate core functionality including:
 - Scoring logic
 """
 
+import copy
+import feedparser
+import pickle
 import pytest
+import requests
 from unittest.mock import Mock, patch
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 from types import SimpleNamespace
 import sys
 import os
+import threading
+import time
 
 # Add scripts directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
 
 from collect_rfps import (
     validate_link,
+    HttpClient,
+    DeadlineExceeded,
+    configure_http_client,
+    get_http_client,
+    is_feed_failure,
+    iter_chunks_until_deadline,
     extract_budget,
     apply_source_weighting,
     calculate_score,
@@ -28,71 +40,193 @@ from collect_rfps import (
     score_budget,
     score_recency,
     filter_entries,
+    get_age_cutoff,
+    is_outside_age_window,
     fetch_and_parse_feeds,
+    get_fetch_concurrency,
+    get_fetch_deadline,
+    load_feed_health,
+    save_feed_health,
+    update_feed_health,
+    is_feed_circuit_open,
+    record_feed_yield,
+    prioritize_feeds,
+    is_zero_yield_feed,
+    estimate_update_interval_hours,
+    schedule_next_poll,
+    is_feed_due,
+    load_collector_state,
+    reload_changed_sources,
+    run_daemon,
+    get_daemon_sleep_seconds,
+    main,
+    configure_http_archive,
+    new_http_archive,
+    load_http_archive,
+    save_http_archive,
+    utc_now,
+    load_feed_cache,
+    save_feed_cache,
+    iter_streamed_feed_items,
+    load_feed_document,
+    parse_feed_document_fast,
+    fetch_feed_entries,
+    probe_last_modified_dates,
+    get_probe_host_semaphore,
+    load_last_modified_cache,
+    save_last_modified_cache,
+    fetch_ungm_fallback_entries,
+    build_ungm_search_options,
+    build_ungm_search_filters,
+    parse_ungm_search_total,
+    record_ungm_pushdown_savings,
+    crawl_ungm_notices,
+    load_ungm_notice_cache,
+    save_ungm_notice_cache,
     parse_ungm_notice_entry,
+    extract_ungm_notice_fields,
     parse_ungm_search_result_links,
     generate_markdown_output,
     get_priority_band,
+    html_to_text,
+    normalize_entries,
+    TermScanner,
+    get_entry_term_hits,
+    get_term_scanner,
+    get_matched_region_groups,
+    Entry,
+    format_published_date,
+    sanitize_summary,
 )
 
 
+UNGM_FEED = 'https://www.ungm.org/Public/Notice'
+
+
+def days_ago(days):
+    """Return the aware UTC datetime `days` days before now."""
+    return datetime.now(timezone.utc) - timedelta(days=days)
+
+
+def make_feed_item(link, title='Item', published=None, **fields):
+    """Build a feedparser-style feed item; `published` is an aware datetime or None."""
+    item = SimpleNamespace(title=title, link=link, **fields)
+    if published is not None:
+        item.published_parsed = published.timetuple()
+    item.get = lambda key, default=None: getattr(item, key, default)
+    return item
+
+
+def make_feed(*items, title='Example', **fields):
+    """Build a feedparser-style result holding `items` (status, etag, ... via fields)."""
+    return SimpleNamespace(entries=list(items), feed={'title': title}, **fields)
+
+
+def make_entry(link, title=None, source='https://example.com/rss', source_name='Example', **fields):
+    """Build a parsed entry dictionary, published now, as fetch_feed_entries returns it."""
+    entry = {
+        'title': link if title is None else title,
+        'link': link,
+        'description': '',
+        'published': datetime.now(timezone.utc).isoformat(),
+        'source': source,
+        'source_name': source_name,
+    }
+    entry.update(fields)
+    return entry
+
+
+def make_notice_entry(notice_url, source_url, **kwargs):
+    """Stand-in for fetch_ungm_notice_entry returning a fresh notice."""
+    return make_entry(
+        notice_url,
+        title=f'Notice {notice_url.rsplit("/", 1)[-1]}',
+        source=source_url,
+        source_name='United Nations Global Marketplace',
+    )
+
+
+def make_response(status_code=200, content=b'', headers=None, url='https://example.com/rss', request=None):
+    """Build a requests.Response without a network round trip."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers = requests.structures.CaseInsensitiveDict(headers or {})
+    response._content = content
+    response.encoding = 'utf-8'
+    response.url = request.url if request is not None else url
+    response.request = request
+    return response
+
+
+def make_rss(*ages_in_days, title='Big feed', item_title='Item {index}', description='Body {index}',
+             root='https://example.com'):
+    """Build an RSS 2.0 document with one item per age (in days), in the given order."""
+    items = ''.join(
+        f"<item><title>{item_title.format(index=index)}</title><link>{root}/{index}</link>"
+        f"<description>{description.format(index=index)}</description>"
+        f"<pubDate>{days_ago(age).strftime('%a, %d %b %Y %H:%M:%S GMT')}</pubDate></item>"
+        for index, age in enumerate(ages_in_days)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>{title}</title>{items}</channel></rss>'.encode()
+
+
 class TestValidateLink:
     """Tests for validate_link function."""
     
-    @patch('collect_rfps.requests.head')
-    def test_validate_link_success(self, mock_head):
+    @patch('collect_rfps.get_http_client')
+    def test_validate_link_success(self, mock_get_client):
         """Test validate_link with successful response."""
         # Mock successful response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_head.return_value = mock_response
+        mock_get_client.return_value.head.return_value = mock_response
         
         result = validate_link('https://example.com')
         
         assert result is True
-        mock_head.assert_called_once()
+        mock_get_client.return_value.head.assert_called_once()
     
-    @patch('collect_rfps.requests.head')
-    def test_validate_link_not_found(self, mock_head):
+    @patch('collect_rfps.get_http_client')
+    def test_validate_link_not_found(self, mock_get_client):
         """Test validate_link with 404 error."""
         # Mock 404 response
         mock_response = Mock()
         mock_response.status_code = 404
-        mock_head.return_value = mock_response
+        mock_get_client.return_value.head.return_value = mock_response
         
         result = validate_link('https://example.com/notfound')
         
         assert result is False
     
-    @patch('collect_rfps.requests.head')
-    def test_validate_link_server_error(self, mock_head):
+    @patch('collect_rfps.get_http_client')
+    def test_validate_link_server_error(self, mock_get_client):
         """Test validate_link with server error."""
         # Mock 500 response
         mock_response = Mock()
         mock_response.status_code = 500
-        mock_head.return_value = mock_response
+        mock_get_client.return_value.head.return_value = mock_response
         
         result = validate_link('https://example.com/error')
         
         assert result is False
     
-    @patch('collect_rfps.requests.head')
-    def test_validate_link_timeout(self, mock_head):
+    @patch('collect_rfps.get_http_client')
+    def test_validate_link_timeout(self, mock_get_client):
         """Test validate_link with timeout exception."""
         import requests
         # Mock timeout exception
-        mock_head.side_effect = requests.Timeout()
+        mock_get_client.return_value.head.side_effect = requests.Timeout()
         
         result = validate_link('https://example.com/timeout')
         
         assert result is False
     
-    @patch('collect_rfps.requests.head')
-    def test_validate_link_connection_error(self, mock_head):
+    @patch('collect_rfps.get_http_client')
+    def test_validate_link_connection_error(self, mock_get_client):
         """Test validate_link with connection error."""
         import requests
         # Mock connection error
-        mock_head.side_effect = requests.ConnectionError()
+        mock_get_client.return_value.head.side_effect = requests.ConnectionError()
         
         result = validate_link('https://example.com/error')
         
@@ -528,6 +662,60 @@ class TestRegionFiltering:
         assert diagnostics['region_unmatched'] == 0
         assert diagnostics['dropped_region'] == 0
 
+    def test_term_scanner_is_built_once_per_config(self):
+        """Filter and scoring share one compiled scanner per keywords and region labels."""
+        config = {'keywords': ['WASH'], 'regions': ['South Asia (SAR)', {'Middle East (MENAP)': 'Includes Iraq'}]}
+
+        scanner = get_term_scanner(config)
+        hits = scanner.scan('WASH survey in INDIA and Iraq')
+
+        assert get_term_scanner(dict(config)) is scanner
+        assert hits.names('region') == {'SAR', 'MENAP'}
+        assert hits.positions[('keyword', 'wash')] == [0]
+        assert scanner.scan('Indiana and Sarajevo').names('region') == set()
+        assert get_matched_region_groups('Pakistan', config['regions']) == {'SAR', 'MENAP'}
+
+    def test_term_scanner_reports_overlapping_terms(self):
+        """Every pattern is found, including ones inside or overlapping longer ones."""
+        scanner = TermScanner({
+            'south asia': [('region', 'EAP', True)],
+            'south': [('region', 'SAR', True)],
+            'asia pacific': [('region', 'SSA', True)],
+            'out': [('keyword', 'out', False)],
+        })
+
+        hits = scanner.scan('the South Asia Pacific corridor, southern asia')
+
+        assert hits.names('region') == {'EAP', 'SAR', 'SSA'}
+        assert hits.positions[('region', 'SAR')] == [4]
+        assert hits.count('keyword', 'out') == 2
+
+    def test_filter_and_score_share_one_scan_per_entry(self):
+        """An Entry is scanned once for both the region filter and scoring."""
+        config = {
+            'keywords': ['evaluation', 'wash'],
+            'regions': ['South Asia (SAR)'],
+            'min_budget': 0,
+            'max_age_days': 30,
+        }
+        entries = normalize_entries([{
+            'title': 'WASH evaluation',
+            'description': 'Programme in Bangladesh',
+            'published': datetime.now(timezone.utc).isoformat(),
+            'source': 'https://example.com/rss',
+            'link': 'https://example.com/1',
+        }])
+        scanner = get_term_scanner(config)
+
+        with patch.object(TermScanner, 'scan', autospec=True, side_effect=TermScanner.scan) as mock_scan:
+            filtered = filter_entries(entries, config, diagnostics={})
+            score = calculate_score(filtered[0], config)
+
+        assert mock_scan.call_count == 1
+        assert mock_scan.call_args[0][0] is scanner
+        assert filtered[0]['matched_regions'] == ['SAR']
+        assert score > 0.5
+
 
 class TestUNGMFallback:
     """Tests for UNGM HTML/API fallback ingestion helpers."""
@@ -576,15 +764,75 @@ class TestUNGMFallback:
         assert 'UNESCO Invitation to Bid' in entry['description']
         assert entry['published'] == datetime(2026, 1, 28, tzinfo=timezone.utc).isoformat()
 
+    def test_extract_ungm_notice_fields_keeps_nested_description(self):
+        """The description div is captured whole, including inner blocks."""
+        page_html = (
+            '<title>Notice &amp; tender</title>'
+            '<span class="label">Reference:</span> <span class="value">RFP/1</span>'
+            '<span class="label">Published on:</span>\n<span class="value">28-Jan-2026</span>'
+            '<div><div class="title">Description</div>\n'
+            '<div><p>Evaluation in <b>Kenya</b></p><div>Second block</div> end</div></div><br/>'
+        )
+
+        fields = extract_ungm_notice_fields(page_html)
+
+        assert fields['title'] == 'Notice & tender'
+        assert fields['metadata'] == {'Reference': 'RFP/1', 'Published on': '28-Jan-2026'}
+        assert fields['description'] == 'Evaluation in Kenya Second block end'
+
+    def test_extract_ungm_notice_fields_requires_adjacent_pairs(self):
+        """Labels and the Description heading only pair with the element right after them."""
+        page_html = (
+            '<span class="label">Published on:</span> text <span class="value">28-Jan-2026</span>'
+            '<div class="title">Description</div><p>Intro</p><div>Not the description</div>'
+        )
+
+        fields = extract_ungm_notice_fields(page_html)
+
+        assert fields['metadata'] == {}
+        assert fields['description'] is None
+
+    def test_extract_ungm_notice_fields_stops_after_required_fields(self):
+        """Content after title, publication date and description is not scanned."""
+        page_html = (
+            '<title>Notice</title>'
+            '<span class="label">Published on:</span><span class="value">28-Jan-2026</span>'
+            '<div class="title">Description</div><div>Scope</div>'
+            '<span class="label">Deadline on:</span><span class="value">01-Mar-2026</span>'
+        )
+
+        fields = extract_ungm_notice_fields(page_html)
+
+        assert fields['description'] == 'Scope'
+        assert 'Deadline on' not in fields['metadata']
+
+    def test_parse_ungm_notice_entry_handles_unterminated_description(self):
+        """Pages with many unpaired labels and an unclosed description parse in linear time."""
+        page_html = (
+            '<title>t</title>'
+            + '<span class="label">Published on:</span> junk ' * 2000
+            + '<div class="title">Description</div><div>' + 'x ' * 20000
+        )
+
+        started = time.monotonic()
+        entry = parse_ungm_notice_entry(
+            'https://www.ungm.org/Public/Notice/1',
+            page_html,
+            'https://www.ungm.org/Public/Notice',
+        )
+
+        assert entry is None
+        assert time.monotonic() - started < 1.0
+
     @patch('collect_rfps.fetch_ungm_fallback_entries')
-    @patch('collect_rfps.feedparser.parse')
+    @patch('collect_rfps.fetch_feed_document')
     def test_fetch_and_parse_feeds_uses_ungm_fallback_when_rss_empty(
         self,
-        mock_feed_parse,
+        mock_feed_document,
         mock_fallback,
     ):
         """UNGM fallback should be used when feedparser yields no entries."""
-        mock_feed_parse.return_value = SimpleNamespace(entries=[], feed={"title": "UNGM"})
+        mock_feed_document.return_value = SimpleNamespace(entries=[], feed={"title": "UNGM"})
         mock_fallback.return_value = [
             {
                 'title': 'Supply and delivery in Ninewa, Iraq',
@@ -733,5 +981,1616 @@ class TestMarkdownOutput:
         assert 'No qualifying opportunities for this run.' in content
 
 
+class TestConcurrentFetch:
+    """Tests for the bounded worker-pool feed fetch mode."""
+
+    def test_get_fetch_concurrency_bounds(self):
+        """Concurrency defaults to sequential and never exceeds the feed count."""
+        assert get_fetch_concurrency({}, 10) == 1
+        assert get_fetch_concurrency(None, 10) == 1
+        assert get_fetch_concurrency({'fetch_concurrency': 8}, 3) == 3
+        assert get_fetch_concurrency({'fetch_concurrency': 0}, 3) == 1
+        assert get_fetch_concurrency({'fetch_concurrency': 'bad'}, 3) == 1
+
+    @patch('collect_rfps.fetch_feed_document')
+    def test_fetch_and_parse_feeds_parallel_keeps_feed_order(self, mock_feed_parse):
+        """Parallel fetching returns entries in feed order even when early feeds are slow."""
+        now = datetime.now(timezone.utc)
+        delays = {'https://a.example/rss': 0.05, 'https://b.example/rss': 0.0, 'https://c.example/rss': 0.02}
+
+        def fake_parse(feed_url, feed_cache=None):
+            time.sleep(delays[feed_url])
+            return make_feed(make_feed_item(f'{feed_url}/1', f'Item from {feed_url}', now), title=feed_url)
+
+        mock_feed_parse.side_effect = fake_parse
+
+        entries = fetch_and_parse_feeds(list(delays), config={'fetch_concurrency': 3})
+
+        assert [entry['source'] for entry in entries] == list(delays)
+
+    @patch('collect_rfps.fetch_feed_document')
+    def test_fetch_and_parse_feeds_isolates_feed_errors(self, mock_feed_parse):
+        """A failing feed does not prevent other feeds from being returned."""
+        now = datetime.now(timezone.utc)
+
+        def fake_parse(feed_url, feed_cache=None):
+            if 'broken' in feed_url:
+                raise RuntimeError('boom')
+            return make_feed(make_feed_item(f'{feed_url}/1', published=now), title='Feed')
+
+        mock_feed_parse.side_effect = fake_parse
+
+        entries = fetch_and_parse_feeds(
+            ['https://broken.example/rss', 'https://ok.example/rss'],
+            config={'fetch_concurrency': 2},
+        )
+
+        assert [entry['link'] for entry in entries] == ['https://ok.example/rss/1']
+
+
+class TestAsyncIngestion:
+    """Tests for the single event loop ingestion mode."""
+
+    @patch('collect_rfps.get_last_modified_from_url')
+    @patch('collect_rfps.fetch_feed_document')
+    def test_async_mode_matches_threaded_output(self, mock_feed_parse, mock_last_modified):
+        """Async mode returns the same normalized entries as the threaded mode."""
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+
+        def fake_parse(feed_url, feed_cache=None):
+            return make_feed(
+                make_feed_item(f'{feed_url}/1', f'Item {feed_url}/1', now, summary='Details'),
+                make_feed_item(f'{feed_url}/2', f'Item {feed_url}/2', summary='Details'),
+                title='Feed',
+            )
+
+        mock_feed_parse.side_effect = fake_parse
+        mock_last_modified.return_value = now
+        feeds = ['https://a.example/rss', 'https://b.example/rss']
+
+        threaded = fetch_and_parse_feeds(feeds, config={'fetch_concurrency': 2})
+        async_entries = fetch_and_parse_feeds(feeds, config={'fetch_mode': 'async', 'per_host_concurrency': 2})
+
+        assert async_entries == threaded
+        assert len(async_entries) == 4
+        assert mock_last_modified.call_count == 4
+
+    @patch('collect_rfps.fetch_ungm_notice_entry')
+    @patch('collect_rfps.fetch_ungm_search_page')
+    @patch('collect_rfps.fetch_feed_document')
+    def test_async_mode_fetches_ungm_notices(self, mock_feed_parse, mock_search_page, mock_notice_entry):
+        """Async mode runs UNGM search and detail fetches and keeps notice order."""
+        mock_feed_parse.return_value = make_feed(title='UNGM')
+        mock_search_page.return_value = [
+            'https://www.ungm.org/Public/Notice/1',
+            'https://www.ungm.org/Public/Notice/2',
+        ]
+        mock_notice_entry.side_effect = make_notice_entry
+
+        entries = fetch_and_parse_feeds(
+            ['https://www.ungm.org/Public/Notice'],
+            config={'fetch_mode': 'async', 'ungm_search_page_size': 15},
+        )
+
+        assert [entry['link'] for entry in entries] == [
+            'https://www.ungm.org/Public/Notice/1',
+            'https://www.ungm.org/Public/Notice/2',
+        ]
+        mock_search_page.assert_called_once()
+
+
+class TestFeedCache:
+    """Tests for the conditional GET feed cache."""
+
+    RSS_BODY = b"""<?xml version="1.0"?>
+        <rss version="2.0"><channel><title>Example</title>
+          <item>
+            <title>Cached item</title>
+            <link>https://example.com/1</link>
+            <pubDate>Mon, 02 Mar 2026 09:00:00 GMT</pubDate>
+          </item>
+        </channel></rss>"""
+
+    @patch('collect_rfps.get_http_client')
+    def test_cache_sends_validators_and_reuses_entries_on_304(self, mock_get_client):
+        """A 304 response reuses cached entries and counts as a cache hit."""
+        feed_url = 'https://example.com/rss'
+        client = mock_get_client.return_value
+        client.get.return_value = make_response(
+            200,
+            self.RSS_BODY,
+            {'ETag': '"abc"', 'Last-Modified': 'Mon, 02 Mar 2026 09:00:00 GMT'},
+        )
+        feed_cache = {}
+        first_diagnostics = {}
+
+        first = fetch_and_parse_feeds([feed_url], feed_cache=feed_cache, diagnostics=first_diagnostics)
+
+        assert [entry['link'] for entry in first] == ['https://example.com/1']
+        assert first_diagnostics['feed_cache_misses'] == 1
+        assert feed_cache[feed_url]['etag'] == '"abc"'
+
+        client.get.return_value = make_response(304)
+        second_diagnostics = {}
+
+        second = fetch_and_parse_feeds([feed_url], feed_cache=feed_cache, diagnostics=second_diagnostics)
+
+        client.get.assert_called_with(
+            feed_url,
+            headers={
+                'If-None-Match': '"abc"',
+                'If-Modified-Since': 'Mon, 02 Mar 2026 09:00:00 GMT',
+            },
+        )
+        assert second == first
+        assert second_diagnostics['feed_cache_hits'] == 1
+        assert second_diagnostics['feed_cache_misses'] == 0
+        assert second_diagnostics['feed_cache_entries_reused'] == 1
+
+    @patch('collect_rfps.get_http_client')
+    def test_cache_skips_feeds_without_validators(self, mock_get_client):
+        """Feeds without ETag or Last-Modified are not cached."""
+        mock_get_client.return_value.get.return_value = make_response(200, self.RSS_BODY)
+        feed_cache = {}
+
+        entries = fetch_and_parse_feeds(['https://example.com/rss'], feed_cache=feed_cache)
+
+        assert len(entries) == 1
+        assert feed_cache == {}
+
+    def test_feed_cache_round_trip(self, tmp_path):
+        """Saved feed caches load back unchanged, and missing files load empty."""
+        cache_path = str(tmp_path / 'data' / 'feed_cache.json')
+        feed_cache = {'https://example.com/rss': {'etag': '"abc"', 'modified': None, 'entries': []}}
+
+        assert load_feed_cache(cache_path) == {}
+        save_feed_cache(feed_cache, cache_path)
+        assert load_feed_cache(cache_path) == feed_cache
+
+    def test_generate_markdown_output_reports_cache_metrics(self, tmp_path):
+        """Cache hits and misses appear in the pipeline metrics section."""
+        output_path = tmp_path / 'index.md'
+        metrics = {'feed_cache_hits': 3, 'feed_cache_misses': 2, 'feed_cache_entries_reused': 40}
+
+        generate_markdown_output([], metrics, str(output_path))
+        content = output_path.read_text()
+
+        assert '- **Feed cache hits (not modified):** 3' in content
+        assert '- **Feed cache misses (downloaded):** 2' in content
+        assert '- **Entries served from cache:** 40' in content
+
+
+class TestHttpClient:
+    """Tests for the shared pooled HTTP session."""
+
+    def test_connection_stats_count_keep_alive_reuse(self):
+        """Repeated requests to one host reuse a single pooled connection."""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header('Content-Length', '2')
+                self.end_headers()
+                self.wfile.write(b'ok')
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        client = HttpClient(pool_maxsize=2)
+        try:
+            url = f'http://127.0.0.1:{server.server_address[1]}/'
+            for _ in range(3):
+                assert client.get(url).status_code == 200
+            stats = client.connection_stats()
+        finally:
+            client.close()
+            server.shutdown()
+            server.server_close()
+
+        assert stats == {'requests': 3, 'new_connections': 1, 'reused_connections': 2}
+
+    def test_request_applies_default_timeouts(self):
+        """HEAD requests use the probe timeout and other methods the default timeout."""
+        client = HttpClient(timeout=12, probe_timeout=3)
+        client.session = Mock()
+
+        client.head('https://example.com')
+        client.get('https://example.com')
+        client.post('https://example.com', timeout=7)
+
+        timeouts = [call.kwargs['timeout'] for call in client.session.request.call_args_list]
+        assert timeouts == [3, 12, 7]
+
+    def test_configure_http_client_applies_config(self):
+        """Configured pool sizes, timeouts and headers are applied to the shared client."""
+        client = configure_http_client({
+            'http_pool_maxsize': 4,
+            'http_timeout': 30,
+            'http_headers': {'User-Agent': 'rfpintelligence-test'},
+        })
+
+        assert get_http_client() is client
+        assert client.timeout == 30
+        assert client.adapter._pool_maxsize == 4
+        assert client.session.headers['User-Agent'] == 'rfpintelligence-test'
+
+
+class TestLastModifiedFallback:
+    """Tests for batched, cached Last-Modified probes."""
+
+    @patch('collect_rfps.get_last_modified_from_url')
+    def test_probes_run_once_per_url_and_fill_cache(self, mock_last_modified):
+        """Each distinct link is probed once and remembered, including misses."""
+        published = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        mock_last_modified.side_effect = lambda url: published if url.endswith('/1') else None
+        cache = {}
+        stats = {}
+
+        results = probe_last_modified_dates(
+            ['https://a.example/1', 'https://a.example/2', 'https://a.example/1'],
+            config={'last_modified_concurrency': 4},
+            last_modified_cache=cache,
+            feed_stats=stats,
+        )
+
+        assert results == {'https://a.example/1': published, 'https://a.example/2': None}
+        assert mock_last_modified.call_count == 2
+        assert cache['https://a.example/1']['last_modified'] == published.isoformat()
+        assert cache['https://a.example/2']['last_modified'] is None
+        assert stats == {'last_modified_cache_hits': 0, 'last_modified_probes': 2}
+
+    def test_host_semaphore_follows_a_changed_limit(self):
+        """A new per_host_concurrency gets its own semaphore instead of the first one."""
+        first = get_probe_host_semaphore('https://limits.example/a', 2)
+
+        assert get_probe_host_semaphore('https://LIMITS.example/b', 2) is first
+        changed = get_probe_host_semaphore('https://limits.example/a', 5)
+        assert changed is not first
+        assert all(changed.acquire(blocking=False) for _ in range(5))
+        assert not changed.acquire(blocking=False)
+
+    @patch('collect_rfps.get_last_modified_from_url')
+    def test_fresh_cache_records_skip_probes(self, mock_last_modified):
+        """Links with a cached result inside the TTL are not probed again."""
+        from datetime import timedelta
+
+        now = datetime.now(timezone.utc)
+        cache = {
+            'https://a.example/fresh': {'last_modified': now.isoformat(), 'checked_at': now.isoformat()},
+            'https://a.example/stale': {
+                'last_modified': None,
+                'checked_at': (now - timedelta(days=30)).isoformat(),
+            },
+        }
+        mock_last_modified.return_value = None
+
+        results = probe_last_modified_dates(
+            ['https://a.example/fresh', 'https://a.example/stale'],
+            config={'last_modified_cache_ttl_days': 7},
+            last_modified_cache=cache,
+        )
+
+        assert results['https://a.example/fresh'] == now
+        mock_last_modified.assert_called_once_with('https://a.example/stale')
+
+    @patch('collect_rfps.get_last_modified_from_url')
+    @patch('collect_rfps.fetch_feed_document')
+    def test_fetch_batches_undated_entries(self, mock_feed_document, mock_last_modified):
+        """Undated feed items are resolved through the batch and keep feed order."""
+        published = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+        mock_feed_document.return_value = make_feed(
+            make_feed_item('https://a.example/1', 'Undated'),
+            make_feed_item('https://a.example/2', 'Undated'),
+            title='Feed',
+        )
+        mock_last_modified.side_effect = lambda url: published if url.endswith('/2') else None
+        diagnostics = {}
+
+        entries = fetch_and_parse_feeds(
+            ['https://a.example/rss'],
+            diagnostics=diagnostics,
+            last_modified_cache={},
+        )
+
+        assert [entry['link'] for entry in entries] == ['https://a.example/2']
+        assert diagnostics['last_modified_probes'] == 2
+
+    def test_save_drops_expired_records(self, tmp_path):
+        """Saving the cache discards records older than the TTL."""
+        from datetime import timedelta
+
+        now = datetime.now(timezone.utc)
+        cache_path = str(tmp_path / 'last_modified_cache.json')
+        cache = {
+            'https://a.example/fresh': {'last_modified': None, 'checked_at': now.isoformat()},
+            'https://a.example/old': {
+                'last_modified': None,
+                'checked_at': (now - timedelta(days=10)).isoformat(),
+            },
+        }
+
+        save_last_modified_cache(cache, cache_path, ttl_days=7)
+
+        assert list(load_last_modified_cache(cache_path)) == ['https://a.example/fresh']
+
+
+class TestUNGMNoticeCache:
+    """Tests for the persistent UNGM notice cache."""
+
+    NOTICE_HTML = """
+        <html><head><title>Supply and delivery in Ninewa, Iraq</title></head>
+        <body>
+          <span class="label">Published on:</span><span class="value">28-Jan-2026</span>
+          <div class="title">Description</div>
+          <div>UNESCO Invitation to Bid.</div>
+        </body></html>
+    """
+
+    CONFIG = {
+        'ungm_fallback_enabled': True,
+        'ungm_notice_ids': [289708],
+        'ungm_notice_revalidate_days': 30,
+    }
+
+    @patch('collect_rfps.fetch_ungm_notice_links', return_value=[])
+    @patch('collect_rfps.get_http_client')
+    def test_recent_notices_are_served_from_cache(self, mock_get_client, mock_links):
+        """A notice fetched within the revalidation window is not downloaded again."""
+        mock_get_client.return_value.get.return_value = make_response(content=self.NOTICE_HTML.encode())
+        notice_cache = {'notices': {}}
+        first_stats = {}
+
+        first = fetch_ungm_fallback_entries(UNGM_FEED, self.CONFIG, notice_cache, first_stats)
+        second_stats = {}
+        second = fetch_ungm_fallback_entries(UNGM_FEED, self.CONFIG, notice_cache, second_stats)
+
+        assert first == second
+        assert first[0]['title'] == 'Supply and delivery in Ninewa, Iraq'
+        assert mock_get_client.return_value.get.call_count == 1
+        assert first_stats == {'ungm_notice_downloads': 1}
+        assert second_stats == {'ungm_notice_cache_hits': 1}
+        assert notice_cache['notices']['289708']['content_hash']
+
+    @patch('collect_rfps.parse_ungm_notice_entry')
+    @patch('collect_rfps.fetch_ungm_notice_links', return_value=[])
+    @patch('collect_rfps.get_http_client')
+    def test_unchanged_page_is_not_reparsed_after_revalidation(self, mock_get_client, mock_links, mock_parse):
+        """An expired record is refetched but reused when the content hash matches."""
+        import hashlib
+
+        mock_get_client.return_value.get.return_value = make_response(content=self.NOTICE_HTML.encode())
+        cached_entry = {'title': 'Cached', 'link': 'https://www.ungm.org/Public/Notice/289708'}
+        notice_cache = {'notices': {'289708': {
+            'entry': cached_entry,
+            'content_hash': hashlib.sha256(self.NOTICE_HTML.encode('utf-8')).hexdigest(),
+            'fetched_at': '2020-01-01T00:00:00+00:00',
+            'last_seen': '2020-01-01T00:00:00+00:00',
+        }}}
+
+        entries = fetch_ungm_fallback_entries(UNGM_FEED, self.CONFIG, notice_cache)
+
+        assert entries == [dict(cached_entry, source=UNGM_FEED)]
+        mock_parse.assert_not_called()
+        assert notice_cache['notices']['289708']['fetched_at'] > '2020-01-01'
+
+    def test_save_evicts_stale_and_excess_records(self, tmp_path):
+        """Saving drops records past the max age and keeps the most recently seen."""
+        from datetime import timedelta
+
+        now = datetime.now(timezone.utc)
+        cache_path = str(tmp_path / 'ungm_notice_cache.json')
+        notice_cache = {'notices': {
+            'old': {'last_seen': (now - timedelta(days=200)).isoformat()},
+            'a': {'last_seen': (now - timedelta(days=2)).isoformat()},
+            'b': {'last_seen': (now - timedelta(days=1)).isoformat()},
+        }}
+
+        save_ungm_notice_cache(notice_cache, cache_path, max_age_days=90, max_entries=1)
+
+        assert list(load_ungm_notice_cache(cache_path)['notices']) == ['b']
+
+
+class TestUNGMCrawler:
+    """Tests for the incremental UNGM crawler."""
+
+    CONFIG = {
+        'ungm_fallback_enabled': True,
+        'ungm_crawler_enabled': True,
+        'ungm_search_pages': 10,
+        'ungm_search_page_size': 2,
+        'ungm_max_fallback_notices': 30,
+        'ungm_crawl_concurrency': 3,
+        'ungm_prefetch_pages': 2,
+        'max_age_days': 30,
+    }
+
+    @staticmethod
+    def _pages(*pages):
+        def fetch_page(page_index, page_size=15, timeout=None, **kwargs):
+            if page_index >= len(pages):
+                return []
+            return [f'https://www.ungm.org/Public/Notice/{notice_id}' for notice_id in pages[page_index]]
+        return fetch_page
+
+    @patch('collect_rfps.fetch_ungm_notice_entry')
+    @patch('collect_rfps.fetch_ungm_search_page')
+    def test_first_crawl_fetches_all_pages_and_sets_cursor(self, mock_search_page, mock_notice_entry):
+        """Without a cursor every page is crawled and the newest notice becomes the cursor."""
+        mock_search_page.side_effect = self._pages(['5', '4'], ['3', '2'], ['1'])
+        mock_notice_entry.side_effect = make_notice_entry
+        notice_cache = {'notices': {}}
+        stats = {}
+
+        entries = crawl_ungm_notices(UNGM_FEED, self.CONFIG, notice_cache, stats)
+
+        assert [entry['link'].rsplit('/', 1)[-1] for entry in entries] == ['5', '4', '3', '2', '1']
+        assert notice_cache['cursor']['last_notice_id'] == '5'
+        assert stats['ungm_search_pages'] == 3
+        assert stats['ungm_notice_downloads'] == 5
+        assert stats['ungm_cursor_reached'] is False
+
+    @patch('collect_rfps.fetch_ungm_notice_entry')
+    @patch('collect_rfps.fetch_ungm_search_page')
+    def test_crawl_stops_at_cursor_and_serves_backlog_from_cache(self, mock_search_page, mock_notice_entry):
+        """Paging stops at the previous cursor and older notices come from the cache."""
+        now_iso = datetime.now(timezone.utc).isoformat()
+        cached_entry = make_notice_entry('https://www.ungm.org/Public/Notice/5', UNGM_FEED)
+        notice_cache = {
+            'notices': {'5': {'entry': cached_entry, 'fetched_at': now_iso, 'last_seen': now_iso}},
+            'cursor': {'last_notice_id': '5'},
+        }
+        mock_search_page.side_effect = self._pages(['7', '6'], ['5', '4'], ['3', '2'])
+        mock_notice_entry.side_effect = make_notice_entry
+        stats = {}
+
+        entries = crawl_ungm_notices(UNGM_FEED, self.CONFIG, notice_cache, stats)
+
+        assert [entry['link'].rsplit('/', 1)[-1] for entry in entries] == ['7', '6', '5']
+        assert [call.args[0].rsplit('/', 1)[-1] for call in mock_notice_entry.call_args_list] == ['7', '6']
+        assert notice_cache['cursor']['last_notice_id'] == '7'
+        assert stats['ungm_cursor_reached'] is True
+        assert stats['ungm_search_pages'] == 2
+
+    @patch('collect_rfps.fetch_ungm_notice_entry')
+    @patch('collect_rfps.fetch_ungm_search_page')
+    def test_cursor_kept_when_paging_stops_before_it(self, mock_search_page, mock_notice_entry):
+        """Hitting ungm_search_pages before the old cursor leaves the cursor in place."""
+        notice_cache = {'notices': {}, 'cursor': {'last_notice_id': '1'}}
+        mock_search_page.side_effect = self._pages(['9', '8'], ['7', '6'], ['5', '4'], ['1'])
+        mock_notice_entry.side_effect = make_notice_entry
+
+        crawl_ungm_notices(UNGM_FEED, dict(self.CONFIG, ungm_search_pages=2), notice_cache, {})
+
+        assert notice_cache['cursor']['last_notice_id'] == '1'
+
+    @patch('collect_rfps.fetch_ungm_notice_entry')
+    @patch('collect_rfps.fetch_ungm_search_page')
+    def test_capped_and_failed_notices_are_retried_next_run(self, mock_search_page, mock_notice_entry):
+        """Notices skipped by the cap or that failed to download stay pending."""
+        def notice_entry(notice_url, source_url, notice_cache=None, **kwargs):
+            if notice_url.endswith('/6'):
+                return None
+            entry = make_notice_entry(notice_url, source_url)
+            notice_cache['notices'][notice_url.rsplit('/', 1)[-1]] = {'entry': entry}
+            return entry
+        notice_cache = {'notices': {}, 'cursor': {'last_notice_id': '4'}}
+        mock_search_page.side_effect = self._pages(['7', '6'], ['5', '4'])
+        mock_notice_entry.side_effect = notice_entry
+        config = dict(self.CONFIG, ungm_max_fallback_notices=2)
+        stats = {}
+
+        crawl_ungm_notices(UNGM_FEED, config, notice_cache, stats)
+
+        assert notice_cache['cursor']['last_notice_id'] == '7'
+        assert notice_cache['cursor']['pending_ids'] == ['5', '6']
+        assert stats['ungm_notices_pending'] == 2
+
+        mock_notice_entry.reset_mock()
+        mock_notice_entry.side_effect = make_notice_entry
+        mock_search_page.side_effect = self._pages(['7', '6'], ['5', '4'])
+        entries = crawl_ungm_notices(UNGM_FEED, config, notice_cache, {})
+
+        assert sorted(call.args[0].rsplit('/', 1)[-1] for call in mock_notice_entry.call_args_list) == ['5', '6']
+        assert {'5', '6'} <= {entry['link'].rsplit('/', 1)[-1] for entry in entries}
+
+    @patch('collect_rfps.crawl_ungm_notices', return_value=[])
+    @patch('collect_rfps.fetch_ungm_notice_links')
+    def test_fallback_dispatches_to_crawler_when_enabled(self, mock_links, mock_crawl):
+        """The crawler replaces the page-by-page fallback when enabled."""
+        fetch_ungm_fallback_entries(UNGM_FEED, self.CONFIG)
+
+        mock_crawl.assert_called_once()
+        mock_links.assert_not_called()
+
+
+class TestUNGMSearchPushdown:
+    """Tests for pushing pipeline filters into UNGM search payloads."""
+
+    def test_filters_include_published_from_and_strict_region_countries(self):
+        """Age and strict region filters become PublishedFrom and Countries."""
+        config = {
+            'max_age_days': 30,
+            'strict_region_filter': True,
+            'regions': ['Sub-Saharan Africa (SSA)', 'South Asia (SAR)'],
+            'ungm_search_countries': {'SAR': ['IN', 'KE'], 'SSA': ['KE', 'NG'], 'LAC': ['BR']},
+        }
+
+        filters = build_ungm_search_filters(config)
+
+        published_from = datetime.strptime(filters['PublishedFrom'], '%d-%b-%Y')
+        assert (datetime.now() - published_from).days in (30, 31)
+        assert filters['Countries'] == ['IN', 'KE', 'NG']
+        assert 'Title' not in filters
+
+    def test_region_countries_not_pushed_without_strict_filter(self):
+        """Region matching stays client-side when unmatched items are kept."""
+        config = {
+            'regions': ['Sub-Saharan Africa (SSA)'],
+            'ungm_search_countries': {'SSA': ['KE']},
+            'ungm_search_title': 'evaluation',
+        }
+
+        filters = build_ungm_search_filters(config)
+
+        assert 'Countries' not in filters
+        assert filters['Title'] == 'evaluation'
+
+    def test_pushdown_can_be_disabled(self):
+        """Disabling push-down leaves the payload filters empty."""
+        assert build_ungm_search_filters({'max_age_days': 30, 'ungm_search_pushdown': False}) == {}
+
+    def test_search_options_merge_filters(self):
+        """Filters override the empty defaults without dropping other fields."""
+        options = build_ungm_search_options(1, 15, filters={'Title': 'survey', 'Countries': ['KE']})
+
+        assert options['Title'] == 'survey'
+        assert options['Countries'] == ['KE']
+        assert options['PageIndex'] == 1
+        assert build_ungm_search_options(0, 15)['Title'] == ''
+
+    def test_parse_search_total(self):
+        """The result total is read from the UNGM total label."""
+        assert parse_ungm_search_total('<span id="lblNoticeSearchTotal">1,204</span>') == 1204
+        assert parse_ungm_search_total('<div></div>') is None
+
+    @patch('collect_rfps.fetch_ungm_search_page')
+    def test_savings_compare_filtered_and_unfiltered_totals(self, mock_search_page):
+        """Avoided downloads are bounded by the crawl budget."""
+        def fake_page(page_index, page_size=15, timeout=None, filters=None, search_stats=None):
+            search_stats['total'] = 500
+            return []
+        mock_search_page.side_effect = fake_page
+        config = {
+            'ungm_search_pages': 3,
+            'ungm_search_page_size': 15,
+            'ungm_max_fallback_notices': 40,
+            'ungm_pushdown_metrics': True,
+        }
+        stats = {}
+
+        avoided = record_ungm_pushdown_savings(config, {'Countries': ['KE']}, 12, stats)
+
+        assert avoided == 28
+        assert stats['ungm_pushdown_avoided'] == 28
+        assert record_ungm_pushdown_savings(config, {}, 12) == 0
+
+    @patch('collect_rfps.fetch_ungm_search_page')
+    def test_savings_probe_is_opt_in(self, mock_search_page):
+        """Without ungm_pushdown_metrics no unfiltered search is sent."""
+        assert record_ungm_pushdown_savings({}, {'Countries': ['KE']}, 12, {}) == 0
+        mock_search_page.assert_not_called()
+
+    def test_published_from_uses_english_months_under_any_locale(self):
+        """PublishedFrom does not follow the process locale's month names."""
+        with patch('collect_rfps.get_age_cutoff', return_value=datetime(2026, 5, 3, tzinfo=timezone.utc)):
+            assert build_ungm_search_filters({'max_age_days': 30})['PublishedFrom'] == '03-May-2026'
+
+    @patch('collect_rfps.record_ungm_pushdown_savings', return_value=0)
+    @patch('collect_rfps.fetch_ungm_notice_links', return_value=[])
+    def test_fallback_sends_filters_to_search(self, mock_links, mock_savings):
+        """The page-by-page fallback passes the derived filters to the search."""
+        fetch_ungm_fallback_entries(UNGM_FEED, {'ungm_fallback_enabled': True, 'max_age_days': 14})
+
+        assert 'PublishedFrom' in mock_links.call_args.kwargs['filters']
+
+
+class TestStreamingParser:
+    """Tests for the opt-in streaming XML feed parser."""
+
+    @staticmethod
+    def _chunks(body, size=64):
+        consumed = []
+
+        def generate():
+            for offset in range(0, len(body), size):
+                consumed.append(offset)
+                yield body[offset:offset + size]
+        return generate(), consumed
+
+    def test_stops_reading_once_sorted_feed_passes_age_window(self):
+        """A newest-first feed is not read past the first out-of-window item."""
+        body = make_rss(1, 2, 3, 60, *([90] * 200))
+        chunks, consumed = self._chunks(body)
+        feed_info = {}
+        stats = {}
+
+        items = list(iter_streamed_feed_items(
+            chunks, feed_info, cutoff=datetime.now(timezone.utc) - timedelta(days=30), stats=stats,
+        ))
+
+        assert [item.link for item in items] == ['https://example.com/0', 'https://example.com/1', 'https://example.com/2']
+        assert items[0].summary == 'Body 0'
+        assert feed_info['title'] == 'Big feed'
+        assert stats == {'dropped_age': 1, 'stream_stopped_early': True}
+        assert len(consumed) < len(body) // 64 // 2
+
+    def test_unsorted_feed_is_read_to_the_end(self):
+        """Out-of-order dates disable the early stop but still drop old items."""
+        chunks, _ = self._chunks(make_rss(5, 1, 60, 2))
+        stats = {}
+
+        items = list(iter_streamed_feed_items(
+            chunks, {}, cutoff=datetime.now(timezone.utc) - timedelta(days=30), stats=stats,
+        ))
+
+        assert [item.title for item in items] == ['Item 0', 'Item 1', 'Item 3']
+        assert stats == {'dropped_age': 1}
+
+    def test_oldest_first_feed_is_read_to_the_end(self):
+        """An oldest-first feed keeps its in-window items after the stale head."""
+        chunks, _ = self._chunks(make_rss(60, 10, 1))
+        stats = {}
+
+        items = list(iter_streamed_feed_items(
+            chunks, {}, cutoff=datetime.now(timezone.utc) - timedelta(days=30), stats=stats,
+        ))
+
+        assert [item.title for item in items] == ['Item 1', 'Item 2']
+        assert stats == {'dropped_age': 1}
+
+    def test_stale_first_item_does_not_stop_the_parse(self):
+        """A stale pinned first item is dropped without ending the parse."""
+        chunks, _ = self._chunks(make_rss(400, 1, 2, 3))
+        stats = {}
+
+        items = list(iter_streamed_feed_items(
+            chunks, {}, cutoff=datetime.now(timezone.utc) - timedelta(days=30), stats=stats,
+        ))
+
+        assert [item.title for item in items] == ['Item 1', 'Item 2', 'Item 3']
+        assert stats == {'dropped_age': 1}
+
+    def test_atom_entries_and_undated_items(self):
+        """Atom links come from href and undated entries are yielded undated."""
+        body = b"""<feed xmlns="http://www.w3.org/2005/Atom"><title>Atom</title>
+            <entry><title>Dated</title><link rel="alternate" href="https://example.com/a"/>
+              <summary>Sum</summary><updated>2026-03-02T09:00:00Z</updated></entry>
+            <entry><title>Undated</title><link href="https://example.com/b"/></entry>
+            </feed>"""
+
+        items = list(iter_streamed_feed_items([body], {}))
+
+        assert [item.link for item in items] == ['https://example.com/a', 'https://example.com/b']
+        assert items[0].published_parsed[:3] == (2026, 3, 2)
+        assert 'published_parsed' not in items[1]
+
+    def test_xhtml_summary_and_content_match_feedparser(self):
+        """Atom type="xhtml" text keeps its markup, as feedparser returns it."""
+        body = b"""<feed xmlns="http://www.w3.org/2005/Atom"><title>Atom</title>
+            <entry><title>Summary</title><link href="https://example.com/a"/>
+              <summary type="xhtml"><div xmlns="http://www.w3.org/1999/xhtml">
+                <p>Consulting services in <b>Kenya</b> for education</p></div></summary></entry>
+            <entry><title>Content</title><link href="https://example.com/b"/>
+              <content type="xhtml"><div xmlns="http://www.w3.org/1999/xhtml">Full <em>text</em> &amp; more</div></content></entry>
+            </feed>"""
+
+        items = list(iter_streamed_feed_items([body], {}))
+        parsed = feedparser.parse(body).entries
+
+        assert items[0].summary == parsed[0].summary
+        assert items[1].summary == parsed[1].content[0].value
+        assert html_to_text(items[0].summary) == 'Consulting services in Kenya for education'
+
+    @patch('collect_rfps.fetch_feed_document')
+    @patch('collect_rfps.get_http_client')
+    def test_malformed_xml_falls_back_to_feedparser(self, mock_get_client, mock_fetch_document):
+        """Documents the strict XML parser rejects are re-parsed by feedparser."""
+        response = mock_get_client.return_value.get.return_value
+        mock_get_client.return_value.deadline = None
+        response.status_code = 200
+        response.iter_content.return_value = [b'<rss><channel><item><title>A &nbsp; B</title></item>']
+        stats = {}
+
+        feed = load_feed_document('https://example.com/rss', {'feed_parser': 'streaming'}, None, stats)
+
+        assert feed is mock_fetch_document.return_value
+        mock_fetch_document.assert_called_once_with('https://example.com/rss', None)
+        response.close.assert_called_once()
+
+    @patch('collect_rfps.get_http_client')
+    def test_streaming_feed_through_pipeline(self, mock_get_client):
+        """Feeds listed in streaming_feeds produce the same entry dictionaries."""
+        response = mock_get_client.return_value.get.return_value
+        mock_get_client.return_value.deadline = None
+        response.status_code = 200
+        response.headers = {}
+        response.iter_content.return_value = [make_rss(1, 2, 45)]
+        config = {'streaming_feeds': ['https://example.com/rss'], 'max_age_days': 30}
+        diagnostics = {}
+
+        entries = fetch_and_parse_feeds(['https://example.com/rss'], config=config, diagnostics=diagnostics)
+
+        assert [entry['title'] for entry in entries] == ['Item 0', 'Item 1']
+        assert entries[0]['source_name'] == 'Big feed'
+        assert diagnostics['feeds']['https://example.com/rss']['stream_stopped_early'] is True
+
+
+class TestAgePushdown:
+    """Tests for applying the max_age_days window while parsing feeds."""
+
+    @patch('collect_rfps.get_last_modified_from_url')
+    @patch('collect_rfps.fetch_feed_document')
+    def test_old_items_are_dropped_before_probing(self, mock_feed_document, mock_last_modified):
+        """Known-old items are neither built nor probed, and count as dropped_age."""
+        mock_last_modified.return_value = days_ago(90)
+        mock_feed_document.return_value = make_feed(
+            make_feed_item('https://a.example/fresh', 'Fresh', days_ago(2), summary=''),
+            make_feed_item('https://a.example/old', 'Old', days_ago(45), summary=''),
+            make_feed_item('https://a.example/undated', 'Undated', summary=''),
+        )
+        diagnostics = {}
+
+        entries = fetch_and_parse_feeds(
+            ['https://a.example/rss'], config={'max_age_days': 30}, diagnostics=diagnostics,
+        )
+
+        assert [entry['title'] for entry in entries] == ['Fresh']
+        mock_last_modified.assert_called_once_with('https://a.example/undated')
+        assert diagnostics['dropped_age'] == 2
+
+    def test_cutoff_matches_filter_entries_boundary(self):
+        """Entries kept by the early cutoff are exactly those filter_entries keeps."""
+        now = datetime.now(timezone.utc)
+        cutoff = get_age_cutoff({'max_age_days': 30})
+        for age in (timedelta(days=30, hours=23), timedelta(days=31, minutes=1)):
+            published = now - age
+            kept = filter_entries(
+                [{'title': 't', 'link': 'l', 'published': published.isoformat()}],
+                {'max_age_days': 30},
+            )
+            assert bool(kept) is not is_outside_age_window(published, cutoff)
+
+    @patch('collect_rfps.fetch_ungm_notice_entry')
+    @patch('collect_rfps.fetch_ungm_notice_links', return_value=[])
+    def test_old_cached_ungm_notice_is_not_refetched(self, mock_links, mock_notice_entry):
+        """A pinned notice whose cached date is outside the window skips its detail fetch."""
+        old = (datetime.now(timezone.utc) - timedelta(days=60)).isoformat()
+        notice_cache = {'notices': {'289708': {
+            'entry': {'title': 'Old notice', 'link': 'https://www.ungm.org/Public/Notice/289708', 'published': old},
+            'fetched_at': old,
+            'last_seen': old,
+        }}}
+        stats = {}
+
+        entries = fetch_ungm_fallback_entries(
+            UNGM_FEED,
+            {'max_age_days': 30, 'ungm_notice_ids': [289708]},
+            notice_cache,
+            stats,
+        )
+
+        assert entries == []
+        mock_notice_entry.assert_not_called()
+        assert stats['dropped_age'] == 1
+
+
+class TestRunDeadline:
+    """Tests for the max_run_seconds fetch deadline."""
+
+    SLOW_FEED = 'https://slow.example/rss'
+    FAST_FEED = 'https://fast.example/rss'
+
+    def test_client_clamps_timeouts_to_the_deadline(self):
+        """Requests get at most the remaining time and none are sent after the deadline."""
+        client = HttpClient(timeout=20)
+        client.session = Mock()
+
+        client.set_deadline(time.monotonic() + 2)
+        client.get('https://example.com')
+        assert client.session.request.call_args.kwargs['timeout'] <= 2
+
+        client.set_deadline(time.monotonic() - 1)
+        with pytest.raises(DeadlineExceeded):
+            client.get('https://example.com')
+        assert client.session.request.call_count == 1
+
+    def test_fetch_deadline_reserves_render_time(self):
+        """The fetch stage ends before max_run_seconds to leave time for rendering."""
+        assert get_fetch_deadline({}, 100.0) is None
+        assert get_fetch_deadline({'max_run_seconds': 600}, 100.0) == 685.0
+        assert get_fetch_deadline({'max_run_seconds': 20}, 100.0) == 118.0
+
+    @pytest.mark.parametrize('config', [{'fetch_concurrency': 2}, {'fetch_mode': 'async'}])
+    def test_slow_feed_is_abandoned_at_the_deadline(self, config):
+        """Entries that arrived in time are returned and the slow feed is reported."""
+        def fake_load(feed_url, config=None, feed_cache=None, feed_stats=None):
+            if feed_url == self.SLOW_FEED:
+                time.sleep(0.5)
+            return make_feed()
+
+        diagnostics = {}
+        with patch('collect_rfps.load_feed_document', side_effect=fake_load), \
+                patch('collect_rfps.build_dated_entries', side_effect=lambda c, d, feed_url, *a: [make_entry(feed_url, source=feed_url)]):
+            entries = fetch_and_parse_feeds(
+                [self.SLOW_FEED, self.FAST_FEED],
+                config=config,
+                diagnostics=diagnostics,
+                deadline=time.monotonic() + 0.2,
+            )
+
+        assert [entry['link'] for entry in entries] == [self.FAST_FEED]
+        assert diagnostics['timed_out_feeds'] == [self.SLOW_FEED]
+        # The abandoned fetch is still sleeping; the expired deadline stays
+        # set so it cannot send further requests
+        assert get_http_client().deadline is not None
+        get_http_client().set_deadline(None)
+
+    @pytest.mark.parametrize('config', [{'fetch_concurrency': 2}, {'fetch_mode': 'async'}])
+    def test_abandoned_fetch_writes_stay_out_of_saved_caches(self, config, tmp_path):
+        """Cache and stats writes of a fetch abandoned at the deadline are never merged."""
+        release = threading.Event()
+        crawled = threading.Event()
+
+        def fake_load(feed_url, config=None, feed_cache=None, feed_stats=None):
+            return make_feed(href=feed_url, status=200, etag=f'"{feed_url}"', modified=None)
+
+        def fake_crawl(feed_url, config, notice_cache, feed_stats):
+            release.wait(5)
+            now = utc_now().isoformat()
+            notice_cache['notices']['late'] = {'entry': None, 'fetched_at': now, 'last_seen': now}
+            notice_cache['cursor'] = {'newest_id': 'late'}
+            feed_stats['late_write'] = True
+            crawled.set()
+            return []
+
+        config = dict(config, ungm_crawler_enabled=True, feed_prioritization=False)
+        feed_cache, last_modified_cache = {}, {}
+        ungm_notice_cache = {'notices': {}, 'cursor': {}}
+        diagnostics = {}
+        with patch('collect_rfps.load_feed_document', side_effect=fake_load), \
+                patch('collect_rfps.get_dated_candidates',
+                      side_effect=lambda feed, cutoff, stats: ([make_feed_item(feed.href + '/item')], [None])), \
+                patch('collect_rfps.get_last_modified_from_url', return_value=None), \
+                patch('collect_rfps.build_dated_entries', side_effect=lambda c, d, feed_url, *a: [make_entry(feed_url, source=feed_url)]), \
+                patch('collect_rfps.needs_ungm_fallback', side_effect=lambda feed_url, *a: feed_url == self.SLOW_FEED), \
+                patch('collect_rfps.crawl_ungm_notices', side_effect=fake_crawl):
+            entries = fetch_and_parse_feeds(
+                [self.SLOW_FEED, self.FAST_FEED],
+                config=config,
+                feed_cache=feed_cache,
+                diagnostics=diagnostics,
+                last_modified_cache=last_modified_cache,
+                ungm_notice_cache=ungm_notice_cache,
+                deadline=time.monotonic() + 0.2,
+            )
+            release.set()
+            assert crawled.wait(5)
+            time.sleep(0.1)
+        get_http_client().set_deadline(None)
+
+        save_feed_cache(feed_cache, str(tmp_path / 'feed_cache.json'))
+        save_last_modified_cache(last_modified_cache, str(tmp_path / 'last_modified.json'))
+        save_ungm_notice_cache(ungm_notice_cache, str(tmp_path / 'ungm_notices.json'))
+
+        assert [entry['link'] for entry in entries] == [self.FAST_FEED]
+        assert set(load_feed_cache(str(tmp_path / 'feed_cache.json'))) == {self.FAST_FEED}
+        assert set(load_last_modified_cache(str(tmp_path / 'last_modified.json'))) == {self.FAST_FEED + '/item'}
+        saved_notices = load_ungm_notice_cache(str(tmp_path / 'ungm_notices.json'))
+        assert saved_notices['notices'] == {}
+        assert not saved_notices.get('cursor')
+        assert diagnostics['feeds'][self.SLOW_FEED] == {'timed_out': True}
+
+    def test_sequential_feed_finishing_past_the_deadline_is_kept(self):
+        """A feed completing after the deadline keeps its entries; later feeds time out."""
+        def fake_load(feed_url, config=None, feed_cache=None, feed_stats=None):
+            time.sleep(0.3)
+            return make_feed()
+
+        diagnostics = {}
+        with patch('collect_rfps.load_feed_document', side_effect=fake_load), \
+                patch('collect_rfps.build_dated_entries', side_effect=lambda c, d, feed_url, *a: [make_entry(feed_url, source=feed_url)]):
+            entries = fetch_and_parse_feeds(
+                [self.SLOW_FEED, self.FAST_FEED],
+                config={'fetch_concurrency': 1, 'feed_prioritization': False},
+                diagnostics=diagnostics,
+                deadline=time.monotonic() + 0.2,
+            )
+        get_http_client().set_deadline(None)
+
+        assert [entry['link'] for entry in entries] == [self.SLOW_FEED]
+        assert diagnostics['timed_out_feeds'] == [self.FAST_FEED]
+
+    def test_deadline_cleared_when_every_feed_finishes(self):
+        with patch('collect_rfps.load_feed_document', return_value=make_feed()):
+            fetch_and_parse_feeds([self.FAST_FEED], config={}, diagnostics={}, deadline=time.monotonic() + 5)
+
+        assert get_http_client().deadline is None
+
+    def test_streamed_body_stops_at_the_deadline(self):
+        chunks = iter_chunks_until_deadline(iter([b'a', b'b']), time.monotonic() - 1)
+
+        with pytest.raises(DeadlineExceeded):
+            next(chunks)
+        assert list(iter_chunks_until_deadline([b'a', b'b'], None)) == [b'a', b'b']
+
+    def test_generate_markdown_output_lists_timed_out_feeds(self, tmp_path):
+        """Timed-out feeds are named in the pipeline metrics section."""
+        output_path = tmp_path / 'index.md'
+
+        generate_markdown_output([], {'timed_out_feeds': [self.SLOW_FEED]}, str(output_path))
+        content = output_path.read_text()
+
+        assert f'- **Feeds timed out (run deadline):** 1 (`{self.SLOW_FEED}`)' in content
+
+
+class TestFeedHealth:
+    """Tests for feed retries, the circuit breaker and the health registry."""
+
+    FEED = 'https://dead.example/rss'
+
+    @patch('collect_rfps.time.sleep')
+    @patch('collect_rfps.load_feed_document')
+    def test_transient_errors_are_retried_with_backoff(self, mock_load, mock_sleep):
+        """Connection errors and 5xx answers are retried with doubling waits."""
+        mock_load.side_effect = [requests.ConnectionError('reset'), make_feed(status=503), make_feed(status=200)]
+        diagnostics = {}
+
+        fetch_and_parse_feeds(
+            [self.FEED],
+            config={'feed_retries': 3, 'feed_retry_backoff_seconds': 0.5},
+            diagnostics=diagnostics,
+        )
+
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1.0]
+        assert diagnostics['feed_retries'] == 2
+        assert diagnostics['failed_feeds'] == []
+
+    @patch('collect_rfps.time.sleep')
+    @patch('collect_rfps.load_feed_document', side_effect=ValueError('bad document'))
+    def test_permanent_errors_are_not_retried(self, mock_load, mock_sleep):
+        """Non-transient errors fail the feed on the first attempt."""
+        diagnostics = {}
+
+        fetch_and_parse_feeds([self.FEED], config={'feed_retries': 3}, diagnostics=diagnostics)
+
+        assert mock_load.call_count == 1
+        mock_sleep.assert_not_called()
+        assert diagnostics['failed_feeds'] == [self.FEED]
+
+    @patch('collect_rfps.time.sleep')
+    @patch('collect_rfps.load_feed_document')
+    def test_error_status_counts_as_failed_in_metrics_and_health(self, mock_load, mock_sleep):
+        """An HTTP 404 with nothing fetched is a failure for both diagnostics and health."""
+        mock_load.return_value = make_feed(status=404)
+        diagnostics = {}
+        feed_health = {}
+
+        fetch_and_parse_feeds([self.FEED], config={}, diagnostics=diagnostics, feed_health=feed_health)
+
+        assert diagnostics['failed_feeds'] == [self.FEED]
+        assert feed_health[self.FEED]['last_status'] == 'error'
+        assert is_feed_failure({'status': 404, 'fetched': 3}) is False
+        assert is_feed_failure({'error': 'boom', 'timed_out': True}) is False
+
+    @pytest.mark.parametrize('config', [{}, {'fetch_mode': 'async'}])
+    def test_entries_parsed_before_an_error_are_kept(self, config):
+        """A failing UNGM fallback records the error without dropping the RSS entries."""
+        entry = make_entry('https://dead.example/1', 'Evaluation', source=self.FEED)
+        diagnostics = {}
+        with patch('collect_rfps.load_feed_document', return_value=make_feed(status=200)), \
+                patch('collect_rfps.build_dated_entries', return_value=[entry]), \
+                patch('collect_rfps.needs_ungm_fallback', return_value=True), \
+                patch('collect_rfps.fetch_ungm_fallback_entries', side_effect=RuntimeError('UNGM down')), \
+                patch('collect_rfps.fetch_ungm_fallback_entries_async', side_effect=RuntimeError('UNGM down')):
+            entries = fetch_and_parse_feeds([self.FEED], config=config, diagnostics=diagnostics)
+
+        assert entries == [entry]
+        assert diagnostics['feeds'][self.FEED]['error'] == 'UNGM down'
+        assert diagnostics['feeds'][self.FEED]['fetched'] == 1
+        assert diagnostics['failed_feeds'] == [self.FEED]
+
+    def test_circuit_opens_after_threshold_and_closes_on_success(self):
+        """Consecutive failures open the circuit with a growing re-probe interval."""
+        config = {'feed_circuit_breaker_threshold': 2, 'feed_circuit_reprobe_days': 10}
+        now = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        health = {}
+
+        update_feed_health(health, self.FEED, {'error': 'timeout'}, config, now)
+        assert not is_feed_circuit_open(health[self.FEED], now)
+
+        update_feed_health(health, self.FEED, {'status': 404}, config, now)
+        assert health[self.FEED]['next_probe_at'] == (now + timedelta(days=10)).isoformat()
+        assert is_feed_circuit_open(health[self.FEED], now + timedelta(days=9))
+        assert not is_feed_circuit_open(health[self.FEED], now + timedelta(days=10))
+
+        update_feed_health(health, self.FEED, {'error': 'timeout'}, config, now)
+        assert health[self.FEED]['next_probe_at'] == (now + timedelta(days=20)).isoformat()
+
+        record = update_feed_health(
+            health, self.FEED, {'status': 200, 'fetched': 4, 'latency_seconds': 1.5}, config, now,
+        )
+        assert record['consecutive_failures'] == 0
+        assert record['total_failures'] == 3
+        assert record['last_entries'] == 4
+        assert 'next_probe_at' not in record
+
+    @patch('collect_rfps.fetch_feed_entries', return_value=[])
+    def test_open_circuit_skips_feed(self, mock_fetch_entries):
+        """Feeds with an open circuit are not fetched and keep their failure count."""
+        health = {self.FEED: {'consecutive_failures': 5, 'next_probe_at': '2999-01-01T00:00:00+00:00'}}
+        diagnostics = {}
+
+        fetch_and_parse_feeds([self.FEED, 'https://ok.example/rss'], diagnostics=diagnostics, feed_health=health)
+
+        assert [call.args[0] for call in mock_fetch_entries.call_args_list] == ['https://ok.example/rss']
+        assert diagnostics['skipped_feeds'] == [self.FEED]
+        assert health[self.FEED]['consecutive_failures'] == 5
+        assert health[self.FEED]['last_status'] == 'skipped'
+        assert health['https://ok.example/rss']['last_status'] == 'ok'
+
+    def test_feed_health_round_trip(self, tmp_path):
+        """Saved health registries load back unchanged, and missing files load empty."""
+        health_path = str(tmp_path / 'data' / 'feed_health.json')
+        health = {self.FEED: {'consecutive_failures': 1, 'runs': 2}}
+
+        assert load_feed_health(health_path) == {}
+        save_feed_health(health, health_path)
+        assert load_feed_health(health_path) == health
+
+
+class TestFeedPrioritization:
+    """Tests for yield tracking and yield-ordered fetching."""
+
+    HIGH = 'https://high.example/rss'
+    LOW = 'https://low.example/rss'
+    NEW = 'https://new.example/rss'
+
+    def test_record_feed_yield_counts_filtered_and_selected(self):
+        """Yield is tracked per source; failed feeds are left untouched."""
+        health = {
+            self.HIGH: {'last_status': 'ok'},
+            self.LOW: {'last_status': 'ok', 'zero_yield_runs': 2},
+            self.NEW: {'last_status': 'error'},
+        }
+        feed_stats = {self.HIGH: {}, self.LOW: {}, self.NEW: {'error': 'boom'}}
+        filtered = [{'source': self.HIGH}, {'source': self.HIGH}, {'source': self.LOW}]
+
+        record_feed_yield(health, feed_stats, filtered, filtered[:1])
+
+        assert health[self.HIGH]['last_filtered'] == 2
+        assert health[self.HIGH]['avg_selected'] == 1
+        assert health[self.HIGH]['zero_yield_runs'] == 0
+        assert health[self.LOW]['last_selected'] == 0
+        assert health[self.LOW]['zero_yield_runs'] == 3
+        assert 'last_filtered' not in health[self.NEW]
+
+    def test_prioritize_feeds_orders_by_expected_yield(self):
+        """Proven feeds come first and feeds without history sit at the average."""
+        health = {
+            self.LOW: {'avg_selected': 0.0, 'avg_filtered': 3.0},
+            self.HIGH: {'avg_selected': 4.0, 'avg_filtered': 9.0},
+        }
+
+        assert prioritize_feeds([self.LOW, self.NEW, self.HIGH], health) == [self.HIGH, self.NEW, self.LOW]
+        assert prioritize_feeds([self.LOW, self.HIGH], None) == [self.LOW, self.HIGH]
+
+    def test_zero_yield_feeds_are_skipped_until_reprobe(self):
+        """Chronic zero-yield feeds are skipped only when enabled and not due for a re-probe."""
+        now = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        record = {'zero_yield_runs': 4, 'last_attempt': (now - timedelta(days=7)).isoformat()}
+
+        assert not is_zero_yield_feed(record, {}, now)
+        assert is_zero_yield_feed(record, {'skip_zero_yield_runs': 3}, now)
+        assert not is_zero_yield_feed(record, {'skip_zero_yield_runs': 3, 'feed_circuit_reprobe_days': 5}, now)
+
+    @patch('collect_rfps.fetch_feed_entries')
+    def test_fetch_order_follows_yield_but_output_keeps_feed_order(self, mock_fetch_entries):
+        """High-yield feeds are fetched first while results stay in feeds.txt order."""
+        mock_fetch_entries.side_effect = lambda feed_url, *args: [{'source': feed_url}]
+        health = {
+            self.LOW: {'avg_selected': 0.0, 'last_status': 'ok'},
+            self.HIGH: {'avg_selected': 5.0, 'last_status': 'ok'},
+        }
+
+        entries = fetch_and_parse_feeds([self.LOW, self.HIGH], feed_health=health)
+
+        assert [call.args[0] for call in mock_fetch_entries.call_args_list] == [self.HIGH, self.LOW]
+        assert [entry['source'] for entry in entries] == [self.LOW, self.HIGH]
+
+
+class TestAdaptivePolling:
+    """Tests for per-feed polling intervals estimated from publication dates."""
+
+    BUSY = 'https://busy.example/rss'
+    QUIET = 'https://quiet.example/rss'
+    NOW = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+    def _entries(self, *hours_ago):
+        return [
+            make_entry(f'https://e.example/{hours}', str(hours), published=(self.NOW - timedelta(hours=hours)).isoformat())
+            for hours in hours_ago
+        ]
+
+    def test_estimate_uses_median_gap(self):
+        """The interval is the median gap between distinct publication times."""
+        assert estimate_update_interval_hours(self._entries(0, 2, 4, 40)) == 2
+        assert estimate_update_interval_hours(self._entries(5, 5)) is None
+
+    def test_schedule_clamps_and_backs_off(self):
+        """Intervals are clamped to the configured bounds and double without data."""
+        config = {'poll_min_hours': 1, 'poll_max_hours': 48}
+        record = {}
+
+        schedule_next_poll(record, 0.25, config, self.NOW)
+        assert record['update_interval_hours'] == 1
+        assert record['next_poll_at'] == (self.NOW + timedelta(hours=1)).isoformat()
+
+        for _ in range(8):
+            schedule_next_poll(record, None, config, self.NOW)
+        assert record['update_interval_hours'] == 48
+
+    def test_is_feed_due_allows_slack(self):
+        """A poll a little early (within 10% of the interval) still counts as due."""
+        record = {'update_interval_hours': 168, 'next_poll_at': (self.NOW + timedelta(hours=10)).isoformat()}
+
+        assert is_feed_due(record, self.NOW)
+        assert not is_feed_due(dict(record, next_poll_at=(self.NOW + timedelta(hours=20)).isoformat()), self.NOW)
+        assert is_feed_due(None, self.NOW)
+
+    @patch('collect_rfps.fetch_feed_entries')
+    def test_not_due_feed_is_served_from_cache(self, mock_fetch_entries):
+        """Feeds not due are not requested; their cached entries are still ranked."""
+        now = datetime.now(timezone.utc)
+        cached_entry = {'title': 'Quiet', 'link': 'https://quiet.example/1', 'published': now.isoformat()}
+        later = (now + timedelta(days=3)).isoformat()
+        health = {
+            self.QUIET: {'last_status': 'ok', 'update_interval_hours': 168, 'next_poll_at': later},
+            self.BUSY: {'last_status': 'ok', 'update_interval_hours': 2, 'next_poll_at': now.isoformat()},
+        }
+        feed_cache = {self.QUIET: {'etag': None, 'modified': None, 'entries': [cached_entry]}}
+        mock_fetch_entries.side_effect = lambda feed_url, *args: []
+        diagnostics = {}
+
+        entries = fetch_and_parse_feeds(
+            [self.QUIET, self.BUSY],
+            config={'adaptive_polling': True},
+            feed_cache=feed_cache,
+            diagnostics=diagnostics,
+            feed_health=health,
+        )
+
+        assert [call.args[0] for call in mock_fetch_entries.call_args_list] == [self.BUSY]
+        assert entries == [cached_entry]
+        assert diagnostics['not_due_feeds'] == [self.QUIET]
+        assert health[self.QUIET]['next_poll_at'] == later
+
+
+class TestDaemonMode:
+    """Tests for the long-running collector and its one-shot entry point."""
+
+    CONFIG = (
+        "keywords: [evaluation]\n"
+        "regions: []\n"
+        "min_budget: 0\n"
+        "max_age_days: 30\n"
+        "max_results: 5\n"
+    )
+
+    @pytest.fixture
+    def workdir(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / 'config.yml').write_text(self.CONFIG)
+        (tmp_path / 'feeds.txt').write_text('https://a.example/rss\n')
+        return tmp_path
+
+    @staticmethod
+    def _entries(*titles):
+        return [
+            make_entry(f'https://a.example/{title}', title, 'https://a.example/rss', description='evaluation services')
+            for title in titles
+        ]
+
+    @patch('collect_rfps.generate_markdown_output')
+    @patch('collect_rfps.fetch_and_parse_feeds')
+    def test_daemon_renders_only_when_ranking_changes(self, mock_fetch, mock_render, workdir):
+        """Unchanged ranked output is not re-rendered on later cycles."""
+        mock_fetch.side_effect = [self._entries('a'), self._entries('a'), self._entries('a', 'b')]
+        state = load_collector_state()
+        state['config']['daemon_interval_seconds'] = 0.01
+
+        run_daemon(state, max_cycles=3)
+
+        assert mock_fetch.call_count == 3
+        assert mock_render.call_count == 2
+
+    def test_reload_picks_up_changed_feeds_and_keeps_bad_config(self, workdir):
+        """Changed files are reloaded; an invalid config keeps the previous one."""
+        state = load_collector_state()
+
+        assert reload_changed_sources(state) is False
+
+        (workdir / 'feeds.txt').write_text('https://a.example/rss\nhttps://b.example/rss\n')
+        os.utime(workdir / 'feeds.txt', (time.time() + 5, time.time() + 5))
+        assert reload_changed_sources(state) is True
+        assert state['feeds'] == ['https://a.example/rss', 'https://b.example/rss']
+
+        (workdir / 'config.yml').write_text('max_results: 5\n')
+        os.utime(workdir / 'config.yml', (time.time() + 10, time.time() + 10))
+        assert reload_changed_sources(state) is False
+        assert state['config']['keywords'] == ['evaluation']
+
+    def test_daemon_sleep_follows_next_feed_poll(self, workdir):
+        """With adaptive polling the daemon wakes when the next feed falls due."""
+        now = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        state = load_collector_state()
+        state['config'].update({'daemon_interval_seconds': 3600, 'adaptive_polling': True})
+        state['feed_health'] = {'https://a.example/rss': {'next_poll_at': (now + timedelta(minutes=10)).isoformat()}}
+
+        assert get_daemon_sleep_seconds(state, now) == 600
+        state['config']['adaptive_polling'] = False
+        assert get_daemon_sleep_seconds(state, now) == 3600
+
+    @patch('collect_rfps.fetch_and_parse_feeds')
+    def test_one_shot_main_writes_outputs(self, mock_fetch, workdir):
+        """Without --daemon a single cycle renders docs/index.md and last_run.json."""
+        mock_fetch.return_value = self._entries('a')
+
+        main([])
+
+        assert '## Pipeline Metrics' in (workdir / 'docs' / 'index.md').read_text()
+        assert (workdir / 'data' / 'last_run.json').exists()
+
+
+
+class TestHttpArchive:
+    """Tests for recording HTTP responses and replaying them offline."""
+
+    FEED_URL = 'https://a.example/rss'
+
+    @pytest.fixture(autouse=True)
+    def reset_archive(self):
+        yield
+        configure_http_archive(None, None)
+        configure_http_client({})
+
+    @staticmethod
+    def _feed_body():
+        return make_rss(
+            1, 1,
+            title='A',
+            item_title='Evaluation {index}',
+            description='evaluation services USD 250,000',
+            root='https://a.example',
+        )
+
+    def test_replay_serves_records_in_order_and_repeats_the_last(self):
+        archive = new_http_archive()
+        archive['responses'] = {
+            f'GET {self.FEED_URL} -': [
+                {'status': 200, 'url': self.FEED_URL, 'headers': {'ETag': '"1"'}, 'body': 'Zmlyc3Q='},
+                {'status': 304, 'url': self.FEED_URL, 'headers': {}, 'body': ''},
+            ],
+            'GET https://a.example/slow -': [{'error': 'ReadTimeout', 'message': 'timed out'}],
+        }
+        client = HttpClient(archive=archive, archive_mode='replay')
+
+        first = client.get(self.FEED_URL)
+        assert (first.status_code, first.content, first.headers['etag']) == (200, b'first', '"1"')
+        assert client.get(self.FEED_URL).status_code == 304
+        assert client.get(self.FEED_URL).status_code == 304
+
+        with pytest.raises(requests.Timeout):
+            client.get('https://a.example/slow')
+        with pytest.raises(requests.ConnectionError):
+            client.get('https://a.example/missing')
+
+    def test_archive_keys_post_requests_by_body(self, tmp_path):
+        """UNGM search pages share a URL and are told apart by the request body."""
+        archive = new_http_archive()
+        client = HttpClient(archive=archive, archive_mode='record')
+        with patch('collect_rfps.HTTPAdapter.send', side_effect=lambda request, **kwargs: make_response(
+            request=request, content=request.body.encode(),
+        )):
+            client.post('https://www.ungm.org/Public/Notice/Search', data='page=0')
+            client.post('https://www.ungm.org/Public/Notice/Search', data='page=1')
+        save_http_archive(archive, str(tmp_path / 'archive.json.gz'))
+
+        replay = HttpClient(archive=load_http_archive(str(tmp_path / 'archive.json.gz')), archive_mode='replay')
+
+        assert replay.post('https://www.ungm.org/Public/Notice/Search', data='page=1').content == b'page=1'
+        assert replay.post('https://www.ungm.org/Public/Notice/Search', data='page=0').content == b'page=0'
+
+    def test_archive_freezes_the_clock(self):
+        archive = new_http_archive()
+        archive['recorded_at'] = '2026-03-01T12:00:00+00:00'
+
+        configure_http_archive(archive, 'replay')
+        assert utc_now() == datetime(2026, 3, 1, 12, tzinfo=timezone.utc)
+        configure_http_archive(None, None)
+        assert utc_now().year >= 2026 and utc_now() != datetime(2026, 3, 1, 12, tzinfo=timezone.utc)
+
+    def test_replayed_run_reproduces_recorded_output(self, tmp_path, monkeypatch):
+        """A replay is offline, leaves data/ caches alone and renders the recorded output."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / 'config.yml').write_text(TestDaemonMode.CONFIG)
+        (tmp_path / 'feeds.txt').write_text(f'{self.FEED_URL}\n')
+        body = self._feed_body()
+
+        with patch('collect_rfps.HTTPAdapter.send', side_effect=lambda request, **kwargs: make_response(
+            request=request, content=body, headers={'Content-Type': 'application/rss+xml'},
+        )):
+            main(['--record', 'archive.json.gz', '--output', 'recorded.md'])
+        recorded = (tmp_path / 'recorded.md').read_text()
+        configure_http_archive(None, None)
+
+        with patch('collect_rfps.HTTPAdapter.send', side_effect=AssertionError('network used during replay')):
+            main(['--replay', 'archive.json.gz', '--output', 'replayed.md'])
+
+        assert 'Evaluation 0' in recorded
+        assert (tmp_path / 'replayed.md').read_text() == recorded
+        assert not (tmp_path / 'data' / 'feed_cache.json').exists()
+
+    def test_replay_without_output_leaves_published_files_alone(self, tmp_path, monkeypatch):
+        """Without --output a replay writes neither docs/index.md nor data/last_run.json."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / 'config.yml').write_text(TestDaemonMode.CONFIG)
+        (tmp_path / 'feeds.txt').write_text(f'{self.FEED_URL}\n')
+        body = self._feed_body()
+
+        with patch('collect_rfps.HTTPAdapter.send', side_effect=lambda request, **kwargs: make_response(
+            request=request, content=body, headers={'Content-Type': 'application/rss+xml'},
+        )):
+            main(['--record', 'archive.json.gz'])
+        configure_http_archive(None, None)
+        main(['--replay', 'archive.json.gz'])
+
+        assert not (tmp_path / 'docs' / 'index.md').exists()
+        assert not (tmp_path / 'data' / 'last_run.json').exists()
+
+
+
+class TestHtmlToText:
+    """Tests for the single-pass HTML-to-text normalizer."""
+
+    def test_strips_tags_unescapes_and_collapses_whitespace(self):
+        html = '<p>Deadline &amp; submission</p>\n<br/><a href="?a=1&amp;b=2">ToR</a>&nbsp;&nbsp;now'
+        assert html_to_text(html) == 'Deadline & submission ToR now'
+
+    def test_escaped_markup_stays_as_text(self):
+        assert html_to_text('Use &lt;b&gt; tags') == 'Use <b> tags'
+
+    def test_plain_text_and_empty_values(self):
+        assert html_to_text('  plain\ttext  ') == 'plain text'
+        assert html_to_text(None) == ''
+        assert sanitize_summary('<em>x</em>') == 'x'
+
+    def test_description_normalized_once_and_reused(self):
+        entry = {
+            'title': 'Evaluation',
+            'description': '<div class="kenya">Programme in <b>Nairobi</b>, budget USD 250,000</div>',
+            'published': datetime.now(timezone.utc).isoformat(),
+            'source': 'https://example.com/rss',
+            'link': 'https://example.com/1',
+        }
+        config = {
+            'keywords': ['evaluation'],
+            'min_budget': 0,
+            'max_age_days': 30,
+            'regions': ['Africa'],
+            'strict_region_filter': True,
+        }
+
+        entry, = normalize_entries([entry])
+        assert entry['description_text'] == 'Programme in Nairobi , budget USD 250,000'
+
+        with patch('collect_rfps.html_to_text') as mock_html_to_text:
+            filtered = filter_entries([entry], config, diagnostics={})
+            calculate_score(entry, config)
+
+        mock_html_to_text.assert_not_called()
+        assert filtered == [entry]
+        assert entry['budget'] == 250000
+
+    def test_attribute_text_does_not_match_regions(self):
+        entry = {
+            'title': 'Evaluation',
+            'description': '<span class="kenya">Programme in Norway</span>',
+            'published': datetime.now(timezone.utc).isoformat(),
+        }
+        diagnostics = {}
+
+        filter_entries([entry], {'max_age_days': 30, 'regions': ['Africa']}, diagnostics=diagnostics)
+
+        assert diagnostics['region_unmatched'] == 1
+        assert 'matched_regions' not in entry
+
+
+class TestEntry:
+    """Tests for the slot-based Entry record and its mapping view."""
+
+    FIELDS = {
+        'title': 'Evaluation',
+        'link': 'https://example.com/1',
+        'description': '<p>WASH &amp; health</p>',
+        'published': '2026-01-28T00:00:00+00:00',
+        'source': 'https://example.com/rss',
+        'source_name': 'Example',
+    }
+
+    def test_parses_date_and_text_once(self):
+        entry = Entry(self.FIELDS)
+
+        assert entry.published_at == datetime(2026, 1, 28, tzinfo=timezone.utc)
+        assert entry.description_text == 'WASH & health'
+        assert entry['published'] == self.FIELDS['published']
+        assert not hasattr(entry, '__dict__')
+
+    def test_behaves_like_the_entry_dict(self):
+        entry = Entry(self.FIELDS)
+        entry['score'] = 0.5
+        entry['deadline'] = '2026-02-01'
+
+        assert dict(entry) == dict(self.FIELDS, description_text='WASH & health', score=0.5, deadline='2026-02-01')
+        assert entry == dict(entry)
+        assert 'budget' not in entry
+        assert entry.get('budget') is None
+        with pytest.raises(KeyError):
+            entry['budget']
+        del entry['score']
+        assert 'score' not in entry
+
+    def test_setting_published_reparses_date(self):
+        entry = Entry(self.FIELDS)
+
+        entry['published'] = 'not a date'
+
+        assert entry.published_at is None
+        assert format_published_date(entry.published_at) == 'Unknown'
+
+    def test_setting_title_or_description_invalidates_derived_text(self):
+        scanner = get_term_scanner({'keywords': ['WASH', 'education']})
+        entry = Entry(self.FIELDS)
+        assert get_entry_term_hits(entry, scanner).count('keyword', 'wash') == 1
+
+        entry['description'] = '<p>Education &amp; schools</p>'
+
+        assert entry.description_text == 'Education & schools'
+        assert entry.term_hits is None
+        assert get_entry_term_hits(entry, scanner).names('keyword') == {'education'}
+
+        entry['title'] = 'WASH evaluation'
+
+        assert entry.term_hits is None
+        assert get_entry_term_hits(entry, scanner).names('keyword') == {'education', 'wash'}
+
+    def test_copies_and_pickles_keep_the_mapping(self):
+        entry = Entry(self.FIELDS, deadline='2026-02-01')
+
+        for clone in (copy.copy(entry), copy.deepcopy(entry), pickle.loads(pickle.dumps(entry))):
+            assert isinstance(clone, Entry)
+            assert clone == entry
+            assert 'score' not in clone
+            assert clone.published_at == entry.published_at
+        assert copy.copy(entry).extra is not entry.extra
+        assert entry != dict(entry, title='Other')
+
+    def test_normalized_entries_flow_through_filter_and_score(self):
+        published = datetime.now(timezone.utc) - timedelta(days=2)
+        entries = normalize_entries([dict(self.FIELDS, published=published.isoformat())])
+        config = {'keywords': ['WASH'], 'min_budget': 0, 'max_age_days': 30}
+
+        filtered = filter_entries(entries, config, diagnostics={})
+        score = calculate_score(filtered[0], config)
+
+        assert isinstance(filtered[0], Entry)
+        assert score == pytest.approx(calculate_score(dict(self.FIELDS, published=published.isoformat()), config))
+
+
+class TestFastParser:
+    """Tests for the standard-library fast path for well-formed feeds."""
+
+    FEED_URL = 'https://example.com/rss'
+
+    def _rss(self):
+        published = days_ago(1).strftime('%a, %d %b %Y %H:%M:%S GMT')
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>Tenders</title>'
+            '<item><title>Evaluation &amp; review</title><link>https://example.com/1</link>'
+            '<description>&lt;p&gt;Budget USD 250,000&lt;/p&gt;</description>'
+            f'<pubDate>{published}</pubDate></item>'
+            '<item><title><![CDATA[Baseline survey]]></title><link>https://example.com/2</link>'
+            f'<description>Plain text</description><pubDate>{published}</pubDate></item>'
+            '</channel></rss>'
+        ).encode()
+
+    def _atom(self):
+        return (
+            '<feed xmlns="http://www.w3.org/2005/Atom"><title>Atom tenders</title>'
+            '<entry><title>Mid-term review</title><link rel="alternate" href="https://example.com/a"/>'
+            f'<summary>Atom summary</summary><updated>{days_ago(1).isoformat()}</updated></entry>'
+            '</feed>'
+        ).encode()
+
+    def _fetch(self, mock_get_client, body, config):
+        response = mock_get_client.return_value.get.return_value
+        response.status_code = 200
+        response.content = body
+        response.headers = {'Content-Type': 'application/rss+xml'}
+        response.url = self.FEED_URL
+        stats = {}
+        entries = fetch_feed_entries(self.FEED_URL, dict(config, max_age_days=30), feed_stats=stats)
+        return entries, stats
+
+    @pytest.mark.parametrize('body', ['_rss', '_atom'])
+    @patch('collect_rfps.get_http_client')
+    def test_fast_path_matches_feedparser_entries(self, mock_get_client, body):
+        document = getattr(self, body)()
+
+        expected, expected_stats = self._fetch(mock_get_client, document, {})
+        entries, stats = self._fetch(mock_get_client, document, {'feed_parser': 'fast'})
+
+        assert entries == expected
+        assert (expected_stats['parser'], stats['parser']) == ('feedparser', 'fast')
+
+    @pytest.mark.parametrize('document', [
+        b'<rss><channel><item><title>A &nbsp; B</title><link>https://example.com/1</link></item>',
+        b'<html><body><p>Not a feed</p></body></html>',
+    ])
+    def test_malformed_or_non_feed_documents_raise(self, document):
+        import xml.etree.ElementTree as ElementTree
+        with pytest.raises(ElementTree.ParseError):
+            parse_feed_document_fast(document)
+
+    @patch('collect_rfps.get_http_client')
+    def test_malformed_feed_falls_back_to_feedparser(self, mock_get_client):
+        published = days_ago(1).strftime('%a, %d %b %Y %H:%M:%S GMT')
+        body = (
+            '<rss><channel><item><title>A &nbsp; B</title><link>https://example.com/1</link>'
+            f'<pubDate>{published}</pubDate></item></channel></rss>'
+        ).encode()
+
+        entries, stats = self._fetch(mock_get_client, body, {'feed_parser': 'fast'})
+
+        assert [entry['link'] for entry in entries] == ['https://example.com/1']
+        assert stats['parser'] == 'feedparser'
+        assert 'fast_parser_fallback' in stats
+
+    @patch('collect_rfps.get_http_client')
+    def test_compare_records_speedup_and_parser_counts(self, mock_get_client):
+        response = mock_get_client.return_value.get.return_value
+        response.status_code = 200
+        response.content = make_rss()
+        response.headers = {}
+        response.url = self.FEED_URL
+        diagnostics = {}
+
+        fetch_and_parse_feeds(
+            [self.FEED_URL],
+            {'max_age_days': 30, 'feed_parser': 'fast', 'feed_parser_compare': True},
+            diagnostics=diagnostics,
+        )
+
+        assert diagnostics['feed_parsers'] == {'fast': 1}
+        assert diagnostics['feeds'][self.FEED_URL]['parse_speedup'] > 0
+        assert diagnostics['fast_parser_speedup'] > 0
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests for the local mock feed server used for offline load testing.
+"""
+
+import pytest
+from unittest.mock import patch
+import sys
+import os
+
+# Add scripts directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from collect_rfps import (
+    configure_http_client,
+    fetch_and_parse_feeds,
+    fetch_ungm_fallback_entries,
+)
+from mock_feed_server import start_mock_feed_server
+
+
+@pytest.fixture
+def mock_server():
+    servers = []
+
+    def start(**options):
+        server = start_mock_feed_server(options)
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
+    configure_http_client({})
+
+
+class TestMockFeedServer:
+    """Tests for serving synthetic feeds and UNGM pages."""
+
+    def test_serves_rss_and_atom_feeds(self, mock_server):
+        server = mock_server(feeds=2, entries_per_feed=5, entry_interval_hours=1)
+        configure_http_client({})
+        diagnostics = {}
+
+        entries = fetch_and_parse_feeds(
+            server.feed_urls,
+            {'max_age_days': 30, 'feed_prioritization': False},
+            feed_cache={'feeds': {}},
+            diagnostics=diagnostics,
+        )
+
+        assert len(entries) == 10
+        assert {entry['source'] for entry in entries} == set(server.feed_urls)
+        assert server.stats['feeds'] == 2
+
+    def test_etag_revalidation_returns_not_modified(self, mock_server):
+        server = mock_server(feeds=1, entries_per_feed=3)
+        configure_http_client({})
+        feed_cache = {'feeds': {}}
+        config = {'max_age_days': 30, 'feed_prioritization': False}
+
+        fetch_and_parse_feeds(server.feed_urls, config, feed_cache=feed_cache)
+        entries = fetch_and_parse_feeds(server.feed_urls, config, feed_cache=feed_cache)
+
+        assert len(entries) == 3
+        assert server.stats['not_modified'] == 1
+
+    def test_error_injection_fails_feeds(self, mock_server):
+        server = mock_server(feeds=2, error_rate=1.0)
+        configure_http_client({})
+        diagnostics = {}
+
+        entries = fetch_and_parse_feeds(
+            server.feed_urls,
+            {'feed_retries': 0, 'feed_prioritization': False},
+            feed_cache={'feeds': {}},
+            diagnostics=diagnostics,
+        )
+
+        assert entries == []
+        assert server.stats['errors'] == 2
+
+    def test_stalled_responses_time_out(self, mock_server):
+        server = mock_server(feeds=1, timeout_rate=1.0, stall_seconds=1.0)
+        configure_http_client({'http_timeout': 0.2})
+
+        entries = fetch_and_parse_feeds(
+            server.feed_urls,
+            {'feed_retries': 0, 'feed_prioritization': False},
+            feed_cache={'feeds': {}},
+        )
+
+        assert entries == []
+        assert server.stats['stalled'] == 1
+
+    def test_ungm_fallback_against_mock_pages(self, mock_server):
+        server = mock_server(ungm_notices=20, entry_interval_hours=1)
+        configure_http_client({})
+        config = {
+            'max_age_days': 30,
+            'ungm_search_pages': 2,
+            'ungm_search_page_size': 5,
+        }
+
+        with patch('collect_rfps.UNGM_NOTICE_ROOT', server.ungm_notice_root):
+            entries = fetch_ungm_fallback_entries(server.ungm_notice_root, config)
+
+        assert len(entries) == 10
+        assert entries[0]['link'] == f"{server.ungm_notice_root}/20"
+        assert 'Evaluation consultancy notice 20' in entries[0]['title']
+        # Two result pages; the unfiltered savings probe is opt-in.
+        assert server.stats['ungm_searches'] == 2
@@ -1,7 +1,12 @@
 """Tests for score_item function."""
 import unittest
 from datetime import datetime, timezone, timedelta
-from src.scoring.score_item import score_item, apply_source_weighting
+from src.scoring.score_item import (
+    score_item,
+    apply_source_weighting,
+    build_term_scanner,
+    get_matched_region_groups,
+)
 
 
 class TestApplySourceWeighting(unittest.TestCase):
@@ -236,6 +241,18 @@ class TestScoreItem(unittest.TestCase):
         self.assertGreater(score1, score2)
         self.assertEqual(item1.get("matched_regions"), ["SAR"])
     
+    def test_term_scanner_compiled_once(self):
+        """Test one scanner finds keyword and region hits and is reused across items."""
+        regions = ("South Asia (SAR)", "Sub-Saharan Africa (SSA)")
+
+        scanner = build_term_scanner(("software",), regions)
+        hits = scanner.scan("Software work in Pakistan and the Sahara; more software")
+
+        self.assertIs(build_term_scanner(("software",), regions), scanner)
+        self.assertEqual(hits.names("region"), {"SAR", "SSA"})
+        self.assertEqual(hits.positions[("keyword", "software")], [0, 47])
+        self.assertEqual(get_matched_region_groups("Sarajevo office", list(regions)), set())
+
     def test_custom_weights(self):
         """Test with custom weight configuration."""
         config = dict(self.base_config)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests for the synthetic RFP corpus generator.
+"""
+
+import feedparser
+import sys
+import os
+
+# Add scripts directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from collect_rfps import deduplicate_entries, extract_budget, filter_entries
+from synthetic_corpus import (
+    generate_entries,
+    render_atom_document,
+    render_rss_document,
+)
+
+
+class TestSyntheticCorpus:
+    """Tests for generated entries and documents."""
+
+    def test_generation_is_deterministic(self):
+        first = generate_entries(200, seed=7)
+        second = generate_entries(200, seed=7)
+
+        assert [entry['link'] for entry in first] == [entry['link'] for entry in second]
+        assert [entry['description'] for entry in first] == [entry['description'] for entry in second]
+
+    def test_duplicate_rate_controls_unique_links(self):
+        entries = generate_entries(2000, seed=1, duplicate_rate=0.25)
+
+        unique = deduplicate_entries(entries)
+
+        assert len(entries) == 2000
+        assert 0.7 < len(unique) / len(entries) < 0.8
+
+    def test_no_duplicates_by_default(self):
+        entries = generate_entries(500, seed=2)
+
+        assert len(deduplicate_entries(entries)) == 500
+
+    def test_budget_formats_are_extractable(self):
+        entries = generate_entries(1000, seed=3, budget_rate=1.0, html_noise_rate=0.0)
+
+        budgets = [extract_budget(entry['description']) for entry in entries]
+
+        assert all(budget and budget > 0 for budget in budgets)
+
+    def test_entries_pass_through_filtering(self):
+        config = {'max_age_days': 30, 'keywords': ['WASH'], 'regions': ['South Asia (SAR)', 'Sub-Saharan Africa (SSA)']}
+        entries = generate_entries(1000, config, seed=4)
+
+        filtered = filter_entries(entries, config, diagnostics={})
+
+        assert 0 < len(filtered) < len(entries)
+        assert any('WASH' in entry['title'] for entry in entries)
+
+    def test_rendered_documents_parse(self):
+        entries = generate_entries(20, seed=5, interval_hours=2)
+
+        rss = feedparser.parse(render_rss_document(entries))
+        atom = feedparser.parse(render_atom_document(entries))
+
+        assert [item.link for item in rss.entries] == [entry['link'] for entry in entries]
+        assert [item.link for item in atom.entries] == [entry['link'] for entry in entries]
@@ -0,0 +1,59 @@
+"""Tests for the Aho-Corasick term scanner."""
+import re
+import unittest
+
+from src.scoring.term_scanner import TermScanner
+
+
+class TestTermScanner(unittest.TestCase):
+    """Tests for TermScanner."""
+
+    def test_finds_overlapping_and_nested_patterns(self):
+        """Test every occurrence is reported, including patterns inside others."""
+        scanner = TermScanner({
+            "he": [("keyword", "he", False)],
+            "she": [("keyword", "she", False)],
+            "hers": [("keyword", "hers", False)],
+            "his": [("keyword", "his", False)],
+        })
+
+        hits = scanner.scan("USHERS and HIS")
+
+        self.assertEqual(hits.positions[("keyword", "she")], [1])
+        self.assertEqual(hits.positions[("keyword", "he")], [2])
+        self.assertEqual(hits.positions[("keyword", "hers")], [2])
+        self.assertEqual(hits.positions[("keyword", "his")], [11])
+
+    def test_word_bounded_targets(self):
+        """Test word-bounded targets ignore matches inside words."""
+        scanner = TermScanner({
+            "india": [("region", "SAR", True), ("keyword", "india", False)],
+        })
+
+        hits = scanner.scan("Indiana, India")
+
+        self.assertEqual(hits.positions[("region", "SAR")], [9])
+        self.assertEqual(hits.count("keyword", "india"), 2)
+
+    def test_matches_regex_search_for_many_patterns(self):
+        """Test hits agree with one regex search per pattern."""
+        patterns = ["water", "sanitation", "health", "south asia", "asia", "wash", "ash", "at"]
+        scanner = TermScanner({pattern: [("term", pattern, True)] for pattern in patterns})
+        text = "Water, sanitation and hygiene (WASH) in South Asia; health at scale, ashore."
+
+        hits = scanner.scan(text)
+
+        for pattern in patterns:
+            expected = [m.start() for m in re.finditer(rf"(?=\b{re.escape(pattern)}\b)", text.lower())]
+            self.assertEqual(hits.positions.get(("term", pattern), []), expected, pattern)
+
+    def test_empty_text(self):
+        """Test scanning empty text yields no hits."""
+        scanner = TermScanner({"a": [("keyword", "a", False)]})
+
+        self.assertEqual(scanner.scan("").positions, {})
+        self.assertEqual(scanner.scan(None).positions, {})
+
+
+if __name__ == "__main__":
+    unittest.main()